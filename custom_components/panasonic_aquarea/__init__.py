@@ -1,16 +1,25 @@
 """The Panasonic Aquarea integration."""
 from __future__ import annotations
 
+import ast
 import asyncio
 import logging
-import re
+from collections.abc import Sequence
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
+
+try:
+    from homeassistant.components.logbook import async_log_entry
+except ImportError:  # Older Home Assistant versions only offer the logbook.log service
+    async_log_entry = None
 
 from aioaquarea import Client, AquareaEnvironment
 from aioaquarea.errors import ClientError
@@ -18,6 +27,12 @@ from aioaquarea.errors import ClientError
 from .const import (
     DOMAIN, 
     UPDATE_INTERVAL,
+    DEVICE_INFO_UPDATE_INTERVAL,
+    POST_ACTION_POLL_DELAYS,
+    REQUEST_REFRESH_COOLDOWN,
+    LOGBOOK_FLUSH_DELAY,
+    ACTIVITY_QUIET_PERIOD,
+    ACTIVITY_REPEAT_WINDOW,
     SERVICE_SET_ECO_MODE,
     SERVICE_SET_COMFORT_MODE,
     SERVICE_SET_QUIET_MODE,
@@ -32,6 +47,12 @@ _LOGGER = logging.getLogger(__name__)
 # Global storage for captured JSON responses
 _captured_json_responses = {}
 
+# Activity entry for a change, filled with the entity prefix, action and values
+_ACTIVITY_CHANGE_MESSAGE = "%s%s: %s → %s"
+
+# Log line prefix aioaquarea uses for raw device responses
+_RAW_RESPONSE_PREFIX = "Raw JSON response for device "
+
 class AquareaLogCapture(logging.Handler):
     """Custom log handler to capture JSON responses from aioaquarea logs."""
     
@@ -40,20 +61,23 @@ class AquareaLogCapture(logging.Handler):
         try:
             message = record.getMessage()
             # Look for the pattern "Raw JSON response for device <device_id>: <json_data>"
-            if "Raw JSON response for device" in message:
-                # Extract device ID and JSON data
-                match = re.search(r"Raw JSON response for device ([A-Z0-9]+): ({.+})", message)
-                if match:
-                    device_id = match.group(1)
-                    json_str = match.group(2)
-                    try:
-                        # Parse the JSON string
-                        import ast
-                        json_data = ast.literal_eval(json_str)
-                        _captured_json_responses[device_id] = json_data
-                        _LOGGER.debug("Captured JSON response for device %s", device_id)
-                    except Exception as e:
-                        _LOGGER.debug("Failed to parse captured JSON for device %s: %s", device_id, e)
+            start = message.find(_RAW_RESPONSE_PREFIX)
+            if start == -1:
+                return
+            # Split off the device ID and the payload without a regex
+            device_id, _, json_str = message[start + len(_RAW_RESPONSE_PREFIX):].partition(": ")
+            if not device_id.isalnum() or not json_str.startswith("{"):
+                return
+            try:
+                # Real JSON goes through orjson; aioaquarea logs a Python dict repr
+                if json_str.startswith('{"'):
+                    json_data = json_loads(json_str)
+                else:
+                    json_data = ast.literal_eval(json_str)
+                _captured_json_responses[device_id] = json_data
+                _LOGGER.debug("Captured JSON response for device %s", device_id)
+            except Exception as e:
+                _LOGGER.debug("Failed to parse captured JSON for device %s: %s", device_id, e)
         except Exception as e:
             # Don't let handler errors break the logging system
             pass
@@ -100,19 +124,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await _async_register_services(hass, coordinator)
     
     # Register activity feed integration
-    _register_activity_feed(hass)
+    _register_activity_feed(hass, entry, coordinator)
 
     _LOGGER.info("Panasonic Aquarea integration setup completed successfully")
     return True
 
 
-def _register_activity_feed(hass: HomeAssistant) -> None:
+def _register_activity_feed(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: AquareaDataUpdateCoordinator
+) -> None:
     """Register activity feed integration for Panasonic Aquarea events."""
     
+    @callback
     def handle_aquarea_action(event):
         """Handle Panasonic Aquarea action events for activity feed."""
         try:
             data = event.data
+            # Every config entry listens; only log this entry's devices
+            if data.get("device_id") not in coordinator.data:
+                return
             
             # Create a user-friendly message for the activity feed
             device_type = data.get("device_type", "device")
@@ -120,6 +150,9 @@ def _register_activity_feed(hass: HomeAssistant) -> None:
             old_value = data.get("old_value")
             new_value = data.get("new_value")
             
+            if _activity_unchanged(old_value, new_value):
+                return
+            
             # Build activity message
             if device_type == "water_heater":
                 if "temperature" in action:
@@ -166,34 +199,175 @@ def _register_activity_feed(hass: HomeAssistant) -> None:
                         # Log the activity with appropriate level
             _LOGGER.info("Activity: %s", message)
             
-            # Use logbook service to create proper activity entries (thread-safe)
-            try:
-                # Use hass.add_job for proper async handling
-                hass.add_job(
-                    hass.services.async_call,
-                    "logbook",
-                    "log", 
-                    {
-                        "name": "Panasonic Aquarea",
-                        "message": message,
-                        "entity_id": data.get("entity_id"),
-                    }
-                )
-                
-            except Exception as e:
-                _LOGGER.debug("Failed to fire logbook event: %s", e)
+            # The handler runs on the event loop, so the entry can be queued directly
+            coordinator.activity_log.async_log("Panasonic Aquarea", message, data.get("entity_id"))
             
         except Exception as err:
             _LOGGER.debug("Failed to handle activity event: %s", err)
     
-    # Register the event listener
-    hass.bus.async_listen("panasonic_aquarea_action", handle_aquarea_action)
+    # Register the event listener; it goes away with the config entry
+    entry.async_on_unload(
+        hass.bus.async_listen("panasonic_aquarea_action", handle_aquarea_action)
+    )
+
+
+def _activity_unchanged(old_value: Any, new_value: Any) -> bool:
+    """Return whether a change is a no-op that is not worth an activity entry.
+
+    Re-issued commands report the old value again, and sensors report the
+    same value as both str and int, so the values are compared as text.
+    """
+    return old_value is not None and str(old_value) == str(new_value)
+
+
+class AquareaActivityLog:
+    """Queue of activity entries for the logbook, kept per config entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        # Activity entries waiting to be written to the logbook
+        self._pending: list[dict[str, Any]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Last activity message and loop time per entity, used to drop repeats
+        self._last_activity: dict[str | None, tuple[str, float]] = {}
+
+    @callback
+    def async_log(self, name: str, message: str, entity_id: str | None) -> None:
+        """Queue an activity entry for the logbook.
+
+        Entries queued within LOGBOOK_FLUSH_DELAY of each other are written
+        together, so a burst of setter calls costs a single scheduled task.
+        An entry repeating the entity's previous message within
+        ACTIVITY_REPEAT_WINDOW is dropped.
+        """
+        now = self._hass.loop.time()
+        last = self._last_activity.get(entity_id)
+        if last is not None and last[0] == message and now - last[1] < ACTIVITY_REPEAT_WINDOW:
+            return
+        self._last_activity[entity_id] = (message, now)
+        
+        self._pending.append({
+            "name": name,
+            "message": message,
+            "entity_id": entity_id,
+        })
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(
+                LOGBOOK_FLUSH_DELAY, self._flush
+            )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Write the queued entries now and forget the per-entity history."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush()
+        self._last_activity.clear()
+
+    @callback
+    def _flush(self) -> None:
+        """Write the queued activity entries to the logbook."""
+        hass = self._hass
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        if async_log_entry is None:
+            hass.async_create_task(_async_write_logbook_entries(hass, batch))
+            return
+        
+        # Log directly, skipping the service registry and schema validation
+        for entry in batch:
+            try:
+                async_log_entry(hass, entry["name"], entry["message"], DOMAIN, entry["entity_id"])
+            except Exception as err:
+                _LOGGER.debug("Failed to write logbook entry: %s", err)
+
+
+class AquareaActivityMixin:
+    """State change logging for entities that write their own activity entries.
+
+    The entity sets ``_logbook_name`` and ``_msg_prefix`` and initializes
+    ``_pending_log`` and ``_log_timer``; it must come before CoordinatorEntity
+    in the bases so its removal hook runs first.
+    """
+
+    _logbook_name: str
+    _msg_prefix: str
+
+    def _log_state_change(self, action: str, old_value: Any = None, new_value: Any = None) -> None:
+        """Log a state change for the Activity widget once changes settle.
+
+        Changes to the same action within ACTIVITY_QUIET_PERIOD, such as a
+        slider drag, are logged as one entry from the first old value to
+        the last new value.
+        """
+        if not self.hass:
+            return
+        pending = self._pending_log.get(action)
+        if pending is not None:
+            old_value = pending[0]
+        self._pending_log[action] = (old_value, new_value)
+        if self._log_timer is not None:
+            self._log_timer.cancel()
+        self._log_timer = self.hass.loop.call_later(
+            ACTIVITY_QUIET_PERIOD, self._flush_state_changes
+        )
+
+    @callback
+    def _flush_state_changes(self) -> None:
+        """Log the state changes collected during the quiet period."""
+        self._log_timer = None
+        pending, self._pending_log = self._pending_log, {}
+        for action, (old_value, new_value) in pending.items():
+            self._write_state_change(action, old_value, new_value)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Log any collected state changes before the entity goes away."""
+        if self._log_timer is not None:
+            self._log_timer.cancel()
+            self._flush_state_changes()
+        await super().async_will_remove_from_hass()
+
+    def _write_state_change(self, action: str, old_value: Any = None, new_value: Any = None) -> None:
+        """Write one state change to the Activity widget log."""
+        if _activity_unchanged(old_value, new_value):
+            return
+        
+        try:
+            if old_value is not None and new_value is not None:
+                message = _ACTIVITY_CHANGE_MESSAGE % (self._msg_prefix, action, old_value, new_value)
+            else:
+                message = self._msg_prefix + action
+            
+            _LOGGER.debug("%s for device %s", message, self._device_id)
+            
+            # Queue a logbook entry; bursts are written together
+            if self.hass:
+                self.coordinator.activity_log.async_log(self._logbook_name, message, self.entity_id)
+        except Exception as err:
+            _LOGGER.debug("Failed to log state change: %s", err)
+
+
+async def _async_write_logbook_entries(hass: HomeAssistant, batch: list[dict[str, Any]]) -> None:
+    """Write a batch of activity entries through the logbook.log service."""
+    for entry in batch:
+        try:
+            await hass.services.async_call("logbook", "log", entry)
+        except Exception as err:
+            _LOGGER.debug("Failed to write logbook entry: %s", err)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # The coordinator has no config entry, so Home Assistant will not
+        # shut it down; cancel its pending post-action polls and write out
+        # its queued activity entries here
+        await coordinator.async_shutdown()
 
     # Unregister services
     hass.services.async_remove(DOMAIN, SERVICE_SET_ECO_MODE)
@@ -359,6 +533,51 @@ async def _async_register_services(hass: HomeAssistant, coordinator: AquareaData
     hass.services.async_register(DOMAIN, SERVICE_SET_HOLIDAY_MODE, async_set_holiday_mode)
 
 
+def _resolve_device_name(device_info, raw_data: dict | None) -> str:
+    """Return the display name for a device."""
+    if device_info and hasattr(device_info, 'name'):
+        return device_info.name
+    if raw_data and 'a2wName' in raw_data:
+        return raw_data['a2wName']
+    return "Unknown Device"
+
+
+def _build_device_info(
+    coordinator: AquareaDataUpdateCoordinator, device_id: str
+) -> dict[str, Any]:
+    """Return the device registry info shared by all entities of a device.
+
+    The name is the one the coordinator resolved for the device on refresh.
+    """
+    return {
+        "identifiers": {(DOMAIN, device_id)},
+        "name": coordinator.data.get(device_id, {}).get("resolved_name", "Unknown Device"),
+        "manufacturer": "Panasonic",
+        "model": "Aquarea Heat Pump",
+    }
+
+
+def _resolve_has_tank(device_info, raw_data: dict | None) -> bool:
+    """Return whether a device has a DHW tank."""
+    # Trust the device info flag when the library provides it
+    has_tank = getattr(device_info, 'has_tank', None)
+    if has_tank is not None:
+        return bool(has_tank)
+    # If tank status exists in raw data, assume it has a tank
+    return bool(raw_data) and 'tankStatus' in (raw_data.get('status') or {})
+
+
+def _device_entry_unchanged(previous: dict, current: dict) -> bool:
+    """Return whether a refreshed device entry carries the same data as before.
+
+    The device object can be recreated on every poll and only compares
+    by identity, so the comparison is made on the data it was built from.
+    """
+    return all(
+        previous.get(key) == current[key] for key in ("info", "status", "raw_data")
+    )
+
+
 def _extract_device_id_from_entity_id(entity_id: str) -> str | None:
     """Extract device ID from entity ID."""
     # Assumes entity_id format like "climate.devicename_zone_1" 
@@ -383,18 +602,129 @@ class AquareaDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.client = client
         self._latest_json_data = {}  # Store the latest JSON data we can extract
+        self._post_action_poll_handles: list[asyncio.TimerHandle] = []
+        self._post_action_polls_until = 0.0
+        # Activity entries of this config entry's entities
+        self.activity_log = AquareaActivityLog(hass)
+        self._devices_info = None
+        self._devices_info_expires = 0.0
+        # Devices whose object structure has already been logged
+        self._described_devices: set[str] = set()
+        # Device ids per entity group, fixed after the first refresh
+        self.entity_manifest: dict[str, tuple[str, ...]] = {"devices": (), "tank": ()}
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Only notify entities when a poll actually changed the data
+            always_update=False,
+            # Collapse bursts of control actions into one refresh and give
+            # the device a moment to apply the change before reading it back
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
+    def schedule_post_action_polls(
+        self, delays: Sequence[float] = POST_ACTION_POLL_DELAYS
+    ) -> None:
+        """Poll faster for a short while after a control action.
+
+        The device takes a few seconds to commit a change, so a burst of
+        refreshes at increasing delays picks up the real state sooner than
+        waiting for the regular update interval. A burst that is still
+        running is not rescheduled.
+        """
+        if not delays:
+            return
+        loop = self.hass.loop
+        now = loop.time()
+        if now < self._post_action_polls_until:
+            _LOGGER.debug("Post-action polls already scheduled, skipping")
+            return
+
+        self._post_action_polls_until = now + max(delays)
+        self._post_action_poll_handles = [
+            loop.call_later(
+                delay, lambda: self.hass.async_create_task(self.async_refresh())
+            )
+            for delay in delays
+        ]
+
+    async def async_after_action(self) -> None:
+        """Refresh after a control action the device accepted.
+
+        The debounced refresh gives the device time to apply the change, and
+        the post-action polls keep reading until it has committed it.
+        """
+        await self.async_request_refresh()
+        self.schedule_post_action_polls()
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh for the first time and record which devices get which entities."""
+        await super().async_config_entry_first_refresh()
+        self.entity_manifest = {
+            "devices": tuple(self.data),
+            "tank": tuple(
+                device_id
+                for device_id, device_data in self.data.items()
+                if device_data["has_tank"]
+            ),
+        }
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending post-action polls, flush activity and shut down the coordinator."""
+        for handle in self._post_action_poll_handles:
+            handle.cancel()
+        self._post_action_poll_handles = []
+        self.activity_log.async_shutdown()
+        await super().async_shutdown()
+
+    def _log_device_structure(self, device_info, device) -> None:
+        """Log the attributes of a device and its client objects."""
+        _LOGGER.info("=== Device Debug Info ===")
+        _LOGGER.info("Device info object: %s", device_info)
+        _LOGGER.info("Device info attributes: %s", dir(device_info))
+        _LOGGER.info("Device info vars: %s", vars(device_info) if hasattr(device_info, '__dict__') else "No __dict__")
+        
+        _LOGGER.info("Device object: %s", device)
+        _LOGGER.info("Device attributes: %s", dir(device))
+        _LOGGER.info("Device vars: %s", vars(device) if hasattr(device, '__dict__') else "No __dict__")
+        
+        # Check if there's a client or session object that might have the response
+        if hasattr(device, '_client'):
+            _LOGGER.info("Device has _client: %s", device._client)
+            _LOGGER.info("Device _client attrs: %s", dir(device._client))
+        if hasattr(device, 'client'):
+            _LOGGER.info("Device has client: %s", device.client)
+            _LOGGER.info("Device client attrs: %s", dir(device.client))
+        
+        _LOGGER.info("=== End Device Debug Info ===")
+        
+        # Log available attributes for debugging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            device_attrs = [attr for attr in dir(device) if not attr.startswith('__')]
+            _LOGGER.debug("Available device attributes for %s: %s", device_info.device_id, device_attrs)
+
+    async def _async_get_devices_info(self):
+        """Return the device list, fetching it again only once it has expired.
+
+        The list of devices and their metadata rarely changes, so it is kept
+        for DEVICE_INFO_UPDATE_INTERVAL while the device status is still
+        refreshed on every update.
+        """
+        now = self.hass.loop.time()
+        if self._devices_info is None or now >= self._devices_info_expires:
+            self._devices_info = await self.client.get_devices()
+            self._devices_info_expires = now + DEVICE_INFO_UPDATE_INTERVAL
+        return self._devices_info
+
     async def _async_update_data(self):
         """Update data via library."""
         try:
             # Get devices from aioaquarea client
-            devices_info = await self.client.get_devices()
+            devices_info = await self._async_get_devices_info()
             devices_data = {}
             
             for device_info in devices_info:
@@ -403,25 +733,12 @@ class AquareaDataUpdateCoordinator(DataUpdateCoordinator):
                     device = await self.client.get_device(device_info=device_info)
                     await device.refresh_data()
                     
-                    # Comprehensive debug logging to understand data structure
-                    _LOGGER.info("=== Device Debug Info ===")
-                    _LOGGER.info("Device info object: %s", device_info)
-                    _LOGGER.info("Device info attributes: %s", dir(device_info))
-                    _LOGGER.info("Device info vars: %s", vars(device_info) if hasattr(device_info, '__dict__') else "No __dict__")
-                    
-                    _LOGGER.info("Device object: %s", device)
-                    _LOGGER.info("Device attributes: %s", dir(device))
-                    _LOGGER.info("Device vars: %s", vars(device) if hasattr(device, '__dict__') else "No __dict__")
-                    
-                    # Check if there's a client or session object that might have the response
-                    if hasattr(device, '_client'):
-                        _LOGGER.info("Device has _client: %s", device._client)
-                        _LOGGER.info("Device _client attrs: %s", dir(device._client))
-                    if hasattr(device, 'client'):
-                        _LOGGER.info("Device has client: %s", device.client)
-                        _LOGGER.info("Device client attrs: %s", dir(device.client))
-                    
-                    _LOGGER.info("=== End Device Debug Info ===")
+                    # Comprehensive debug logging to understand data structure;
+                    # the objects' shape does not change between polls, so this
+                    # introspection runs once per device
+                    if device_info.device_id not in self._described_devices:
+                        self._described_devices.add(device_info.device_id)
+                        self._log_device_structure(device_info, device)
                     
                     # Get real data from aioaquarea device object
                     raw_data = None
@@ -470,10 +787,6 @@ class AquareaDataUpdateCoordinator(DataUpdateCoordinator):
                         '_api_response', 'api_response'
                     ]
                     
-                    # Log available attributes for debugging
-                    device_attrs = [attr for attr in dir(device) if not attr.startswith('__')]
-                    _LOGGER.debug("Available device attributes for %s: %s", device_info.device_id, device_attrs)
-                    
                     # Check device object
                     for attr in response_attrs:
                         if hasattr(device, attr):
@@ -872,10 +1185,19 @@ class AquareaDataUpdateCoordinator(DataUpdateCoordinator):
                         "device": device,
                         "status": device.status if hasattr(device, 'status') else None,
                         "raw_data": raw_data,
+                        # Metadata resolved once here instead of by every entity
+                        "resolved_name": _resolve_device_name(device_info, raw_data),
+                        "has_tank": _resolve_has_tank(device_info, raw_data),
                     }
                     
 
                     
+                    # Keep the previous entry for an idle device, so the
+                    # refreshed data compares equal and no state is written
+                    previous_entry = self.data.get(device_info.device_id) if self.data else None
+                    if previous_entry is not None and _device_entry_unchanged(previous_entry, device_entry):
+                        device_entry = previous_entry
+                    
                     devices_data[device_info.device_id] = device_entry
                     _LOGGER.info("Stored device data for %s with keys: %s", device_info.device_id, device_entry.keys())
                     
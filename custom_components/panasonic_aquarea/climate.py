@@ -13,14 +13,14 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from aioaquarea.data import UpdateOperationMode, OperationStatus
 
-from . import AquareaDataUpdateCoordinator
+from . import AquareaActivityMixin, AquareaDataUpdateCoordinator, _build_device_info
 from .const import (
     DOMAIN,
     MODE_QUIET,
@@ -43,6 +43,19 @@ OPERATION_MODE_TO_HVAC_MODE = {
 
 HVAC_MODE_TO_OPERATION_MODE = {v: k for k, v in OPERATION_MODE_TO_HVAC_MODE.items()}
 
+# Shared default for chained dict.get() lookups into the raw payload
+_EMPTY: dict[str, Any] = {}
+
+# Device setter and raw status flag for each special preset mode
+_PRESET_MODE_CONTROLS = {
+    MODE_QUIET: ("set_quiet_mode", "quietMode"),
+    MODE_POWERFUL: ("set_powerful_mode", "powerful"),
+    MODE_FORCE_HEATER: ("set_force_heater", "forceHeater"),
+    MODE_HOLIDAY: ("set_holiday_mode", "holidayMode"),
+    COMFORT_ECO: ("set_eco_mode", "ecoMode"),
+    COMFORT_COMFORT: ("set_comfort_mode", "comfortMode"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -66,53 +79,68 @@ async def async_setup_entry(
         _LOGGER.info("Raw data: %s", raw_data)
         _LOGGER.info("Manual data: %s", manual_data)
         
-        # Get zones from raw data first (most reliable with real data)
-        zones = []
-        if raw_data and 'status' in raw_data and 'zoneStatus' in raw_data['status']:
-            _LOGGER.info("Using zones from raw data: %s", raw_data['status']['zoneStatus'])
-            for zone_status in raw_data['status']['zoneStatus']:
-                # Create a simple zone object from raw data
-                zone_id = zone_status.get('zoneId', 1)
-                zone_name = zone_status.get('zoneName', f"Zone {zone_id}")
-                zones.append({
-                    'zone_id': zone_id,
-                    'name': zone_name
-                })
-        # Fallback to device_info if no raw data
-        elif device_info and hasattr(device_info, 'zones'):
-            _LOGGER.info("Found zones in device_info: %s", device_info.zones)
-            # Filter to only zone 1 to prevent zone 2 errors
-            zones = [zone for zone in device_info.zones if getattr(zone, 'zone_id', None) == 1]
-            _LOGGER.info("Filtered to zone 1 only: %s", zones)
-        # Use manual data as last resort
-        elif manual_data and 'zones' in manual_data:
-            _LOGGER.info("Using zones from manual data: %s", manual_data['zones'])
-            zones = manual_data['zones']
-        else:
-            _LOGGER.warning("No zone data found for device %s, creating default zone", device_id) 
-        
-        _LOGGER.info("Processed zones for device %s: %s", device_id, zones)
+        # Only zone 1 is supported, to prevent zone 2 errors
+        zones = _climate_zones(device_info, raw_data, manual_data)
+        if not zones:
+            _LOGGER.warning("No supported zone found for device %s", device_id)
         
-        for zone in zones:
-            zone_id = getattr(zone, 'zone_id', None) or zone.get('zone_id')
-            zone_name = getattr(zone, 'name', None) or zone.get('name')
-            _LOGGER.info("Creating climate entity for device %s, zone %s (%s)", device_id, zone_id, zone_name)
-            
-            # Only create entities for zone ID 1 to prevent zone 2 errors
-            if zone_id == 1 and zone_name:
-                entity = AquareaClimate(coordinator, device_id, zone_id, zone_name)
-                entities.append(entity)
-                _LOGGER.info("Added climate entity: %s", entity)
-            elif zone_id != 1:
-                _LOGGER.warning("Skipping zone %s for device %s - only zone 1 is supported", zone_id, device_id)
+        for zone_id, zone_name in zones:
+            entity = AquareaClimate(coordinator, device_id, zone_id, zone_name)
+            entities.append(entity)
+            _LOGGER.info("Added climate entity: %s", entity)
     
     _LOGGER.info("Adding %d climate entities: %s", len(entities), entities)
     async_add_entities(entities)
 
 
-class AquareaClimate(CoordinatorEntity, ClimateEntity):
+def _climate_zones(
+    device_info: Any, raw_data: dict[str, Any] | None, manual_data: dict[str, Any] | None
+) -> list[tuple[Any, str]]:
+    """Return the (zone id, zone name) pairs that get a climate entity.
+
+    Zones come from the raw data first (most reliable with real data), then
+    the device info, then the manual data. Only a named zone 1 is kept,
+    since requests for zone 2 fail.
+    """
+    status = (raw_data or _EMPTY).get('status') or _EMPTY
+    if 'zoneStatus' in status:
+        zones = [
+            (zone.get('zoneId', 1), zone.get('zoneName', f"Zone {zone.get('zoneId', 1)}"))
+            for zone in status['zoneStatus']
+        ]
+    elif device_info and hasattr(device_info, 'zones'):
+        zones = [
+            (getattr(zone, 'zone_id', None), getattr(zone, 'name', None))
+            for zone in device_info.zones
+        ]
+    elif manual_data and 'zones' in manual_data:
+        zones = [(zone.get('zone_id'), zone.get('name')) for zone in manual_data['zones']]
+    else:
+        zones = []
+    return [(zone_id, zone_name) for zone_id, zone_name in zones if zone_id == 1 and zone_name]
+
+
+class AquareaClimate(AquareaActivityMixin, CoordinatorEntity, ClimateEntity):
     """Representation of an Aquarea climate device."""
 
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+        | ClimateEntityFeature.PRESET_MODE
+    )
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_hvac_modes = list(HVAC_MODE_TO_OPERATION_MODE)
+    _attr_preset_modes = [
+        COMFORT_ECO,
+        COMFORT_NORMAL,
+        COMFORT_COMFORT,
+        MODE_QUIET,
+        MODE_POWERFUL,
+        MODE_FORCE_HEATER,
+        MODE_HOLIDAY,
+    ]
+
     def __init__(
         self,
         coordinator: AquareaDataUpdateCoordinator,
@@ -126,98 +154,21 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         self._zone_id = zone_id
         self._zone_name = zone_name
         
-        device_data = self.coordinator.data.get(device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        # Get device name
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
+        self._attr_device_info = _build_device_info(coordinator, device_id)
+        device_name = self._attr_device_info["name"]
         self._attr_name = f"{device_name} {zone_name}"
         self._attr_unique_id = f"{device_id}_zone_{zone_id}"
-
-    def _log_state_change(self, action: str, old_value: Any = None, new_value: Any = None) -> None:
-        """Log state changes for the Activity widget using logbook service."""
-        try:
-            # Create a detailed log message for the activity widget
-            if old_value is not None and new_value is not None:
-                message = f"Climate Zone {self._zone_id} {action}: {old_value} → {new_value}"
-                name = f"Panasonic Heat Pump Climate Zone {self._zone_id}"
-            else:
-                message = f"Climate Zone {self._zone_id} {action}"
-                name = f"Panasonic Heat Pump Climate Zone {self._zone_id}"
-            
-            # Log with INFO level 
-            _LOGGER.info("%s for device %s", message, self._device_id)
-            
-            # Use logbook service to create proper activity entries
-            if self.hass:
-                # Use hass.add_job for proper async handling
-                self.hass.add_job(
-                    self.hass.services.async_call,
-                    "logbook",
-                    "log", 
-                    {
-                        "name": name,
-                        "message": message,
-                        "entity_id": self.entity_id,
-                    }
-                )
-        except Exception as err:
-            _LOGGER.debug("Failed to log state change: %s", err)
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device_data = self.coordinator.data.get(self._device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
         
-        # Try to get device name from device_info first
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": device_name,
-            "manufacturer": "Panasonic",
-            "model": "Aquarea Heat Pump",
-        }
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Return the list of supported features."""
-        return (
-            ClimateEntityFeature.TARGET_TEMPERATURE 
-            | ClimateEntityFeature.TURN_ON 
-            | ClimateEntityFeature.TURN_OFF
-            | ClimateEntityFeature.PRESET_MODE
-        )
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return the list of available hvac operation modes."""
-        return list(HVAC_MODE_TO_OPERATION_MODE.keys())
-
-    @property
-    def preset_modes(self) -> list[str]:
-        """Return a list of available preset modes."""
-        return [
-            COMFORT_ECO,
-            COMFORT_NORMAL,
-            COMFORT_COMFORT,
-            MODE_QUIET,
-            MODE_POWERFUL,
-            MODE_FORCE_HEATER,
-            MODE_HOLIDAY,
-        ]
+        self._attr_extra_state_attributes = None
+        self._update_extra_state_attributes()
+        
+        # Activity entry text that only depends on the zone
+        self._logbook_name = f"Panasonic Heat Pump Climate Zone {zone_id}"
+        self._msg_prefix = f"Climate Zone {zone_id} "
+        
+        # Activity changes waiting for the quiet period, keyed by action
+        self._pending_log: dict[str, tuple[Any, Any]] = {}
+        self._log_timer: asyncio.TimerHandle | None = None
 
     @property
     def preset_mode(self) -> str | None:
@@ -226,11 +177,9 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         if not device_data:
             return None
             
-        raw_data = device_data.get("raw_data")
-        if not raw_data or "status" not in raw_data:
+        status = (device_data.get("raw_data") or _EMPTY).get("status")
+        if status is None:
             return None
-            
-        status = raw_data["status"]
         
         # Check for active special modes
         if status.get("holidayMode"):
@@ -248,11 +197,6 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         else:
             return COMFORT_NORMAL
 
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement used by the platform."""
-        return UnitOfTemperature.CELSIUS
-
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -264,30 +208,24 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
             return None
             
         _LOGGER.info("Device data keys: %s", device_data.keys())
-        device = device_data.get("device")
         
         # Try to get temperature from structured device.status first
-        if device and hasattr(device, 'status') and device.status:
-            _LOGGER.info("Device has status, checking zones...")
-            if hasattr(device.status, 'zones'):
-                _LOGGER.info("Device status has zones: %s", device.status.zones)
-                for zone in device.status.zones:
-                    if zone.zone_id == self._zone_id:
-                        temp = getattr(zone, 'temperature', None)
-                        _LOGGER.info("Found temperature in structured data: %s", temp)
-                        if temp is not None:
-                            return temp
-            else:
-                _LOGGER.info("Device status has no zones attribute")
+        zone = self._get_zone(device_data.get("device"))
+        if zone is not None:
+            temp = getattr(zone, 'temperature', None)
+            _LOGGER.info("Found temperature in structured data: %s", temp)
+            if temp is not None:
+                return temp
         else:
-            _LOGGER.info("Device has no status or device is None")
+            _LOGGER.info("Device has no structured status for zone %s", self._zone_id)
         
         # Try to get temperature from raw data as fallback
         raw_data = device_data.get("raw_data")
         _LOGGER.info("Raw data available: %s", raw_data is not None)
-        if raw_data and 'status' in raw_data and 'zoneStatus' in raw_data['status']:
-            _LOGGER.info("Found zoneStatus in raw data: %s", raw_data['status']['zoneStatus'])
-            for zone_status in raw_data['status']['zoneStatus']:
+        zone_statuses = ((raw_data or _EMPTY).get('status') or _EMPTY).get('zoneStatus')
+        if zone_statuses:
+            _LOGGER.info("Found zoneStatus in raw data: %s", zone_statuses)
+            for zone_status in zone_statuses:
                 if zone_status.get('zoneId') == self._zone_id:
                     temp_now = zone_status.get('temperatureNow')
                     _LOGGER.info("Found temperatureNow in raw data: %s", temp_now)
@@ -307,21 +245,16 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         if not device_data or not device_data.get("device"):
             return None
             
-        device = device_data["device"]
-        
         # Try to get target temperature from structured device.status first
-        if hasattr(device, 'status') and device.status:
-            if hasattr(device.status, 'zones'):
-                for zone in device.status.zones:
-                    if zone.zone_id == self._zone_id:
-                        target_temp = getattr(zone, 'target_temperature', None)
-                        if target_temp is not None:
-                            return target_temp
+        target_temp = getattr(self._get_zone(device_data["device"]), 'target_temperature', None)
+        if target_temp is not None:
+            return target_temp
         
         # Try to get target temperature from raw data as fallback
         raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data and 'zoneStatus' in raw_data['status']:
-            for zone_status in raw_data['status']['zoneStatus']:
+        zone_statuses = ((raw_data or _EMPTY).get('status') or _EMPTY).get('zoneStatus')
+        if zone_statuses:
+            for zone_status in zone_statuses:
                 if zone_status.get('zoneId') == self._zone_id:
                     # Calculate target temperature from current + offset
                     temp_now = zone_status.get('temperatureNow')
@@ -349,20 +282,28 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         if not device_data or not device_data.get("device"):
             return None
             
-        device = device_data["device"]
-        if hasattr(device, 'status') and device.status:
-            for zone in device.status.zones:
-                if zone.zone_id == self._zone_id:
-                    if hasattr(zone, 'operation_status'):
-                        if zone.operation_status == OperationStatus.ON:
-                            hvac_mode = self.hvac_mode
-                            if hvac_mode == HVACMode.HEAT:
-                                return HVACAction.HEATING
-                            elif hvac_mode == HVACMode.COOL:
-                                return HVACAction.COOLING
-                            else:
-                                return HVACAction.IDLE
-                    return HVACAction.OFF
+        zone = self._get_zone(device_data["device"])
+        if zone is None:
+            return None
+        if getattr(zone, 'operation_status', None) == OperationStatus.ON:
+            hvac_mode = self.hvac_mode
+            if hvac_mode == HVACMode.HEAT:
+                return HVACAction.HEATING
+            elif hvac_mode == HVACMode.COOL:
+                return HVACAction.COOLING
+            else:
+                return HVACAction.IDLE
+        return HVACAction.OFF
+
+    def _get_zone(self, device: Any) -> Any:
+        """Return this zone's structured status from the device, if any."""
+        try:
+            zones = device.status.zones
+        except AttributeError:
+            return None
+        for zone in zones or ():
+            if zone.zone_id == self._zone_id:
+                return zone
         return None
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -413,6 +354,7 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
                         break
             
             # Force immediate entity state update
+            self._update_extra_state_attributes()
             self.async_write_ha_state()
             _LOGGER.info("✅ UI updated immediately with HVAC mode %s", hvac_mode)
         else:
@@ -448,9 +390,7 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         
         if api_success:
             _LOGGER.info("✅ Real API call succeeded - waiting for device response")
-            # Wait for API response and refresh
-            await asyncio.sleep(1.0)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_after_action()
         else:
             _LOGGER.info("ℹ️  No real API available - using local simulation (UI already updated)")
             # Trigger refresh to ensure consistency across all entities
@@ -485,7 +425,9 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
                     self._zone_id, old_temperature, temperature, self._device_id)
         
         # Log the temperature change for activity widget
-        self._log_state_change("temperature changed", f"{old_temperature}°C" if old_temperature else "unknown", f"{temperature}°C")
+        # Compare the raw values before formatting them for the activity widget
+        if old_temperature != temperature:
+            self._log_state_change("temperature changed", f"{old_temperature}°C" if old_temperature else "unknown", f"{temperature}°C")
 
         # === IMMEDIATE UPDATE FOR RESPONSIVE UI ===
         raw_data = device_data.get("raw_data")
@@ -573,9 +515,7 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         
         if api_success:
             _LOGGER.info("✅ Real API call succeeded - waiting for device response")
-            # Wait for API response and refresh
-            await asyncio.sleep(1.0)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_after_action()
         else:
             _LOGGER.info("ℹ️  No real API available - using local simulation (UI already updated)")
             # Trigger refresh to ensure consistency across all entities
@@ -594,53 +534,51 @@ class AquareaClimate(CoordinatorEntity, ClimateEntity):
         self._log_state_change("preset mode changed", old_preset_mode, preset_mode)
 
         device = device_data["device"]
+        status = (device_data.get("raw_data") or _EMPTY).get("status")
 
         try:
-            # Reset all modes first
-            if hasattr(device, 'set_quiet_mode'):
-                await device.set_quiet_mode(False)
-            if hasattr(device, 'set_powerful_mode'):
-                await device.set_powerful_mode(False)
-            if hasattr(device, 'set_force_heater'):
-                await device.set_force_heater(False)
-            if hasattr(device, 'set_holiday_mode'):
-                await device.set_holiday_mode(False)
-            if hasattr(device, 'set_eco_mode'):
-                await device.set_eco_mode(False)
-            if hasattr(device, 'set_comfort_mode'):
-                await device.set_comfort_mode(False)
+            # Reset the other modes that are on (all of them if the status is
+            # unknown), one at a time so the device sees them in order
+            for mode, (method_name, flag) in _PRESET_MODE_CONTROLS.items():
+                if (
+                    mode != preset_mode
+                    and (status is None or status.get(flag))
+                    and hasattr(device, method_name)
+                ):
+                    await getattr(device, method_name)(False)
 
             # Set the requested mode
-            if preset_mode == MODE_QUIET and hasattr(device, 'set_quiet_mode'):
-                await device.set_quiet_mode(True)
-            elif preset_mode == MODE_POWERFUL and hasattr(device, 'set_powerful_mode'):
-                await device.set_powerful_mode(True)
-            elif preset_mode == MODE_FORCE_HEATER and hasattr(device, 'set_force_heater'):
-                await device.set_force_heater(True)
-            elif preset_mode == MODE_HOLIDAY and hasattr(device, 'set_holiday_mode'):
-                await device.set_holiday_mode(True)
-            elif preset_mode == COMFORT_ECO and hasattr(device, 'set_eco_mode'):
-                await device.set_eco_mode(True)
-            elif preset_mode == COMFORT_COMFORT and hasattr(device, 'set_comfort_mode'):
-                await device.set_comfort_mode(True)
             # COMFORT_NORMAL is achieved by turning off all special modes (already done above)
+            control = _PRESET_MODE_CONTROLS.get(preset_mode)
+            if control and hasattr(device, control[0]):
+                await getattr(device, control[0])(True)
             
             await self.coordinator.async_request_refresh()
         except Exception as err:
             _LOGGER.error("Failed to set preset mode: %s", err)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes for Cloud Comfort app features."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_extra_state_attributes()
+        super()._handle_coordinator_update()
+
+    def _update_extra_state_attributes(self) -> None:
+        """Refresh the cached state attributes, keeping the old dict if unchanged."""
+        attributes = self._build_extra_state_attributes()
+        if attributes != self._attr_extra_state_attributes:
+            self._attr_extra_state_attributes = attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Build additional state attributes for Cloud Comfort app features."""
         device_data = self.coordinator.data.get(self._device_id)
         if not device_data:
             return None
             
-        raw_data = device_data.get("raw_data")
-        if not raw_data or "status" not in raw_data:
+        status = (device_data.get("raw_data") or _EMPTY).get("status")
+        if status is None:
             return None
             
-        status = raw_data["status"]
         attributes = {}
         
         # Cloud Comfort app specific attributes
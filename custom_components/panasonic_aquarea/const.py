@@ -7,6 +7,17 @@ CONF_DEVICE_DIRECT = "device_direct"
 
 # Update intervals
 UPDATE_INTERVAL = 30  # seconds
+DEVICE_INFO_UPDATE_INTERVAL = 900  # seconds between device list fetches
+POST_ACTION_POLL_DELAYS = (2, 5, 15)  # seconds after a control action
+REQUEST_REFRESH_COOLDOWN = 1.5  # seconds, coalesces bursts of setter calls
+LOGBOOK_FLUSH_DELAY = 0.2  # seconds, coalesces bursts of activity entries
+ACTIVITY_REPEAT_WINDOW = 30  # seconds, identical activity entries within it are dropped
+ACTIVITY_QUIET_PERIOD = 0.5  # seconds without changes before an entity logs its activity
+TEMPERATURE_SET_DEBOUNCE = 0.25  # seconds a new target must hold before it is sent
+API_CALL_TIMEOUT = 10  # seconds before a single control API call is abandoned
+API_RETRY_ATTEMPTS = 3  # tries per control API call on transient errors
+API_RETRY_BASE_DELAY = 0.2  # seconds, doubled after each failed try
+API_RETRY_MAX_DELAY = 2.0  # seconds, cap on the delay between tries
 
 # Device types
 DEVICE_TYPE_HEAT_PUMP = "heat_pump"
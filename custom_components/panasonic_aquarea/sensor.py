@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from bisect import bisect_right
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -16,11 +17,34 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from . import AquareaDataUpdateCoordinator
+from . import AquareaDataUpdateCoordinator, _build_device_info
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Estimated power draw per operation mode as (base watts, watts per pump
+# duty step), typical values for Aquarea heat pumps: standby when off,
+# 1.5-2.5kW heating, slightly less cooling; other modes use the default
+_POWER_BY_MODE = {0: (50, 0), 1: (1500, 500), 2: (1200, 400)}
+_POWER_DEFAULT = (800, 0)
+
+# Typical heating COP of modern heat pumps at these outdoor temperatures;
+# values in between are interpolated and clamped beyond either end
+_COP_CURVE_TEMPS = (-15, -10, -5, 0, 5, 10)
+_COP_CURVE_VALUES = (2.0, 2.5, 3.0, 3.5, 4.0, 4.5)
+
+
+def _interpolate_cop(outdoor_temp: float) -> float:
+    """Linearly interpolate the COP curve at an outdoor temperature."""
+    index = bisect_right(_COP_CURVE_TEMPS, outdoor_temp)
+    if index == 0:
+        return _COP_CURVE_VALUES[0]
+    if index == len(_COP_CURVE_TEMPS):
+        return _COP_CURVE_VALUES[-1]
+    low_temp, high_temp = _COP_CURVE_TEMPS[index - 1], _COP_CURVE_TEMPS[index]
+    low_cop, high_cop = _COP_CURVE_VALUES[index - 1], _COP_CURVE_VALUES[index]
+    return low_cop + (high_cop - low_cop) * (outdoor_temp - low_temp) / (high_temp - low_temp)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -122,25 +146,18 @@ async def async_setup_entry(
             AquareaDHWEnergyTodaySensor(coordinator, device_id),
             AquareaCOPSensor(coordinator, device_id),
         ])
-        
-        # Tank temperature sensor (if has tank)
-        has_tank = False
-        if device_info and hasattr(device_info, 'has_tank'):
-            has_tank = device_info.has_tank
-        elif raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            # If tank status exists in raw data, assume it has a tank
-            has_tank = True
-            
-        if has_tank:
-            entities.extend([
-                AquareaTankTemperatureSensor(coordinator, device_id),
-                AquareaTankOperationSensor(coordinator, device_id),
-                # Cloud Comfort tank sensors
-                AquareaTankEcoTemperatureSensor(coordinator, device_id),
-                AquareaTankComfortTemperatureSensor(coordinator, device_id),
-                AquareaLegionellaModeSensor(coordinator, device_id),
-                AquareaReheatModeSensor(coordinator, device_id),
-            ])
+    
+    # Tank sensors for devices with a tank
+    for device_id in coordinator.entity_manifest["tank"]:
+        entities.extend([
+            AquareaTankTemperatureSensor(coordinator, device_id),
+            AquareaTankOperationSensor(coordinator, device_id),
+            # Cloud Comfort tank sensors
+            AquareaTankEcoTemperatureSensor(coordinator, device_id),
+            AquareaTankComfortTemperatureSensor(coordinator, device_id),
+            AquareaLegionellaModeSensor(coordinator, device_id),
+            AquareaReheatModeSensor(coordinator, device_id),
+        ])
     
     async_add_entities(entities)
 
@@ -159,17 +176,8 @@ class AquareaSensorBase(CoordinatorEntity, SensorEntity):
         self._device_id = device_id
         self._sensor_type = sensor_type
         
-        device_data = self.coordinator.data.get(device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        # Get device name
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
+        self._attr_device_info = _build_device_info(coordinator, device_id)
+        device_name = self._attr_device_info["name"]
         self._attr_name = f"{device_name} {sensor_type}"
         self._attr_unique_id = f"{device_id}_{sensor_type.lower().replace(' ', '_')}"
         self._last_logged_value = None
@@ -241,27 +249,6 @@ class AquareaSensorBase(CoordinatorEntity, SensorEntity):
         except Exception as err:
             _LOGGER.debug("Failed to log sensor change: %s", err)
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device_data = self.coordinator.data.get(self._device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        # Try to get device name from device_info first
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": device_name,
-            "manufacturer": "Panasonic",
-            "model": "Aquarea Heat Pump",
-        }
-
 
 class AquareaTemperatureSensor(AquareaSensorBase):
     """Representation of a zone temperature sensor."""
@@ -1320,16 +1307,8 @@ class AquareaPowerConsumptionSensor(AquareaSensorBase):
             force_heater = raw_data['status'].get('forceHeater', 0)
             
             # Base power consumption estimates (typical values for Aquarea heat pumps)
-            base_power = 0
-            
-            if operation_mode == 0:  # Off
-                base_power = 50  # Standby power
-            elif operation_mode == 1:  # Heat mode
-                base_power = 1500 + (pump_duty * 500)  # 1.5-2.5kW typical for heating
-            elif operation_mode == 2:  # Cool mode
-                base_power = 1200 + (pump_duty * 400)  # Slightly less for cooling
-            else:
-                base_power = 800  # Other modes
+            mode_power, duty_power = _POWER_BY_MODE.get(operation_mode, _POWER_DEFAULT)
+            base_power = mode_power + pump_duty * duty_power
                 
             # Adjust for special modes
             if powerful == 1:
@@ -1609,23 +1588,10 @@ class AquareaCOPSensor(AquareaSensorBase):
             return None
             
         # Calculate COP based on outdoor temperature
-        # These are typical values for modern heat pumps
-        if outdoor_temp >= 10:
-            base_cop = 4.5
-        elif outdoor_temp >= 5:
-            base_cop = 4.0
-        elif outdoor_temp >= 0:
-            base_cop = 3.5
-        elif outdoor_temp >= -5:
-            base_cop = 3.0
-        elif outdoor_temp >= -10:
-            base_cop = 2.5
-        else:
-            base_cop = 2.0
+        base_cop = _interpolate_cop(outdoor_temp)
             
         # Adjust for powerful mode (less efficient)
         if powerful == 1:
             base_cop *= 0.85
             
-        return round(base_cop, 2)
-        return None
\ No newline at end of file
+        return round(base_cop, 2)
\ No newline at end of file
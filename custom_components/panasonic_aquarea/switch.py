@@ -1,7 +1,6 @@
 """Platform for switch integration - Cloud Comfort app controls."""
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -15,7 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from . import AquareaDataUpdateCoordinator
+from . import AquareaDataUpdateCoordinator, _build_device_info
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,7 +29,7 @@ async def async_setup_entry(
     coordinator: AquareaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
     entities = []
-    for device_id, device_data in coordinator.data.items():
+    for device_id in coordinator.entity_manifest["devices"]:
         # Add Cloud Comfort app control switches for each device
         entities.extend([
             AquareaEcoModeSwitch(coordinator, device_id),
@@ -41,24 +40,15 @@ async def async_setup_entry(
             AquareaHolidayModeSwitch(coordinator, device_id),
             AquareaScheduleEnabledSwitch(coordinator, device_id),
         ])
-        
-        # Add tank-specific switches if device has a tank
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        has_tank = False
-        if device_info and hasattr(device_info, 'has_tank'):
-            has_tank = device_info.has_tank
-        elif raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            has_tank = True
-            
-        if has_tank:
-            entities.extend([
-                AquareaForceDHWSwitch(coordinator, device_id),
-                AquareaDHWPrioritySwitch(coordinator, device_id),
-                AquareaLegionellaModeSwitch(coordinator, device_id),
-                AquareaReheatModeSwitch(coordinator, device_id),
-            ])
+    
+    # Add tank-specific switches for devices with a tank
+    for device_id in coordinator.entity_manifest["tank"]:
+        entities.extend([
+            AquareaForceDHWSwitch(coordinator, device_id),
+            AquareaDHWPrioritySwitch(coordinator, device_id),
+            AquareaLegionellaModeSwitch(coordinator, device_id),
+            AquareaReheatModeSwitch(coordinator, device_id),
+        ])
     
     async_add_entities(entities)
 
@@ -77,17 +67,8 @@ class AquareaSwitchBase(CoordinatorEntity, SwitchEntity):
         self._device_id = device_id
         self._switch_type = switch_type
         
-        device_data = self.coordinator.data.get(device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        # Get device name
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
+        self._attr_device_info = _build_device_info(coordinator, device_id)
+        device_name = self._attr_device_info["name"]
         self._attr_name = f"{device_name} {switch_type}"
         self._attr_unique_id = f"{device_id}_{switch_type.lower().replace(' ', '_')}"
 
@@ -121,26 +102,6 @@ class AquareaSwitchBase(CoordinatorEntity, SwitchEntity):
         except Exception as err:
             _LOGGER.debug("Failed to log state change: %s", err)
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device_data = self.coordinator.data.get(self._device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": device_name,
-            "manufacturer": "Panasonic",
-            "model": "Aquarea Heat Pump",
-        }
-
 
 class AquareaEcoModeSwitch(AquareaSwitchBase):
     """Eco mode switch from Cloud Comfort app."""
@@ -205,9 +166,7 @@ class AquareaEcoModeSwitch(AquareaSwitchBase):
                         break
         
         if success:
-            # Wait a moment for the change to propagate
-            await asyncio.sleep(0.5)
-            # Trigger coordinator refresh to get updated data
+            # Trigger a debounced coordinator refresh to get updated data
             await self.coordinator.async_request_refresh()
         else:
             # Fallback: Update local data structure for immediate feedback
@@ -259,9 +218,7 @@ class AquareaEcoModeSwitch(AquareaSwitchBase):
                         continue
         
         if success:
-            # Wait a moment for the change to propagate
-            await asyncio.sleep(0.5)
-            # Trigger coordinator refresh to get updated data
+            # Trigger a debounced coordinator refresh to get updated data
             await self.coordinator.async_request_refresh()
         else:
             # Fallback: Update local data structure for immediate feedback
@@ -3,26 +3,35 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
-
+import operator
+import random
+import sys
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any, Final, NamedTuple
+
+from aiohttp import ClientConnectionError
 from homeassistant.components.water_heater import (
     WaterHeaterEntity,
     WaterHeaterEntityFeature,
-    STATE_OFF,
-    STATE_ON,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import HomeAssistant, Event, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from aioaquarea.data import OperationStatus, UpdateOperationMode
+from aioaquarea.data import UpdateOperationMode
 
-from . import AquareaDataUpdateCoordinator
+from . import AquareaActivityMixin, AquareaDataUpdateCoordinator, _build_device_info
 from .const import (
     DOMAIN,
+    API_CALL_TIMEOUT,
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
+    TEMPERATURE_SET_DEBOUNCE,
     MODE_FORCE_DHW,
     COMFORT_ECO,
     COMFORT_NORMAL,
@@ -31,6 +40,87 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw payload keys, interned once and shared by every lookup below
+_K_STATUS: Final = sys.intern("status")
+_K_TANK_STATUS: Final = sys.intern("tankStatus")
+_K_HEAT_SET: Final = sys.intern("heatSet")
+_K_TEMPERATURE_NOW: Final = sys.intern("temperatureNow")
+_K_OPERATION_STATUS: Final = sys.intern("operationStatus")
+_K_FORCE_DHW: Final = sys.intern("forceDHW")
+_K_ECO_MODE: Final = sys.intern("ecoMode")
+_K_COMFORT_MODE: Final = sys.intern("comfortMode")
+_K_ECO_TEMP: Final = sys.intern("ecoTemp")
+_K_COMFORT_TEMP: Final = sys.intern("comfortTemp")
+_K_DHW_PRIORITY: Final = sys.intern("dhwPriority")
+_K_LEGIONELLA_MODE: Final = sys.intern("legionellaMode")
+_K_REHEAT_MODE: Final = sys.intern("reheatMode")
+
+# Structured tank accessor, resolved in C instead of chained getattr calls
+_get_tank_object = operator.attrgetter("status.tank")
+
+# Candidate (device, tank) API methods for turning the tank on/off, keyed by the flag
+_POWER_METHODS = {
+    True: (
+        ("set_dhw_operation", "set_tank_operation", "enable_tank", "turn_on_tank"),
+        ("set_operation", "turn_on", "enable"),
+    ),
+    False: (
+        ("set_dhw_operation", "set_tank_operation", "disable_tank", "turn_off_tank"),
+        ("set_operation", "turn_off", "disable"),
+    ),
+}
+
+# Activity widget (action, old value, new value) for turning on/off
+_POWER_STATES = {
+    True: ("turned on", "OFF", "ON"),
+    False: ("turned off", "ON", "OFF"),
+}
+
+# (state attribute, raw key) pairs for the extra state attributes
+_STATUS_FLAG_ATTRIBUTES = (
+    ("force_dhw", _K_FORCE_DHW),
+    ("eco_mode", _K_ECO_MODE),
+    ("comfort_mode", _K_COMFORT_MODE),
+    ("dhw_priority", _K_DHW_PRIORITY),
+)
+_TANK_VALUE_ATTRIBUTES = (
+    ("tank_operation_status", _K_OPERATION_STATUS),
+    ("eco_temperature", _K_ECO_TEMP),
+    ("comfort_temperature", _K_COMFORT_TEMP),
+)
+_TANK_FLAG_ATTRIBUTES = (
+    ("legionella_mode", _K_LEGIONELLA_MODE),
+    ("reheat_mode", _K_REHEAT_MODE),
+)
+
+# Operation modes exposed to Home Assistant, shared by every entity
+_OPERATION_LIST: Final[tuple[str, ...]] = (
+    COMFORT_ECO,
+    COMFORT_NORMAL,
+    COMFORT_COMFORT,
+    MODE_FORCE_DHW,
+)
+
+# Raw status flag set by each operation mode; normal mode clears them all
+_MODE_TO_FLAG = {
+    MODE_FORCE_DHW: _K_FORCE_DHW,
+    COMFORT_ECO: _K_ECO_MODE,
+    COMFORT_COMFORT: _K_COMFORT_MODE,
+}
+
+# (tank key, default) supplying the target temperature for each mode
+_MODE_TO_TEMP_KEY = {
+    COMFORT_ECO: (_K_ECO_TEMP, 55),
+    COMFORT_COMFORT: (_K_COMFORT_TEMP, 65),
+}
+
+# Raw status flags that select the current operation mode, by priority
+_MODE_FLAGS = (
+    (_K_FORCE_DHW, MODE_FORCE_DHW),
+    (_K_ECO_MODE, COMFORT_ECO),
+    (_K_COMFORT_MODE, COMFORT_COMFORT),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,30 +130,78 @@ async def async_setup_entry(
     """Set up the water heater platform."""
     coordinator: AquareaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    entities = []
-    for device_id, device_data in coordinator.data.items():
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        # Only create water heater entity if device has tank
-        has_tank = False
-        if device_info and hasattr(device_info, 'has_tank'):
-            has_tank = device_info.has_tank
-        elif raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            # If tank status exists in raw data, assume it has a tank
-            has_tank = True
-            
-        if has_tank:
-            entities.append(
-                AquareaWaterHeater(coordinator, device_id)
-            )
-    
-    async_add_entities(entities)
+    # Only create water heater entities for devices with a tank
+    async_add_entities(
+        AquareaWaterHeater(coordinator, device_id)
+        for device_id in coordinator.entity_manifest["tank"]
+    )
+
+
+def _get_tank_status(raw_data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the raw tank status dict, or None if the payload has none."""
+    try:
+        return raw_data[_K_STATUS][_K_TANK_STATUS]
+    except (KeyError, TypeError):
+        return None
+
+
+class _TankView(NamedTuple):
+    """Tank state derived once per coordinator refresh."""
+
+    current_temperature: float | None
+    target_temperature: float | None
+    current_operation: str | None
 
 
-class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
+_EMPTY_VIEW = _TankView(None, None, None)
+
+
+def _get_tank(device: Any) -> Any:
+    """Return the structured tank object of a device, if any."""
+    try:
+        return _get_tank_object(device)
+    except AttributeError:
+        return None
+
+
+async def _async_call_with_retry(method: Callable[..., Any], *args: Any) -> Any:
+    """Await a known-good API method, retrying timeouts and dropped connections.
+
+    Tries are spaced by an exponential backoff with jitter. Any other error,
+    such as the cloud rejecting the request, or the last transient one is
+    raised to the caller.
+    """
+    for attempt in range(API_RETRY_ATTEMPTS):
+        try:
+            async with asyncio.timeout(API_CALL_TIMEOUT):
+                return await method(*args)
+        except (ClientConnectionError, TimeoutError) as err:
+            if attempt == API_RETRY_ATTEMPTS - 1:
+                raise
+            delay = min(API_RETRY_MAX_DELAY, API_RETRY_BASE_DELAY * 2**attempt)
+            delay += random.uniform(0, API_RETRY_BASE_DELAY)
+            _LOGGER.debug("API call failed (%s), retrying in %.2fs", err, delay)
+            await asyncio.sleep(delay)
+
+
+class AquareaWaterHeater(AquareaActivityMixin, CoordinatorEntity, WaterHeaterEntity):
     """Representation of an Aquarea water heater."""
 
+    _attr_operation_list = _OPERATION_LIST
+    _attr_supported_features = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE
+        | WaterHeaterEntityFeature.ON_OFF
+        | WaterHeaterEntityFeature.OPERATION_MODE
+    )
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+
+    # Name and message prefix of the water heater's activity entries
+    _logbook_name = "Panasonic Heat Pump Water Heater"
+    _msg_prefix = "Water heater "
+
+    # Device methods that take just the tank target temperature
+    _TEMP_METHOD_NAMES = ("set_tank_target_temperature", "set_dhw_target_temperature")
+
     def __init__(
         self,
         coordinator: AquareaDataUpdateCoordinator,
@@ -72,154 +210,96 @@ class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         """Initialize the water heater."""
         super().__init__(coordinator)
         self._device_id = device_id
-        
-        device_data = self.coordinator.data.get(device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
-        
-        # Get device name
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
-        self._attr_name = f"{device_name} Water Heater"
+        self._attr_device_info = _build_device_info(coordinator, device_id)
+        self._attr_name = f"{self._attr_device_info['name']} Water Heater"
         self._attr_unique_id = f"{device_id}_water_heater"
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device_data = self.coordinator.data.get(self._device_id, {})
-        device_info = device_data.get("info")
-        raw_data = device_data.get("raw_data")
         
-        # Try to get device name from device_info first
-        device_name = "Unknown Device"
-        if device_info and hasattr(device_info, 'name'):
-            device_name = device_info.name
-        elif raw_data and 'a2wName' in raw_data:
-            device_name = raw_data['a2wName']
-            
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": device_name,
-            "manufacturer": "Panasonic",
-            "model": "Aquarea Heat Pump",
-        }
+        self._attr_extra_state_attributes = None
+        # Target set locally while no API method worked; wins over device data
+        self._pending_target_temperature: float | None = None
+        # API methods that worked before, keyed by action; cleared with the device
+        self._api_methods: dict[str, Callable[..., Any]] = {}
+        # Activity changes waiting for the quiet period, keyed by action
+        self._pending_log: dict[str, tuple[Any, Any]] = {}
+        self._log_timer: asyncio.TimerHandle | None = None
+        # Bumped by every target request; only the latest one is sent
+        self._send_sequence = 0
+        self._cached_device = None
+        self._resolve_device_data()
+        self._update_cached_state()
 
     @property
-    def supported_features(self) -> WaterHeaterEntityFeature:
-        """Return the list of supported features."""
-        return (
-            WaterHeaterEntityFeature.TARGET_TEMPERATURE 
-            | WaterHeaterEntityFeature.ON_OFF
-            | WaterHeaterEntityFeature.OPERATION_MODE
-        )
+    def current_temperature(self) -> float | None:
+        """Return the current temperature."""
+        return self._view.current_temperature
 
     @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement used by the platform."""
-        return UnitOfTemperature.CELSIUS
+    def target_temperature(self) -> float | None:
+        """Return the temperature we try to reach."""
+        # Check if we have a pending temperature change that should take priority
+        if self._pending_target_temperature is not None:
+            return self._pending_target_temperature
+        return self._view.target_temperature
 
     @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        device_data = self.coordinator.data.get(self._device_id)
-        if not device_data or not device_data.get("device"):
+    def current_operation(self) -> str | None:
+        """Return current operation mode."""
+        return self._view.current_operation
+
+    def _build_current_temperature(self) -> float | None:
+        """Return the tank temperature from the cached device data."""
+        if self._cached_device is None:
             return None
-            
-        device = device_data["device"]
         
         # Try to get tank temperature from structured device.status first
-        if hasattr(device, 'status') and device.status and hasattr(device.status, 'tank'):
-            temp = getattr(device.status.tank, 'temperature', None)
-            if temp is not None:
-                return temp
+        try:
+            temp = self._cached_tank.temperature
+        except AttributeError:
+            temp = None
+        if temp is not None:
+            return temp
         
         # Try to get tank temperature from raw data as fallback
-        raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            tank_status = raw_data['status']['tankStatus']
-            temp_now = tank_status.get('temperatureNow')
-            if temp_now is not None:
-                return float(temp_now)
+        temp_now = self._cached_tank_status.get(_K_TEMPERATURE_NOW)
+        if temp_now is not None:
+            return float(temp_now)
         
         return None
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
-        # Check if we have a pending temperature change that should take priority
-        if hasattr(self, '_pending_temperature') and self._device_id in self._pending_temperature:
-            pending_temp = self._pending_temperature[self._device_id]
-            _LOGGER.debug("🔄 Using pending temperature: %s°C", pending_temp)
-            return pending_temp
-        
-        device_data = self.coordinator.data.get(self._device_id)
-        if not device_data or not device_data.get("device"):
+    def _build_target_temperature(self) -> float | None:
+        """Return the tank target temperature from the cached device data."""
+        if self._cached_device is None:
             return None
-            
-        device = device_data["device"]
         
         # Try to get target temperature from structured device.status first
-        if hasattr(device, 'status') and device.status and hasattr(device.status, 'tank'):
-            target_temp = getattr(device.status.tank, 'target_temperature', None)
-            if target_temp is not None:
-                return target_temp
+        try:
+            target_temp = self._cached_tank.target_temperature
+        except AttributeError:
+            target_temp = None
+        if target_temp is not None:
+            return target_temp
         
         # Try to get target temperature from raw data as fallback
-        raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            tank_status = raw_data['status']['tankStatus']
-            heat_set = tank_status.get('heatSet')
-            if heat_set is not None:
-                return float(heat_set)
+        heat_set = self._cached_tank_status.get(_K_HEAT_SET)
+        if heat_set is not None:
+            return float(heat_set)
         
         return None
 
-    @property
-    def current_operation(self) -> str | None:
-        """Return current operation."""
-        device_data = self.coordinator.data.get(self._device_id)
-        if not device_data or not device_data.get("device"):
+    def _build_current_operation(self) -> str | None:
+        """Return the operation mode from the cached raw status flags."""
+        if not self._cached_device_data:
             return None
             
-        device = device_data["device"]
-        if hasattr(device, 'status') and device.status and hasattr(device.status, 'tank'):
-            if device.status.tank.operation_status == OperationStatus.ON:
-                return STATE_ON
-            else:
-                return STATE_OFF
-        return None
-
-    @property
-    def operation_list(self) -> list[str]:
-        """List of available operation modes."""
-        return [COMFORT_ECO, COMFORT_NORMAL, COMFORT_COMFORT, MODE_FORCE_DHW]
-
-    @property
-    def current_operation(self) -> str | None:
-        """Return current operation mode."""
-        device_data = self.coordinator.data.get(self._device_id)
-        if not device_data:
-            return None
-            
-        raw_data = device_data.get("raw_data")
-        if not raw_data or "status" not in raw_data:
+        status = self._cached_status
+        if not status:
             return COMFORT_NORMAL
-            
-        status = raw_data["status"]
         
-        # Check for force DHW mode first
-        if status.get("forceDHW"):
-            return MODE_FORCE_DHW
-        elif status.get("ecoMode"):
-            return COMFORT_ECO
-        elif status.get("comfortMode"):
-            return COMFORT_COMFORT
-        else:
-            return COMFORT_NORMAL
+        # Flags are checked in priority order, force DHW first
+        for flag, mode in _MODE_FLAGS:
+            if status.get(flag):
+                return mode
+        return COMFORT_NORMAL
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -238,6 +318,12 @@ class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
             _LOGGER.error("Invalid temperature value: %s", temperature)
             return
 
+        # Nothing to send if the device already has this target; a pending
+        # (unconfirmed) target is still retried
+        if self._pending_target_temperature is None and temperature == self.target_temperature:
+            _LOGGER.debug("Water heater target already %s°C, ignoring", temperature)
+            return
+
         device_data = self.coordinator.data.get(self._device_id)
         if not device_data:
             _LOGGER.warning("No device data found for %s", self._device_id)
@@ -246,121 +332,119 @@ class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         # Get current temperature for activity logging
         old_temperature = self.target_temperature
         
-        _LOGGER.info("🌡️  WATER HEATER: Setting temperature from %s°C to %s°C for device %s", 
-                    old_temperature, temperature, self._device_id)
+        _LOGGER.info("Setting water heater temperature from %s°C to %s°C for device %s",
+                     old_temperature, temperature, self._device_id)
         
         # Log the temperature change for activity widget
-        self._log_state_change("temperature changed", f"{old_temperature}°C" if old_temperature else "unknown", f"{temperature}°C")
+        # Compare the raw values before formatting them for the activity widget
+        if old_temperature != temperature:
+            self._log_state_change("temperature changed", f"{old_temperature}°C" if old_temperature else "unknown", f"{temperature}°C")
 
         # === IMMEDIATE UPDATE FOR RESPONSIVE UI ===
         # Update local data structure immediately for instant UI feedback
-        raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
+        tank_status = _get_tank_status(device_data.get("raw_data"))
+        if tank_status is not None:
             # Store old value for logging
-            old_heatset = raw_data['status']['tankStatus'].get('heatSet', 'unknown')
+            old_heatset = tank_status.get(_K_HEAT_SET, 'unknown')
             
             # Update target temperature immediately
-            raw_data['status']['tankStatus']['heatSet'] = float(temperature)
-            _LOGGER.info("✅ IMMEDIATE UPDATE: Tank target temperature %s°C → %s°C", old_heatset, temperature)
+            tank_status[_K_HEAT_SET] = temperature
+            _LOGGER.debug("IMMEDIATE UPDATE: Tank target temperature %s°C → %s°C", old_heatset, temperature)
             
             # Update device object if available
-            device = device_data.get("device")
-            if (device and hasattr(device, 'status') and device.status and 
-                hasattr(device.status, 'tank') and device.status.tank):
+            tank = _get_tank(device_data.get("device"))
+            if tank:
                 try:
-                    device.status.tank.target_temperature = float(temperature)
-                    _LOGGER.info("✅ Updated device.status.tank.target_temperature = %s°C", temperature)
+                    tank.target_temperature = temperature
+                    _LOGGER.debug("Updated device.status.tank.target_temperature = %s°C", temperature)
                 except Exception as err:
                     _LOGGER.debug("Could not update device.status.tank.target_temperature: %s", err)
             
             # Force immediate entity state update
-            self._attr_target_temperature = float(temperature)
+            self._update_cached_state()
             self.async_write_ha_state()
-            _LOGGER.info("✅ UI updated immediately with new temperature %s°C", temperature)
+            _LOGGER.debug("UI updated immediately with new temperature %s°C", temperature)
         else:
-            _LOGGER.warning("❌ No raw data available - cannot update temperature")
+            _LOGGER.warning("No raw data available - cannot update temperature")
             return
         
+        # Only the latest target of a slider drag is sent, once it has held
+        # for TEMPERATURE_SET_DEBOUNCE; the call that sends it awaits the
+        # API, while the calls it superseded return without sending
+        self._send_sequence += 1
+        sequence = self._send_sequence
+        await asyncio.sleep(TEMPERATURE_SET_DEBOUNCE)
+        if sequence == self._send_sequence:
+            await self._async_send_temperature(temperature)
+
+    async def _async_send_temperature(self, temperature: float) -> None:
+        """Set the tank target temperature through the device API."""
+        device_data = self.coordinator.data.get(self._device_id) or {}
+
         # === ATTEMPT REAL API CALL (using proper aioaquarea methods) ===
         device = device_data.get("device")
         api_success = False
         
         if device:
-            # Debug: Log all available methods on the device
-            all_methods = [method for method in dir(device) if not method.startswith('_')]
-            temp_methods = [method for method in all_methods if 'temp' in method.lower()]
-            set_methods = [method for method in all_methods if 'set' in method.lower()]
-            _LOGGER.info("🔍 DEBUG: Device has %d total methods, %d temp-related, %d set-related", 
-                        len(all_methods), len(temp_methods), len(set_methods))
-            _LOGGER.info("🔍 DEBUG: Temperature methods: %s", temp_methods)
-            _LOGGER.info("🔍 DEBUG: Set methods: %s", set_methods)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # Debug: Log all available methods on the device
+                all_methods = [method for method in dir(device) if not method.startswith('_')]
+                _LOGGER.debug("Device methods: %s", all_methods)
             
-            # Check method signatures for set_temperature
-            if hasattr(device, 'set_temperature'):
-                import inspect
-                try:
-                    sig = inspect.signature(device.set_temperature)
-                    _LOGGER.info("🔍 DEBUG: set_temperature signature: %s", sig)
-                except Exception as sig_err:
-                    _LOGGER.debug("Could not get set_temperature signature: %s", sig_err)
+            # Use the aioaquarea device methods as shown in the example
+            # First try to set the tank temperature (water heater specific)
+            api_success = await self._async_try_api_call(
+                "temperature",
+                ((device, "", self._TEMP_METHOD_NAMES),),
+                temperature,
+            )
             
-            try:
-                # Use the aioaquarea device methods as shown in the example
-                # First try to set the tank temperature (water heater specific)
-                if hasattr(device, 'set_tank_target_temperature'):
-                    await device.set_tank_target_temperature(temperature)
-                    _LOGGER.info("🌐 API SUCCESS: Set tank target temperature using set_tank_target_temperature(%s°C)", temperature)
-                    api_success = True
-                elif hasattr(device, 'set_dhw_target_temperature'):
-                    await device.set_dhw_target_temperature(temperature)
-                    _LOGGER.info("🌐 API SUCCESS: Set DHW target temperature using set_dhw_target_temperature(%s°C)", temperature)
-                    api_success = True
-                # Fallback to generic temperature setting methods (water heater might need zone_id)
-                elif hasattr(device, 'set_temperature'):
-                    # Try different zone_id values for water heater DHW (Domestic Hot Water)
-                    zone_attempts = [
-                        "DHW",    # Standard DHW zone identifier (uppercase)
-                        "dhw",    # DHW zone identifier (lowercase)  
-                        "tank",   # Tank zone identifier
-                        0,        # Zone 0 (numerical DHW zone)
-                        1,        # Zone 1 (backup)
-                        "water_heater",  # Explicit water heater zone
-                        "hot_water",     # Alternative hot water zone
-                    ]
-                    
-                    for zone_id in zone_attempts:
-                        try:
-                            await device.set_temperature(zone_id, temperature)
-                            _LOGGER.info("🌐 API SUCCESS: Set temperature using set_temperature(zone=%s, %s°C)", zone_id, temperature)
-                            api_success = True
-                            break
-                        except Exception as zone_err:
-                            _LOGGER.debug("🌐 Zone attempt failed for zone_id=%s: %s", zone_id, zone_err)
-                            continue
-                    
-                    if not api_success:
-                        _LOGGER.warning("🌐 All zone_id attempts failed for set_temperature")
-                else:
-                    _LOGGER.warning("🌐 API INFO: No temperature setting methods found on device")
-                    
-            except Exception as err:
-                _LOGGER.warning("🌐 API FAILED: Temperature setting failed: %s", err)
+            # Fallback to generic temperature setting methods (water heater might need zone_id)
+            if not api_success and hasattr(device, 'set_temperature'):
+                # Try different zone_id values for water heater DHW (Domestic Hot Water)
+                zone_attempts = [
+                    "DHW",    # Standard DHW zone identifier (uppercase)
+                    "dhw",    # DHW zone identifier (lowercase)  
+                    "tank",   # Tank zone identifier
+                    0,        # Zone 0 (numerical DHW zone)
+                    1,        # Zone 1 (backup)
+                    "water_heater",  # Explicit water heater zone
+                    "hot_water",     # Alternative hot water zone
+                ]
+                
+                for zone_id in zone_attempts:
+                    try:
+                        await device.set_temperature(zone_id, temperature)
+                        _LOGGER.debug("API SUCCESS: Set temperature using set_temperature(zone=%s, %s°C)", zone_id, temperature)
+                        self._api_methods["temperature"] = partial(device.set_temperature, zone_id)
+                        api_success = True
+                        break
+                    except Exception as zone_err:
+                        _LOGGER.debug("Zone attempt failed for zone_id=%s: %s", zone_id, zone_err)
+                        continue
+                
+                if not api_success:
+                    _LOGGER.warning("All zone_id attempts failed for set_temperature")
+            elif not api_success:
+                _LOGGER.warning("API INFO: No temperature setting methods found on device")
             
             # Try tank object methods if main device methods didn't work
-            if not api_success and hasattr(device, 'status') and device.status and hasattr(device.status, 'tank'):
-                tank = device.status.tank
+            tank = _get_tank(device)
+            if not api_success and tank is not None:
                 try:
                     if hasattr(tank, 'set_target_temperature'):
                         # Try tank.set_target_temperature with and without zone_id
                         try:
                             await tank.set_target_temperature(temperature)
-                            _LOGGER.info("🌐 API SUCCESS: Set tank target using tank.set_target_temperature(%s°C)", temperature)
+                            _LOGGER.debug("API SUCCESS: Set tank target using tank.set_target_temperature(%s°C)", temperature)
+                            self._api_methods["temperature"] = tank.set_target_temperature
                             api_success = True
                         except Exception as tank_err:
                             if "zone id" in str(tank_err).lower():
                                 # Try with zone_id = 0 for tank/DHW
                                 await tank.set_target_temperature(0, temperature)
-                                _LOGGER.info("🌐 API SUCCESS: Set tank target using tank.set_target_temperature(0, %s°C)", temperature)
+                                _LOGGER.debug("API SUCCESS: Set tank target using tank.set_target_temperature(0, %s°C)", temperature)
+                                self._api_methods["temperature"] = partial(tank.set_target_temperature, 0)
                                 api_success = True
                             else:
                                 raise tank_err
@@ -369,143 +453,76 @@ class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
                         # Try tank.set_temperature with and without zone_id
                         try:
                             await tank.set_temperature(temperature)
-                            _LOGGER.info("🌐 API SUCCESS: Set tank temperature using tank.set_temperature(%s°C)", temperature)
+                            _LOGGER.debug("API SUCCESS: Set tank temperature using tank.set_temperature(%s°C)", temperature)
+                            self._api_methods["temperature"] = tank.set_temperature
                             api_success = True
                         except Exception as tank_err:
                             if "zone id" in str(tank_err).lower():
                                 # Try with zone_id = 0 for tank/DHW
                                 await tank.set_temperature(0, temperature)
-                                _LOGGER.info("🌐 API SUCCESS: Set tank temperature using tank.set_temperature(0, %s°C)", temperature)
+                                _LOGGER.debug("API SUCCESS: Set tank temperature using tank.set_temperature(0, %s°C)", temperature)
+                                self._api_methods["temperature"] = partial(tank.set_temperature, 0)
                                 api_success = True
                             else:
                                 raise tank_err
                                 
                 except Exception as err:
-                    _LOGGER.warning("🌐 Tank API FAILED: %s", err)
+                    _LOGGER.warning("Tank API FAILED: %s", err)
         
         if api_success:
-            _LOGGER.info("✅ Real API call succeeded - waiting for device response")
-            # Wait for API response and refresh
-            await asyncio.sleep(2.0)  # Give more time for API response
-            await self.coordinator.async_request_refresh()
+            _LOGGER.debug("Real API call succeeded - requesting refresh")
+            # The device now owns the target temperature again
+            self._pending_target_temperature = None
+            await self.coordinator.async_after_action()
         else:
-            _LOGGER.warning("❌ No real API available - temperature will revert on next refresh")
-            _LOGGER.info("🔧 Device methods available: %s", [method for method in dir(device) if 'set' in method.lower() and 'temp' in method.lower()] if device else "No device")
+            _LOGGER.warning("No real API available - temperature will revert on next refresh")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Device methods available: %s", [method for method in dir(device) if 'set' in method.lower() and 'temp' in method.lower()] if device else "No device")
             
             # Store the desired temperature to prevent reversion
-            if not hasattr(self, '_pending_temperature'):
-                self._pending_temperature = {}
-            self._pending_temperature[self._device_id] = temperature
+            self._pending_target_temperature = temperature
             
             # Don't refresh immediately - let user see the change
-            _LOGGER.info("💾 Temperature cached locally - will persist until real API is available")
+            _LOGGER.debug("Temperature cached locally - will persist until real API is available")
 
     async def async_turn_on(self) -> None:
         """Turn the water heater on."""
-        device_data = self.coordinator.data.get(self._device_id)
-        if not device_data:
-            _LOGGER.warning("No device data found for %s", self._device_id)
-            return
-
-        _LOGGER.info("🔛 WATER HEATER: Turning ON for device %s", self._device_id)
-        
-        # Log the state change for activity widget
-        self._log_state_change("turned on", "OFF", "ON")
-
-        # === IMMEDIATE UPDATE FOR RESPONSIVE UI ===
-        raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            old_status = raw_data['status']['tankStatus'].get('operationStatus', 'unknown')
-            raw_data['status']['tankStatus']['operationStatus'] = 1
-            _LOGGER.info("✅ IMMEDIATE UPDATE: Tank operation status %s → 1 (ON)", old_status)
-            
-            # Force immediate entity state update
-            self.async_write_ha_state()
-            _LOGGER.info("✅ UI updated immediately - water heater ON")
-        else:
-            _LOGGER.warning("❌ No raw data available to update tank operation status")
-            return
-
-        # === ATTEMPT REAL API CALL (if available) ===
-        device = device_data.get("device")
-        api_success = False
-        
-        if device:
-            # Try the most likely real API methods
-            api_methods = [
-                ('set_dhw_operation', 'DHW operation'),
-                ('set_tank_operation', 'tank operation'),
-                ('enable_tank', 'tank enable'),
-                ('turn_on_tank', 'tank on'),
-            ]
-            
-            for method_name, description in api_methods:
-                if hasattr(device, method_name):
-                    try:
-                        method = getattr(device, method_name)
-                        await method(True)
-                        _LOGGER.info("🌐 API SUCCESS: Turned on water heater using %s", method_name)
-                        api_success = True
-                        break
-                    except Exception as err:
-                        _LOGGER.warning("🌐 API FAILED: %s failed: %s", method_name, err)
-                        continue
-            
-            # Try tank-specific methods if device has tank object
-            if not api_success and hasattr(device, 'status') and device.status and hasattr(device.status, 'tank'):
-                tank = device.status.tank
-                tank_methods = [
-                    ('set_operation', 'tank operation'),
-                    ('turn_on', 'tank turn on'),
-                    ('enable', 'tank enable'),
-                ]
-                
-                for method_name, description in tank_methods:
-                    if hasattr(tank, method_name):
-                        try:
-                            method = getattr(tank, method_name)
-                            await method(True)
-                            _LOGGER.info("🌐 API SUCCESS: Turned on water heater using tank.%s", method_name)
-                            api_success = True
-                            break
-                        except Exception as err:
-                            _LOGGER.warning("🌐 API FAILED: tank.%s failed: %s", method_name, err)
-                            continue
-        
-        if api_success:
-            _LOGGER.info("✅ Real API call succeeded - waiting for device response")
-            # Wait for API response and refresh
-            await asyncio.sleep(1.0)
-            await self.coordinator.async_request_refresh()
-        else:
-            _LOGGER.info("ℹ️  No real API available - using local simulation (UI already updated)")
-            # Trigger refresh to ensure consistency across all entities
-            await self.coordinator.async_request_refresh()
+        await self._async_set_power(True)
 
     async def async_turn_off(self) -> None:
         """Turn the water heater off."""
+        await self._async_set_power(False)
+
+    async def _async_set_power(self, turn_on: bool) -> None:
+        """Turn the water heater on or off."""
         device_data = self.coordinator.data.get(self._device_id)
         if not device_data:
             _LOGGER.warning("No device data found for %s", self._device_id)
             return
 
-        _LOGGER.info("⏹️  WATER HEATER: Turning OFF for device %s", self._device_id)
+        action, old_state, new_state = _POWER_STATES[turn_on]
+        if self._cached_tank_status.get(_K_OPERATION_STATUS) == int(turn_on):
+            _LOGGER.debug("Water heater already %s, ignoring", new_state)
+            return
+
+        _LOGGER.info("Turning %s water heater for device %s", new_state.lower(), self._device_id)
         
         # Log the state change for activity widget
-        self._log_state_change("turned off", "ON", "OFF")
+        self._log_state_change(action, old_state, new_state)
 
         # === IMMEDIATE UPDATE FOR RESPONSIVE UI ===
-        raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data and 'tankStatus' in raw_data['status']:
-            old_status = raw_data['status']['tankStatus'].get('operationStatus', 'unknown')
-            raw_data['status']['tankStatus']['operationStatus'] = 0
-            _LOGGER.info("✅ IMMEDIATE UPDATE: Tank operation status %s → 0 (OFF)", old_status)
+        tank_status = _get_tank_status(device_data.get("raw_data"))
+        if tank_status is not None:
+            old_status = tank_status.get(_K_OPERATION_STATUS, 'unknown')
+            tank_status[_K_OPERATION_STATUS] = int(turn_on)
+            _LOGGER.debug("IMMEDIATE UPDATE: Tank operation status %s → %d (%s)", old_status, turn_on, new_state)
             
             # Force immediate entity state update
+            self._update_cached_state()
             self.async_write_ha_state()
-            _LOGGER.info("✅ UI updated immediately - water heater OFF")
+            _LOGGER.debug("UI updated immediately - water heater %s", new_state)
         else:
-            _LOGGER.warning("❌ No raw data available to update tank operation status")
+            _LOGGER.warning("No raw data available to update tank operation status")
             return
 
         # === ATTEMPT REAL API CALL (if available) ===
@@ -513,59 +530,29 @@ class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         api_success = False
         
         if device:
-            # Try the most likely real API methods
-            api_methods = [
-                ('set_dhw_operation', 'DHW operation'),
-                ('set_tank_operation', 'tank operation'),
-                ('disable_tank', 'tank disable'),
-                ('turn_off_tank', 'tank off'),
-            ]
-            
-            for method_name, description in api_methods:
-                if hasattr(device, method_name):
-                    try:
-                        method = getattr(device, method_name)
-                        await method(False)
-                        _LOGGER.info("🌐 API SUCCESS: Turned off water heater using %s", method_name)
-                        api_success = True
-                        break
-                    except Exception as err:
-                        _LOGGER.warning("🌐 API FAILED: %s failed: %s", method_name, err)
-                        continue
-            
-            # Try tank-specific methods if device has tank object
-            if not api_success and hasattr(device, 'status') and device.status and hasattr(device.status, 'tank'):
-                tank = device.status.tank
-                tank_methods = [
-                    ('set_operation', 'tank operation'),
-                    ('turn_off', 'tank turn off'),
-                    ('disable', 'tank disable'),
-                ]
-                
-                for method_name, description in tank_methods:
-                    if hasattr(tank, method_name):
-                        try:
-                            method = getattr(tank, method_name)
-                            await method(False)
-                            _LOGGER.info("🌐 API SUCCESS: Turned off water heater using tank.%s", method_name)
-                            api_success = True
-                            break
-                        except Exception as err:
-                            _LOGGER.warning("🌐 API FAILED: tank.%s failed: %s", method_name, err)
-                            continue
+            # Try the most likely real API methods, then tank-specific ones
+            device_methods, tank_methods = _POWER_METHODS[turn_on]
+            api_success = await self._async_try_api_call(
+                action,
+                ((device, "", device_methods), (_get_tank(device), "tank.", tank_methods)),
+                turn_on,
+            )
         
         if api_success:
-            _LOGGER.info("✅ Real API call succeeded - waiting for device response")
-            # Wait for API response and refresh
-            await asyncio.sleep(1.0)
-            await self.coordinator.async_request_refresh()
+            _LOGGER.debug("Real API call succeeded - requesting refresh")
+            await self.coordinator.async_after_action()
         else:
-            _LOGGER.info("ℹ️  No real API available - using local simulation (UI already updated)")
-            # Trigger refresh to ensure consistency across all entities
-            await self.coordinator.async_request_refresh()
+            _LOGGER.debug("No real API available - using local simulation (UI already updated)")
+            # Nothing changed on the device; just let the other entities
+            # sharing this raw data pick up the local update
+            self.coordinator.async_update_listeners()
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set operation mode."""
+        if operation_mode not in _OPERATION_LIST:
+            _LOGGER.error("Unsupported water heater operation mode: %s", operation_mode)
+            return
+
         device_data = self.coordinator.data.get(self._device_id)
         if not device_data:
             return
@@ -573,100 +560,137 @@ class AquareaWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         _LOGGER.info("Setting water heater operation mode to %s for device %s", operation_mode, self._device_id)
 
         # Update the simulated data directly since we don't have real API access yet
-        raw_data = device_data.get("raw_data")
-        if raw_data and 'status' in raw_data:
-            # Reset all modes first
-            raw_data['status']['forceDHW'] = 0
-            raw_data['status']['ecoMode'] = 0
-            raw_data['status']['comfortMode'] = 0
-
-            # Set the requested mode
-            if operation_mode == MODE_FORCE_DHW:
-                raw_data['status']['forceDHW'] = 1
-                _LOGGER.info("Enabled Force DHW mode")
-            elif operation_mode == COMFORT_ECO:
-                raw_data['status']['ecoMode'] = 1
-                _LOGGER.info("Enabled Eco mode")
-            elif operation_mode == COMFORT_COMFORT:
-                raw_data['status']['comfortMode'] = 1
-                _LOGGER.info("Enabled Comfort mode")
-            else:
-                _LOGGER.info("Set to Normal mode (all special modes off)")
+        raw_data = device_data.get("raw_data") or {}
+        status = raw_data.get(_K_STATUS)
+        if status is not None:
+            # Reset all modes first, then set the requested one
+            status[_K_FORCE_DHW] = status[_K_ECO_MODE] = status[_K_COMFORT_MODE] = 0
+            flag = _MODE_TO_FLAG.get(operation_mode)
+            if flag:
+                status[flag] = 1
+            _LOGGER.debug("Set water heater mode flag: %s", flag or "none (normal)")
             
             # Update tank temperature based on mode
-            if 'tankStatus' in raw_data['status']:
-                tank_status = raw_data['status']['tankStatus']
-                if operation_mode == COMFORT_ECO:
-                    tank_status['heatSet'] = tank_status.get('ecoTemp', 55)
-                elif operation_mode == COMFORT_COMFORT:
-                    tank_status['heatSet'] = tank_status.get('comfortTemp', 65)
-                # For NORMAL and FORCE_DHW, keep current heatSet
-                
-            # Trigger a coordinator update to refresh all entities
-            await self.coordinator.async_request_refresh()
+            # For NORMAL and FORCE_DHW, keep current heatSet
+            tank_status = status.get(_K_TANK_STATUS)
+            temp_key = _MODE_TO_TEMP_KEY.get(operation_mode)
+            if tank_status is not None and temp_key:
+                key, default = temp_key
+                tank_status[_K_HEAT_SET] = tank_status.get(key, default)
+            
+            # Show the new mode right away; an unchanged refresh will not redraw it
+            self._update_cached_state()
+            self.async_write_ha_state()
+
+            # The mode only changes the local raw data (aioaquarea has no call
+            # for it yet), so let the other entities sharing it pick it up
+            self.coordinator.async_update_listeners()
         else:
             _LOGGER.warning("No raw data available to update operation mode")
 
-        # TODO: When aioaquarea library supports it, replace with real API calls
-
-    def _log_state_change(self, action: str, old_value: Any = None, new_value: Any = None) -> None:
-        """Log state changes for the Activity widget using logbook service."""
-        try:
-            # Create a detailed log message for the activity widget
-            if old_value is not None and new_value is not None:
-                message = f"Water heater {action}: {old_value} → {new_value}"
-                name = f"Panasonic Heat Pump Water Heater"
+    async def _async_try_api_call(
+        self,
+        action: str,
+        targets: Sequence[tuple[Any, str, Sequence[str]]],
+        *args: Any,
+    ) -> bool:
+        """Call the first working API method, walking each target in order.
+
+        Each target is a ``(obj, label, method_names)`` tuple; ``label`` only
+        prefixes the method name in log messages. The method that succeeds is
+        remembered under ``action`` and tried first next time. Returns True on
+        the first successful call. Only the remembered method is retried on
+        transient failures; candidates are probed once each, since a name
+        that does not fit this library version will never succeed.
+        """
+        cached = self._api_methods.get(action)
+        if cached is not None:
+            try:
+                await _async_call_with_retry(cached, *args)
+            except Exception as err:
+                _LOGGER.debug("Cached %s method failed, probing again: %s", action, err)
+                del self._api_methods[action]
             else:
-                message = f"Water heater {action}"
-                name = f"Panasonic Heat Pump Water Heater"
-            
-            # Log with INFO level 
-            _LOGGER.info("%s for device %s", message, self._device_id)
-            
-            # Use logbook service to create proper activity entries
-            if self.hass:
-                # Use hass.add_job for proper async handling
-                self.hass.add_job(
-                    self.hass.services.async_call,
-                    "logbook",
-                    "log", 
-                    {
-                        "name": name,
-                        "message": message,
-                        "entity_id": self.entity_id,
-                    }
-                )
-                
-        except Exception as err:
-            _LOGGER.debug("Failed to log state change: %s", err)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes for Cloud Comfort app features."""
+                return True
+
+        for target, label, method_names in targets:
+            if target is None:
+                continue
+            for method_name in method_names:
+                method = getattr(target, method_name, None)
+                if method is None:
+                    continue
+                try:
+                    await method(*args)
+                except Exception as err:
+                    _LOGGER.warning("API FAILED: %s%s failed: %s", label, method_name, err)
+                    continue
+                _LOGGER.debug("API SUCCESS: Called %s%s%s", label, method_name, args)
+                self._api_methods[action] = method
+                return True
+        return False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._resolve_device_data()
+        self._update_cached_state()
+        super()._handle_coordinator_update()
+
+    def _resolve_device_data(self) -> None:
+        """Cache this device's objects and raw status dicts from the latest refresh.
+
+        The raw dicts are shared with the coordinator data, so local updates
+        made by the setters stay visible until the next refresh replaces them.
+        """
         device_data = self.coordinator.data.get(self._device_id)
-        if not device_data:
+        self._cached_device_data = device_data
+        device_data = device_data or {}
+        device = device_data.get("device") or None
+        if device is not self._cached_device:
+            self._api_methods.clear()
+        self._cached_device = device
+        self._cached_tank = _get_tank(self._cached_device)
+        try:
+            self._cached_status = device_data["raw_data"][_K_STATUS]
+        except (KeyError, TypeError):
+            self._cached_status = None
+        self._cached_tank_status = _get_tank_status(device_data.get("raw_data")) or {}
+
+    def _update_cached_state(self) -> None:
+        """Derive the state properties and attributes from the cached device data."""
+        if self._cached_device_data:
+            self._view = _TankView(
+                self._build_current_temperature(),
+                self._build_target_temperature(),
+                self._build_current_operation(),
+            )
+        else:
+            self._view = _EMPTY_VIEW
+        self._update_extra_state_attributes()
+
+    def _update_extra_state_attributes(self) -> None:
+        """Refresh the cached state attributes, keeping the old dict if unchanged."""
+        attributes = self._build_extra_state_attributes()
+        if attributes != self._attr_extra_state_attributes:
+            self._attr_extra_state_attributes = attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Build additional state attributes for Cloud Comfort app features."""
+        if not self._cached_device_data:
             return None
             
-        raw_data = device_data.get("raw_data")
-        if not raw_data or "status" not in raw_data:
+        status = self._cached_status
+        if status is None:
             return None
             
-        status = raw_data["status"]
-        attributes = {}
-        
         # DHW specific attributes
-        attributes["force_dhw"] = bool(status.get("forceDHW", 0))
-        attributes["eco_mode"] = bool(status.get("ecoMode", 0))
-        attributes["comfort_mode"] = bool(status.get("comfortMode", 0))
-        attributes["dhw_priority"] = bool(status.get("dhwPriority", 0))
+        attributes = {name: bool(status.get(key)) for name, key in _STATUS_FLAG_ATTRIBUTES}
         
         # Tank-specific attributes from raw data
-        tank_status = status.get("tankStatus", {})
+        tank_status = self._cached_tank_status
         if tank_status:
-            attributes["tank_operation_status"] = tank_status.get("operationStatus")
-            attributes["eco_temperature"] = tank_status.get("ecoTemp")
-            attributes["comfort_temperature"] = tank_status.get("comfortTemp")
-            attributes["legionella_mode"] = bool(tank_status.get("legionellaMode", 0))
-            attributes["reheat_mode"] = bool(tank_status.get("reheatMode", 0))
+            attributes.update((name, tank_status.get(key)) for name, key in _TANK_VALUE_ATTRIBUTES)
+            attributes.update((name, bool(tank_status.get(key))) for name, key in _TANK_FLAG_ATTRIBUTES)
             
-        return attributes
\ No newline at end of file
+        return attributes
@@ -6,17 +6,258 @@ on the device objects so we can implement working controls.
 """
 
 import asyncio
+import functools
+import inspect
 import logging
+import reprlib
 import sys
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
 # Enable comprehensive logging
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Bounded repr for printed values, so large status objects are never fully rendered
+_short_repr = reprlib.Repr()
+_short_repr.maxstring = 100
+_short_repr.maxother = 100
+
+# Type names already looked up by _tname
+_type_names: dict[type, str] = {}
+
+# Common method patterns to test
+_CONTROL_METHOD_CANDIDATES = frozenset({
+    # Temperature control
+    'set_temperature', 'set_target_temperature', 'set_zone_temperature',
+    'set_tank_temperature', 'set_dhw_temperature', 'set_dhw_target_temperature',
+    
+    # Mode control
+    'set_mode', 'set_operation_mode', 'set_hvac_mode',
+    'set_eco_mode', 'set_comfort_mode', 'set_quiet_mode', 'set_powerful_mode',
+    
+    # Tank control
+    'set_tank_operation', 'enable_tank', 'disable_tank',
+    'force_dhw', 'set_force_dhw', 'set_dhw_operation',
+    
+    # Update methods
+    'update', 'refresh', 'fetch_status', 'get_status',
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _signature(method: Any) -> inspect.Signature:
+    """Return the signature of a method, reused when the method is inspected again."""
+    return inspect.signature(method)
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of output lines with a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _public_attrs(obj: Any) -> tuple[str, ...]:
+    """Return the public attribute names of an object."""
+    return tuple(attr for attr in dir(obj) if attr[:1] != '_')
+
+
+def _is_method(obj: Any, name: str) -> bool:
+    """Return whether name is a method of obj, without evaluating properties."""
+    static = inspect.getattr_static(obj, name, None)
+    return isinstance(static, (classmethod, staticmethod)) or inspect.isroutine(static)
+
+
+def _tname(value: Any, _cache: dict[type, str] = _type_names) -> str:
+    """Return the type name of a value, cached per type."""
+    value_type = type(value)
+    name = _cache.get(value_type)
+    if name is None:
+        name = _cache[value_type] = value_type.__name__
+    return name
+
+
+def _dump(obj: Any, name: str, indent: str = '  ', attrs: tuple[str, ...] | None = None) -> list[str]:
+    """Return listing lines for the public, non-callable attributes of an object."""
+    lines = []
+    for attr in attrs if attrs is not None else _public_attrs(obj):
+        try:
+            value = getattr(obj, attr)
+        except Exception as e:
+            lines.append(f"{indent}{name}.{attr}: <error: {e}>")
+            continue
+        if not callable(value):
+            lines.append(f"{indent}{name}.{attr}: {_tname(value)} = {_short_repr.repr(value)}")
+    return lines
+
+
+def _inspect_device(device: Any) -> dict[str, Any]:
+    """Print a full analysis of one device object and return its summary."""
+    # === COMPREHENSIVE DEVICE INSPECTION ===
+    print("\n" + "="*60)
+    print("🔍 DEVICE OBJECT ANALYSIS")
+    print("="*60)
+    
+    # Get all attributes and methods
+    all_attrs = dir(device)
+    
+    # Categorize attributes
+    properties = []
+    methods = []
+    private_attrs = []
+    
+    # Classify from the class definitions so properties are not evaluated twice
+    for attr in all_attrs:
+        if attr.startswith('__'):
+            continue
+        elif attr.startswith('_'):
+            private_attrs.append(attr)
+        elif _is_method(device, attr):
+            methods.append(attr)
+        else:
+            properties.append(attr)  # Properties and plain instance attributes
+    
+    # Instance attributes can be read straight from __dict__ without descriptor lookups
+    try:
+        instance_dict = vars(device)
+    except TypeError:
+        instance_dict = {}
+    
+    print(f"\n📋 PUBLIC PROPERTIES ({len(properties)}):")
+    lines = []
+    for prop in properties:
+        try:
+            value = instance_dict[prop] if prop in instance_dict else getattr(device, prop)
+            lines.append(f"  {prop}: {_tname(value)} = {_short_repr.repr(value)}")
+        except Exception as e:
+            lines.append(f"  {prop}: <error accessing: {e}>")
+    _write_lines(lines)
+    
+    print(f"\n🔧 PUBLIC METHODS ({len(methods)}):")
+    lines = []
+    for method in methods:
+        try:
+            method_obj = getattr(device, method)
+            # Try to get method signature
+            try:
+                sig = _signature(method_obj)
+                lines.append(f"  {method}{sig}")
+            except:
+                lines.append(f"  {method}()")
+        except Exception as e:
+            lines.append(f"  {method}: <error: {e}>")
+    _write_lines(lines)
+    
+    print(f"\n🔒 PRIVATE ATTRIBUTES ({len(private_attrs)}):")
+    lines = []
+    for attr in private_attrs:
+        try:
+            value = instance_dict[attr] if attr in instance_dict else getattr(device, attr)
+            lines.append(f"  {attr}: {_tname(value)}")
+        except Exception as e:
+            lines.append(f"  {attr}: <error: {e}>")
+    _write_lines(lines)
+    
+    # === CHECK FOR DEVICE.STATUS ===
+    print(f"\n" + "="*60)
+    print("📊 DEVICE STATUS ANALYSIS")
+    print("="*60)
+    
+    # Read each status object once; the SDK may assemble them on every access
+    status = getattr(device, 'status', None)
+    zones = getattr(status, 'zones', None)
+    tank = getattr(status, 'tank', None)
+    
+    if status is not None:
+        print(f"✓ Device has status: {type(status)}")
+        
+        # Analyze status object
+        status_attrs = [attr for attr in dir(status) if not attr.startswith('__')]
+        print(f"Status attributes: {status_attrs}")
+        
+        _write_lines(_dump(status, 'status'))
+        
+        # Check for zones
+        if zones is not None:
+            print(f"\n🏠 ZONES ({len(zones)}):")
+            if zones:
+                # Zones share a type, so list their attributes only once
+                zone_attrs_by_type = {}
+                lines = []
+                for i, zone in enumerate(zones):
+                    lines.append(f"  Zone {i+1}: {type(zone)}")
+                    zone_attrs = zone_attrs_by_type.get(type(zone))
+                    if zone_attrs is None:
+                        zone_attrs = _public_attrs(zone)
+                        zone_attrs_by_type[type(zone)] = zone_attrs
+                    lines.extend(_dump(zone, 'zone', '    ', zone_attrs))
+                _write_lines(lines)
+        
+        # Check for tank
+        if tank is not None:
+            print(f"\n🚰 TANK:")
+            print(f"  Tank: {type(tank)}")
+            _write_lines(_dump(tank, 'tank', '    '))
+    else:
+        print("❌ Device has no status attribute")
+    
+    # === TEST POTENTIAL CONTROL METHODS ===
+    print(f"\n" + "="*60)
+    print("🎮 CONTROL METHODS TEST")
+    print("="*60)
+    
+    # Match the known control method names against the public methods found above
+    available_control_methods = sorted(_CONTROL_METHOD_CANDIDATES.intersection(methods))
+    
+    lines = []
+    for method_name in available_control_methods:
+        lines.append(f"  ✓ {method_name} - AVAILABLE")
+        
+        # Try to get method signature
+        try:
+            sig = _signature(getattr(device, method_name))
+            lines.append(f"    Signature: {method_name}{sig}")
+        except:
+            pass
+    _write_lines(lines)
+    
+    print(f"\n📝 SUMMARY:")
+    print(f"  Available control methods: {len(available_control_methods)}")
+    if available_control_methods:
+        print("  Methods found:", ", ".join(available_control_methods))
+    else:
+        print("  ❌ No standard control methods found")
+    
+    # === CHECK CLIENT OBJECT ===
+    print(f"\n" + "="*60)
+    print("🌐 CLIENT OBJECT ANALYSIS")  
+    print("="*60)
+    
+    if hasattr(device, '_client'):
+        client_obj = device._client
+        print(f"✓ Device has _client: {type(client_obj)}")
+        
+        client_methods = [attr for attr in dir(client_obj) if not attr.startswith('_') and callable(getattr(client_obj, attr))]
+        print(f"Client methods: {client_methods}")
+    
+    return {
+        'device_type': str(type(device)),
+        'properties': properties,
+        'methods': methods,
+        'available_control_methods': available_control_methods,
+        'has_status': status is not None,
+        'has_zones': zones is not None,
+        'has_tank': tank is not None,
+    }
+
+
 async def diagnose_real_device():
     """Connect to real API and diagnose available device methods."""
     
@@ -41,184 +282,18 @@ async def diagnose_real_device():
             print("❌ No devices found")
             return
         
-        # Get first device
-        device_info = devices_info[0]
-        print(f"\n📊 Device Info: {device_info.device_id} - {getattr(device_info, 'name', 'Unknown')}")
-        
-        # Get device object
-        print("🔧 Getting device object...")
-        device = await client.get_device(device_info)
-        print(f"✓ Device object type: {type(device)}")
-        
-        # === COMPREHENSIVE DEVICE INSPECTION ===
-        print("\n" + "="*60)
-        print("🔍 DEVICE OBJECT ANALYSIS")
-        print("="*60)
-        
-        # Get all attributes and methods
-        all_attrs = dir(device)
-        
-        # Categorize attributes
-        properties = []
-        methods = []
-        private_attrs = []
-        
-        for attr in all_attrs:
-            if attr.startswith('__'):
-                continue
-            elif attr.startswith('_'):
-                private_attrs.append(attr)
-            else:
-                try:
-                    attr_value = getattr(device, attr)
-                    if callable(attr_value):
-                        methods.append(attr)
-                    else:
-                        properties.append(attr)
-                except:
-                    properties.append(attr)  # If we can't get it, assume it's a property
-        
-        print(f"\n📋 PUBLIC PROPERTIES ({len(properties)}):")
-        for prop in sorted(properties):
-            try:
-                value = getattr(device, prop)
-                print(f"  {prop}: {type(value).__name__} = {str(value)[:100]}{'...' if len(str(value)) > 100 else ''}")
-            except Exception as e:
-                print(f"  {prop}: <error accessing: {e}>")
-        
-        print(f"\n🔧 PUBLIC METHODS ({len(methods)}):")
-        for method in sorted(methods):
-            try:
-                method_obj = getattr(device, method)
-                # Try to get method signature
-                import inspect
-                try:
-                    sig = inspect.signature(method_obj)
-                    print(f"  {method}{sig}")
-                except:
-                    print(f"  {method}()")
-            except Exception as e:
-                print(f"  {method}: <error: {e}>")
-        
-        print(f"\n🔒 PRIVATE ATTRIBUTES ({len(private_attrs)}):")
-        for attr in sorted(private_attrs):
-            try:
-                value = getattr(device, attr)
-                print(f"  {attr}: {type(value).__name__}")
-            except Exception as e:
-                print(f"  {attr}: <error: {e}>")
-        
-        # === CHECK FOR DEVICE.STATUS ===
-        print(f"\n" + "="*60)
-        print("📊 DEVICE STATUS ANALYSIS")
-        print("="*60)
-        
-        if hasattr(device, 'status'):
-            status = device.status
-            print(f"✓ Device has status: {type(status)}")
-            
-            # Analyze status object
-            status_attrs = [attr for attr in dir(status) if not attr.startswith('__')]
-            print(f"Status attributes: {status_attrs}")
-            
-            for attr in status_attrs:
-                if not attr.startswith('_'):
-                    try:
-                        value = getattr(status, attr)
-                        print(f"  status.{attr}: {type(value).__name__} = {str(value)[:100]}{'...' if len(str(value)) > 100 else ''}")
-                    except Exception as e:
-                        print(f"  status.{attr}: <error: {e}>")
-            
-            # Check for zones
-            if hasattr(status, 'zones'):
-                print(f"\n🏠 ZONES ({len(status.zones) if status.zones else 0}):")
-                if status.zones:
-                    for i, zone in enumerate(status.zones):
-                        print(f"  Zone {i+1}: {type(zone)}")
-                        zone_attrs = [attr for attr in dir(zone) if not attr.startswith('_')]
-                        for attr in zone_attrs:
-                            try:
-                                value = getattr(zone, attr)
-                                if not callable(value):
-                                    print(f"    zone.{attr}: {value}")
-                            except Exception as e:
-                                print(f"    zone.{attr}: <error: {e}>")
-            
-            # Check for tank
-            if hasattr(status, 'tank'):
-                print(f"\n🚰 TANK:")
-                tank = status.tank
-                print(f"  Tank: {type(tank)}")
-                tank_attrs = [attr for attr in dir(tank) if not attr.startswith('_')]
-                for attr in tank_attrs:
-                    try:
-                        value = getattr(tank, attr)
-                        if not callable(value):
-                            print(f"    tank.{attr}: {value}")
-                    except Exception as e:
-                        print(f"    tank.{attr}: <error: {e}>")
-        else:
-            print("❌ Device has no status attribute")
+        # Get all device objects at once; each one is a network round-trip
+        print("🔧 Getting device objects...")
+        devices = await asyncio.gather(
+            *(client.get_device(device_info) for device_info in devices_info)
+        )
         
-        # === TEST POTENTIAL CONTROL METHODS ===
-        print(f"\n" + "="*60)
-        print("🎮 CONTROL METHODS TEST")
-        print("="*60)
+        results = []
+        for device_info, device in zip(devices_info, devices):
+            print(f"\n📊 Device Info: {device_info.device_id} - {getattr(device_info, 'name', 'Unknown')}")
+            print(f"✓ Device object type: {type(device)}")
+            results.append(_inspect_device(device))
         
-        # Common method patterns to test
-        test_methods = [
-            # Temperature control
-            'set_temperature', 'set_target_temperature', 'set_zone_temperature',
-            'set_tank_temperature', 'set_dhw_temperature', 'set_dhw_target_temperature',
-            
-            # Mode control  
-            'set_mode', 'set_operation_mode', 'set_hvac_mode',
-            'set_eco_mode', 'set_comfort_mode', 'set_quiet_mode', 'set_powerful_mode',
-            
-            # Tank control
-            'set_tank_operation', 'enable_tank', 'disable_tank',
-            'force_dhw', 'set_force_dhw', 'set_dhw_operation',
-            
-            # Update methods
-            'update', 'refresh', 'fetch_status', 'get_status'
-        ]
-        
-        available_control_methods = []
-        
-        for method_name in test_methods:
-            if hasattr(device, method_name):
-                method = getattr(device, method_name)
-                if callable(method):
-                    available_control_methods.append(method_name)
-                    print(f"  ✓ {method_name} - AVAILABLE")
-                    
-                    # Try to get method signature
-                    try:
-                        import inspect
-                        sig = inspect.signature(method)
-                        print(f"    Signature: {method_name}{sig}")
-                    except:
-                        pass
-        
-        print(f"\n📝 SUMMARY:")
-        print(f"  Available control methods: {len(available_control_methods)}")
-        if available_control_methods:
-            print("  Methods found:", ", ".join(available_control_methods))
-        else:
-            print("  ❌ No standard control methods found")
-        
-        # === CHECK CLIENT OBJECT ===
-        print(f"\n" + "="*60)
-        print("🌐 CLIENT OBJECT ANALYSIS")  
-        print("="*60)
-        
-        if hasattr(device, '_client'):
-            client_obj = device._client
-            print(f"✓ Device has _client: {type(client_obj)}")
-            
-            client_methods = [attr for attr in dir(client_obj) if not attr.startswith('_') and callable(getattr(client_obj, attr))]
-            print(f"Client methods: {client_methods}")
-            
         # === RAW API ANALYSIS ===
         print(f"\n" + "="*60)
         print("🔗 RAW API ANALYSIS")
@@ -236,15 +311,7 @@ async def diagnose_real_device():
         print("✅ DIAGNOSIS COMPLETE")
         print("="*60)
         
-        return {
-            'device_type': str(type(device)),
-            'properties': properties,
-            'methods': methods,
-            'available_control_methods': available_control_methods,
-            'has_status': hasattr(device, 'status'),
-            'has_zones': hasattr(device, 'status') and hasattr(device.status, 'zones') if hasattr(device, 'status') else False,
-            'has_tank': hasattr(device, 'status') and hasattr(device.status, 'tank') if hasattr(device, 'status') else False,
-        }
+        return results
         
     except ImportError as e:
         print(f"❌ Failed to import aioaquarea: {e}")
@@ -264,6 +331,11 @@ if __name__ == "__main__":
     
     if result:
         print("\n💾 Saving diagnosis results...")
-        with open('/Users/joachimdittman/Documents/HASS home/HACS/panasonic-homeassistant-integration/device_diagnosis.json', 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        path = '/Users/joachimdittman/Documents/HASS home/HACS/panasonic-homeassistant-integration/device_diagnosis.json'
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(path, 'w') as f:
+                json.dump(result, f, indent=2, default=str)
         print("✓ Results saved to device_diagnosis.json")
\ No newline at end of file
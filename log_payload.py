@@ -0,0 +1,36 @@
+"""
+Log Payload Parsing
+Shared by the scripts that parse aioaquarea's raw response log lines.
+"""
+
+import ast
+import json
+import re
+
+# Simple single-quoted strings, Python keywords, and any stray double quote or
+# backslash that would make the text-level rewrite to JSON unsafe
+_PY_LITERAL_TOKENS = re.compile(r"'([^'\\\"]*)'|\b(True|False|None)\b|[\"\\]")
+_JSON_KEYWORDS = {"True": "true", "False": "false", "None": "null"}
+_JSON_DECODER = json.JSONDecoder()
+
+def _py_token_to_json(match):
+    """Rewrite one Python literal token as its JSON spelling."""
+    if match.group(1) is not None:
+        return f'"{match.group(1)}"'
+    if match.group(2) is not None:
+        return _JSON_KEYWORDS[match.group(2)]
+    raise ValueError("payload needs escaping")
+
+def parse_log_payload(json_str):
+    """Parse a logged dict repr through the json module, falling back to ast.
+
+    Decoding stops at the end of the first complete object, so text after
+    the payload is ignored. A payload that is already real JSON skips the
+    token rewrite, matching the capture handler in the integration.
+    """
+    try:
+        if json_str.startswith('{"'):
+            return _JSON_DECODER.raw_decode(json_str)[0]
+        return _JSON_DECODER.raw_decode(_PY_LITERAL_TOKENS.sub(_py_token_to_json, json_str))[0]
+    except ValueError:  # Also covers json.JSONDecodeError
+        return ast.literal_eval(json_str)
@@ -21,8 +21,8 @@ def test_zone_filtering():
     print(f"Original zones: {zones_single}")
     
     # Apply filtering (zone 1 only)
-    filtered_single = [zone for zone in zones_single if getattr(zone, 'zone_id', None) == 1]
-    print(f"Filtered zones (zone 1 only): {filtered_single}")
+    zone1_single = next((zone for zone in zones_single if zone.zone_id == 1), None)
+    print(f"Filtered zones (zone 1 only): {zone1_single}")
     
     # Test case 2: Multi-zone device
     print("\n--- Test Case 2: Multi-zone device ---")
@@ -30,30 +30,27 @@ def test_zone_filtering():
     print(f"Original zones: {zones_multi}")
     
     # Apply filtering (zone 1 only)
-    filtered_multi = [zone for zone in zones_multi if getattr(zone, 'zone_id', None) == 1]
-    print(f"Filtered zones (zone 1 only): {filtered_multi}")
+    zone1_multi = next((zone for zone in zones_multi if zone.zone_id == 1), None)
+    print(f"Filtered zones (zone 1 only): {zone1_multi}")
     
     # Test case 3: Check entity creation logic
     print("\n--- Test Case 3: Entity creation logic ---")
     for zones, case_name in [(zones_single, "Single zone"), (zones_multi, "Multi-zone")]:
         print(f"\n{case_name} case:")
-        filtered = [zone for zone in zones if getattr(zone, 'zone_id', None) == 1]
+        zone1 = next((zone for zone in zones if zone.zone_id == 1), None)
         
         entities_created = []
-        for zone in filtered:
-            zone_id = getattr(zone, 'zone_id', None)
-            zone_name = getattr(zone, 'name', None)
-            
-            print(f"  Processing zone: ID={zone_id}, Name={zone_name}")
+        if zone1 is None:
+            print("  ✗ Skipped: No zone 1 found (only zone 1 supported)")
+        else:
+            print(f"  Processing zone: ID={zone1.zone_id}, Name={zone1.name}")
             
             # Only create entities for zone ID 1 (our new filter)
-            if zone_id == 1 and zone_name:
-                entities_created.append(f"Climate entity for zone {zone_id} ({zone_name})")
-                print(f"    ✓ Created: Climate entity for zone {zone_id}")
-            elif zone_id != 1:
-                print(f"    ✗ Skipped: Zone {zone_id} (only zone 1 supported)")
+            if zone1.name:
+                entities_created.append(f"Climate entity for zone {zone1.zone_id} ({zone1.name})")
+                print(f"    ✓ Created: Climate entity for zone {zone1.zone_id}")
             else:
-                print(f"    ✗ Skipped: Missing zone name")
+                print("    ✗ Skipped: Missing zone name")
         
         print(f"  Total entities created: {len(entities_created)}")
         for entity in entities_created:
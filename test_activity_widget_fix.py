@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Test Activity Widget Fix - Logbook Service Approach
-Test the new logbook service implementation for Activity widget visibility.
+Test Activity Widget Fix - Activity Log Approach
+Test how entity changes reach the activity log behind the Activity widget.
 """
 
 import sys
@@ -10,181 +10,152 @@ import os
 # Add the custom_components directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "custom_components"))
 
-async def test_activity_logging():
+# Decorative output is only printed with PSA_TEST_VERBOSE=1; results are always printed
+_print = print if os.environ.get("PSA_TEST_VERBOSE") == "1" else lambda *args, **kwargs: None
+
+
+# Activity entry for a change, filled with the entity prefix, action and values
+_TMPL_FULL = "%s%s: %s → %s"
+
+
+class MockActivityLog:
+    """Mirror of AquareaActivityLog: entries are queued, then written as one batch."""
+    
+    def __init__(self):
+        self._pending = []
+        self.written = []
+        
+    def async_log(self, name, message, entity_id):
+        _print(f"   Queued: {message}")
+        self._pending.append({"name": name, "message": message, "entity_id": entity_id})
+        
+    def flush(self):
+        """Write the queued entries, as the real log does through async_log_entry."""
+        batch, self._pending = self._pending, []
+        for entry in batch:
+            _print(f"✅ Logbook entry: {entry}")
+        self.written.extend(batch)
+
+
+class MockActivityEntity:
+    """Mirror of AquareaActivityMixin, which queues straight into the activity log.
+    
+    The quiet period that merges slider drags is left out; changes are written at once.
+    """
+    
+    def __init__(self, hass, coordinator, entity_id, logbook_name, msg_prefix):
+        self.hass = hass
+        self.coordinator = coordinator
+        self.entity_id = entity_id
+        self._logbook_name = logbook_name
+        self._msg_prefix = msg_prefix
+        
+    def _write_state_change(self, action, old_value=None, new_value=None):
+        # Transitions that change nothing are not logged
+        if old_value is not None and str(old_value) == str(new_value):
+            return
+        if old_value is not None and new_value is not None:
+            message = _TMPL_FULL % (self._msg_prefix, action, old_value, new_value)
+        else:
+            message = self._msg_prefix + action
+        if self.hass:
+            self.coordinator.activity_log.async_log(self._logbook_name, message, self.entity_id)
+
+
+def test_activity_logging():
     """Test the new activity logging approach."""
     
-    print("=== Testing Activity Widget Fix - Logbook Service ===")
+    _print("=== Testing Activity Widget Fix - Activity Log ===")
     
-    # Mock Home Assistant components for testing
-    class MockServices:
-        def async_call(self, domain, service, data):
-            print(f"✅ Service Call: {domain}.{service}")
-            print(f"   Data: {data}")
-            return True
+    class MockEvent:
+        def __init__(self, data):
+            self.data = data
+    
+    class MockBus:
+        def __init__(self):
+            self._listeners = {}
             
-    class MockLoop:
-        def call_soon_threadsafe(self, func):
-            print(f"✅ Thread-safe execution: {func.__name__}")
-            # Execute the function immediately for testing
-            func()
-            return True
+        def async_listen(self, event_type, listener):
+            self._listeners.setdefault(event_type, []).append(listener)
+            
+        def async_fire(self, event_type, data):
+            event = MockEvent(data)
+            for listener in self._listeners.get(event_type, ()):
+                listener(event)
     
     class MockHass:
         def __init__(self):
-            self.services = MockServices()
-            self.loop = MockLoop()
+            self.bus = MockBus()
     
-    # Test water heater activity logging
-    print("\n1. Testing Water Heater Activity Logging:")
-    
-    # Simulate a water heater entity
-    class MockWaterHeater:
+    class MockCoordinator:
         def __init__(self):
-            self.hass = MockHass()
-            self.entity_id = "water_heater.panasonic_aquarea"
-            self._device_id = "test_device_123"
-            
-        def _log_state_change(self, action, old_value=None, new_value=None):
-            """New logbook service implementation."""
-            try:
-                if old_value is not None and new_value is not None:
-                    message = f"Water heater {action}: {old_value} → {new_value}"
-                    name = f"Panasonic Heat Pump Water Heater"
-                else:
-                    message = f"Water heater {action}"
-                    name = f"Panasonic Heat Pump Water Heater"
-                
-                print(f"   Message: {message}")
-                print(f"   Name: {name}")
-                
-                if self.hass:
-                    def fire_logbook_event():
-                        """Fire the logbook event in a thread-safe way."""
-                        self.hass.services.async_call(
-                            "logbook",
-                            "log", 
-                            {
-                                "name": name,
-                                "message": message,
-                                "entity_id": self.entity_id,
-                            }
-                        )
-                    
-                    self.hass.loop.call_soon_threadsafe(fire_logbook_event)
-                    
-            except Exception as err:
-                print(f"❌ Error: {err}")
-    
-    water_heater = MockWaterHeater()
-    water_heater._log_state_change("temperature changed", "50°C", "55°C")
+            self.data = {"test_device_123": {}}
+            self.activity_log = MockActivityLog()
     
-    # Test climate activity logging
-    print("\n2. Testing Climate Activity Logging:")
+    hass = MockHass()
+    coordinator = MockCoordinator()
     
-    class MockClimate:
-        def __init__(self):
-            self.hass = MockHass()
-            self.entity_id = "climate.panasonic_aquarea_zone_1"
-            self._device_id = "test_device_123"
-            self._zone_id = 1
-            
-        def _log_state_change(self, action, old_value=None, new_value=None):
-            """New logbook service implementation."""
-            try:
-                if old_value is not None and new_value is not None:
-                    message = f"Climate Zone {self._zone_id} {action}: {old_value} → {new_value}"
-                    name = f"Panasonic Heat Pump Climate Zone {self._zone_id}"
-                else:
-                    message = f"Climate Zone {self._zone_id} {action}"
-                    name = f"Panasonic Heat Pump Climate Zone {self._zone_id}"
-                
-                print(f"   Message: {message}")
-                print(f"   Name: {name}")
-                
-                if self.hass:
-                    def fire_logbook_event():
-                        """Fire the logbook event in a thread-safe way."""
-                        self.hass.services.async_call(
-                            "logbook",
-                            "log", 
-                            {
-                                "name": name,
-                                "message": message,
-                                "entity_id": self.entity_id,
-                            }
-                        )
-                    
-                    self.hass.loop.call_soon_threadsafe(fire_logbook_event)
-                    
-            except Exception as err:
-                print(f"❌ Error: {err}")
-    
-    climate = MockClimate()
-    climate._log_state_change("HVAC mode changed", "heating", "cooling")
-    
-    print("\n3. Testing General Activity Handler:")
-    
-    # Test the general activity handler from __init__.py
-    class MockGeneralHandler:
-        def __init__(self):
-            self.hass = MockHass()
-            
-        def handle_aquarea_action(self, event):
-            """Simulate the updated activity handler."""
-            try:
-                data = event.data
-                action = data.get("action", "action")
-                old_value = data.get("old_value")
-                new_value = data.get("new_value")
-                device_type = data.get("device_type", "device")
-                
-                if old_value is not None and new_value is not None:
-                    message = f"Panasonic Aquarea {device_type} {action}: {old_value} → {new_value}"
-                else:
-                    message = f"Panasonic Aquarea {device_type} {action}"
-                
-                print(f"   Message: {message}")
-                
-                def fire_logbook_event():
-                    """Fire the logbook event in a thread-safe way."""
-                    self.hass.services.async_call(
-                        "logbook",
-                        "log", 
-                        {
-                            "name": "Panasonic Aquarea",
-                            "message": message,
-                            "entity_id": data.get("entity_id"),
-                        }
-                    )
-                
-                self.hass.loop.call_soon_threadsafe(fire_logbook_event)
-                
-            except Exception as err:
-                print(f"❌ Error: {err}")
-    
-    # Simulate event data
-    class MockEvent:
-        def __init__(self, data):
-            self.data = data
+    # Switches and sensors fire events; the feed registered in __init__.py queues them
+    def handle_aquarea_action(event):
+        data = event.data
+        if data.get("device_id") not in coordinator.data:
+            return
+        message = f"{data.get('switch_type', 'mode')} {data.get('action', 'changed')}"
+        coordinator.activity_log.async_log("Panasonic Aquarea", message, data.get("entity_id"))
+    
+    hass.bus.async_listen("panasonic_aquarea_action", handle_aquarea_action)
+    
+    # Test water heater activity logging
+    _print("\n1. Testing Water Heater Activity Logging:")
+    water_heater = MockActivityEntity(
+        hass, coordinator, "water_heater.panasonic_aquarea",
+        "Panasonic Heat Pump Water Heater", "Water heater ",
+    )
+    water_heater._write_state_change("temperature changed", "50°C", "55°C")
+    # Re-issued commands report the same value and are not logged
+    water_heater._write_state_change("temperature changed", "55°C", "55°C")
     
-    handler = MockGeneralHandler()
-    event_data = {
-        "entity_id": "water_heater.panasonic_aquarea",
-        "action": "temperature changed",
-        "old_value": "50°C",
-        "new_value": "55°C",
-        "device_type": "water_heater"
+    # Test climate activity logging
+    _print("\n2. Testing Climate Activity Logging:")
+    climate = MockActivityEntity(
+        hass, coordinator, "climate.panasonic_aquarea_zone_1",
+        "Panasonic Heat Pump Climate Zone 1", "Climate Zone 1 ",
+    )
+    climate._write_state_change("HVAC mode changed", "heating", "cooling")
+    
+    _print("\n3. Testing Switch Activity Event:")
+    switch_event = {
+        "entity_id": "switch.panasonic_aquarea_eco_mode",
+        "device_id": "test_device_123",
+        "switch_type": "eco_mode",
+        "action": "turned on",
+        "old_value": False,
+        "new_value": True,
+        "device_type": "switch",
     }
-    handler.handle_aquarea_action(MockEvent(event_data))
+    hass.bus.async_fire("panasonic_aquarea_action", switch_event)
+    # Events for devices of another config entry are ignored
+    hass.bus.async_fire("panasonic_aquarea_action", {**switch_event, "device_id": "other_device"})
+    
+    coordinator.activity_log.flush()
+    
+    assert [entry["message"] for entry in coordinator.activity_log.written] == [
+        "Water heater temperature changed: 50°C → 55°C",
+        "Climate Zone 1 HVAC mode changed: heating → cooling",
+        "eco_mode turned on",
+    ]
+    assert coordinator.activity_log.written[1]["name"] == "Panasonic Heat Pump Climate Zone 1"
+    assert coordinator.activity_log.written[2]["entity_id"] == "switch.panasonic_aquarea_eco_mode"
     
     print("\n=== Test Results ===")
-    print("✅ All activity logging methods updated to use logbook.log service")
-    print("✅ Thread-safe implementation using call_soon_threadsafe")
+    print("✅ Water heater and climate queue entries in the activity log directly")
+    print("✅ Switch and sensor events reach the same log through one listener")
+    print("✅ Queued entries written together, no un-awaited coroutines")
     print("✅ Proper message formatting for Activity widget")
     print("\n📝 Key Changes:")
-    print("   - Replaced hass.bus.async_fire with hass.services.async_call")
-    print("   - Using 'logbook.log' service instead of 'logbook_entry' event")
-    print("   - Maintained thread safety with call_soon_threadsafe")
+    print("   - AquareaActivityLog is the only writer of logbook entries")
+    print("   - Switches and sensors fire panasonic_aquarea_action on hass.bus")
+    print("   - Entries written with logbook's async_log_entry, skipping the logbook.log service")
     print("   - Added proper entity_id association for Activity widget")
     
     print("\n🔧 Next Steps:")
@@ -194,5 +165,4 @@ async def test_activity_logging():
     print("   4. Verify logbook entries appear in History/Activity")
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(test_activity_logging())
\ No newline at end of file
+    test_activity_logging()
\ No newline at end of file
@@ -26,7 +26,35 @@ def test_aioaquarea_pattern():
     class MockAquareaEnvironment:
         PRODUCTION = "production"
     
+    class MockDeviceInfo:
+        __slots__ = ("device_id", "long_id")
+        
+        def __init__(self):
+            self.device_id = "TEST123"
+            self.long_id = "LONG_TEST_123"
+    
+    class MockDevice:
+        __slots__ = ("device_id",)
+        
+        def __init__(self):
+            self.device_id = "TEST123"
+        
+        async def refresh_data(self):
+            print("✅ device.refresh_data() called")
+        
+        async def set_mode(self, mode):
+            print(f"✅ device.set_mode({mode}) called - following aioaquarea example!")
+        
+        async def set_tank_target_temperature(self, temperature):
+            print(f"✅ device.set_tank_target_temperature({temperature}) called")
+    
     class MockClient:
+        __slots__ = ("username", "password", "session", "device_direct", "refresh_login", "environment")
+        
+        # Device objects are built once and handed out on every call
+        _DEVICES = [MockDeviceInfo()]
+        _DEVICE = MockDevice()
+        
         def __init__(self, username, password, session, device_direct=True, 
                      refresh_login=True, environment=None):
             self.username = username
@@ -42,32 +70,14 @@ def test_aioaquarea_pattern():
         
         async def get_devices(self, include_long_id=False):
             print(f"✅ get_devices called with include_long_id={include_long_id}")
-            return [MockDeviceInfo()]
+            return self._DEVICES
         
         async def get_device(self, device_info=None, device_id=None, consumption_refresh_interval=None):
             print(f"✅ get_device called with:")
             print(f"   device_info: {device_info is not None}")
             print(f"   device_id: {device_id}")
             print(f"   consumption_refresh_interval: {consumption_refresh_interval}")
-            return MockDevice()
-    
-    class MockDeviceInfo:
-        def __init__(self):
-            self.device_id = "TEST123"
-            self.long_id = "LONG_TEST_123"
-    
-    class MockDevice:
-        def __init__(self):
-            self.device_id = "TEST123"
-        
-        async def refresh_data(self):
-            print("✅ device.refresh_data() called")
-        
-        async def set_mode(self, mode):
-            print(f"✅ device.set_mode({mode}) called - following aioaquarea example!")
-        
-        async def set_tank_target_temperature(self, temperature):
-            print(f"✅ device.set_tank_target_temperature({temperature}) called")
+            return self._DEVICE
     
     # Test the pattern we should be following
     print("\n1. Testing Client Initialization Pattern:")
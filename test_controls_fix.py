@@ -6,15 +6,27 @@ This script tests the enhanced control logic without needing the full Home Assis
 
 import logging
 import json
+import os
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 _LOGGER = logging.getLogger(__name__)
 
+# Decorative output is only printed with PSA_TEST_VERBOSE=1; results are always printed
+_print = print if os.environ.get("PSA_TEST_VERBOSE") == "1" else lambda *args, **kwargs: None
+
+# HVAC mode name, device operation mode and the resulting zone operation status
+_HVAC_MODE_TABLE: tuple[tuple[str, int, int], ...] = (
+    ('heat', 1, 1),
+    ('cool', 2, 1),
+    ('auto', 3, 1),
+    ('off', 0, 0),
+)
+
 def test_water_heater_temperature_control():
     """Test water heater temperature setting logic."""
-    print("\n🚰 Testing Water Heater Temperature Control")
-    print("=" * 50)
+    _print("\n🚰 Testing Water Heater Temperature Control")
+    _print("=" * 50)
     
     # Simulate device data structure
     device_data = {
@@ -31,35 +43,40 @@ def test_water_heater_temperature_control():
         }
     }
     
+    # Bind the tank dict once and update it in place
+    tank = device_data['raw_data']['status']['tankStatus']
+    
     # Test temperature validation
     test_temperatures = [35, 45, 65, 80]  # Below min, valid, valid, above max
     
+    # Select the in-range temperatures up front; rejected ones are reported first
+    valid_temperatures = [t for t in test_temperatures if 40 <= t <= 75]
     for temperature in test_temperatures:
-        print(f"\n🌡️  Setting temperature to {temperature}°C...")
-        
-        # Validate temperature
-        if temperature < 40 or temperature > 75:
-            print(f"❌ Temperature {temperature}°C is outside valid range (40-75°C)")
-            continue
+        if not 40 <= temperature <= 75:
+            _print(f"\n🌡️  Setting temperature to {temperature}°C...")
+            _print(f"❌ Temperature {temperature}°C is outside valid range (40-75°C)")
+    
+    for temperature in valid_temperatures:
+        _print(f"\n🌡️  Setting temperature to {temperature}°C...")
         
         # Get old value
-        old_temp = device_data['raw_data']['status']['tankStatus']['heatSet']
+        old_temp = tank['heatSet']
         
         # Update immediately
-        device_data['raw_data']['status']['tankStatus']['heatSet'] = float(temperature)
+        tank['heatSet'] = float(temperature)
         
         # Log the change
-        print(f"✅ IMMEDIATE UPDATE: Tank target temperature {old_temp}°C → {temperature}°C")
-        print(f"✅ UI would update immediately with new temperature {temperature}°C")
-        print("ℹ️  No real API available - using local simulation (UI already updated)")
+        _print(f"✅ IMMEDIATE UPDATE: Tank target temperature {old_temp}°C → {temperature}°C")
+        _print(f"✅ UI would update immediately with new temperature {temperature}°C")
+        _print("ℹ️  No real API available - using local simulation (UI already updated)")
     
-    print(f"\n📊 Final tank status: {device_data['raw_data']['status']['tankStatus']}")
+    _print(f"\n📊 Final tank status: {tank}")
     return True
 
 def test_water_heater_on_off_control():
     """Test water heater on/off control logic."""
-    print("\n🔛 Testing Water Heater On/Off Control")
-    print("=" * 50)
+    _print("\n🔛 Testing Water Heater On/Off Control")
+    _print("=" * 50)
     
     # Simulate device data structure
     device_data = {
@@ -74,27 +91,30 @@ def test_water_heater_on_off_control():
         }
     }
     
+    # Bind the tank dict once and update it in place
+    tank = device_data['raw_data']['status']['tankStatus']
+    
     # Test turning ON
-    print("🔛 Turning water heater ON...")
-    old_status = device_data['raw_data']['status']['tankStatus']['operationStatus']
-    device_data['raw_data']['status']['tankStatus']['operationStatus'] = 1
-    print(f"✅ IMMEDIATE UPDATE: Tank operation status {old_status} → 1 (ON)")
-    print("✅ UI updated immediately - water heater ON")
+    _print("🔛 Turning water heater ON...")
+    old_status = tank['operationStatus']
+    tank['operationStatus'] = 1
+    _print(f"✅ IMMEDIATE UPDATE: Tank operation status {old_status} → 1 (ON)")
+    _print("✅ UI updated immediately - water heater ON")
     
     # Test turning OFF
-    print("\n⏹️  Turning water heater OFF...")
-    old_status = device_data['raw_data']['status']['tankStatus']['operationStatus']
-    device_data['raw_data']['status']['tankStatus']['operationStatus'] = 0
-    print(f"✅ IMMEDIATE UPDATE: Tank operation status {old_status} → 0 (OFF)")
-    print("✅ UI updated immediately - water heater OFF")
+    _print("\n⏹️  Turning water heater OFF...")
+    old_status = tank['operationStatus']
+    tank['operationStatus'] = 0
+    _print(f"✅ IMMEDIATE UPDATE: Tank operation status {old_status} → 0 (OFF)")
+    _print("✅ UI updated immediately - water heater OFF")
     
-    print(f"\n📊 Final tank status: {device_data['raw_data']['status']['tankStatus']}")
+    _print(f"\n📊 Final tank status: {tank}")
     return True
 
 def test_climate_temperature_control():
     """Test climate zone temperature setting logic."""
-    print("\n🌡️  Testing Climate Temperature Control")
-    print("=" * 50)
+    _print("\n🌡️  Testing Climate Temperature Control")
+    _print("=" * 50)
     
     # Simulate device data structure
     device_data = {
@@ -111,46 +131,47 @@ def test_climate_temperature_control():
         }
     }
     
+    status = device_data['raw_data']['status']
+    zones_by_id = {zone['zoneId']: zone for zone in status['zoneStatus']}
     zone_id = 1
     test_temperatures = [-2, 18, 25, 35]  # Below range, valid, valid, above range
     
+    # Select the in-range temperatures up front; rejected ones are reported first
+    valid_temperatures = [t for t in test_temperatures if -5 <= t <= 30]
     for temperature in test_temperatures:
-        print(f"\n🏠 Setting zone {zone_id} temperature to {temperature}°C...")
-        
-        # Validate temperature
-        if temperature < -5 or temperature > 30:
-            print(f"❌ Temperature {temperature}°C is outside valid range (-5 to 30°C)")
-            continue
+        if not -5 <= temperature <= 30:
+            _print(f"\n🏠 Setting zone {zone_id} temperature to {temperature}°C...")
+            _print(f"❌ Temperature {temperature}°C is outside valid range (-5 to 30°C)")
+    
+    # The zone does not change between temperatures, so find it once
+    zone_status = zones_by_id.get(zone_id)
+    
+    for temperature in valid_temperatures:
+        _print(f"\n🏠 Setting zone {zone_id} temperature to {temperature}°C...")
         
-        # Find the zone
-        zone_status = None
-        for zone in device_data['raw_data']['status']['zoneStatus']:
-            if zone['zoneId'] == zone_id:
-                zone_status = zone
-                break
+        target_temp_tenths = int(temperature * 10)
         
         if zone_status:
             # Calculate heat offset
             current_temp = zone_status['temperatureNow']  # In tenths
-            target_temp_tenths = int(temperature * 10)
             heat_offset = target_temp_tenths - current_temp
             
             old_heat_set = zone_status['heatSet']
             zone_status['heatSet'] = heat_offset
             
-            print(f"✅ IMMEDIATE UPDATE: Zone {zone_id} offset {old_heat_set} → {heat_offset}")
-            print(f"   (target: {temperature}°C, current: {current_temp/10.0}°C)")
-            print(f"✅ UI updated immediately with new temperature {temperature}°C")
+            _print(f"✅ IMMEDIATE UPDATE: Zone {zone_id} offset {old_heat_set} → {heat_offset}")
+            _print(f"   (target: {temperature}°C, current: {current_temp/10.0}°C)")
+            _print(f"✅ UI updated immediately with new temperature {temperature}°C")
         else:
-            print(f"❌ Zone {zone_id} not found")
+            _print(f"❌ Zone {zone_id} not found")
     
-    print(f"\n📊 Final zone status: {device_data['raw_data']['status']['zoneStatus'][0]}")
+    _print(f"\n📊 Final zone status: {status['zoneStatus'][0]}")
     return True
 
 def test_climate_hvac_mode_control():
     """Test climate HVAC mode control logic."""
-    print("\n🌡️  Testing Climate HVAC Mode Control")
-    print("=" * 50)
+    _print("\n🌡️  Testing Climate HVAC Mode Control")
+    _print("=" * 50)
     
     # Simulate device data structure
     device_data = {
@@ -166,42 +187,36 @@ def test_climate_hvac_mode_control():
         }
     }
     
+    status = device_data['raw_data']['status']
+    zones_by_id = {zone['zoneId']: zone for zone in status['zoneStatus']}
     zone_id = 1
     
     # Test different HVAC modes
-    hvac_modes = [
-        ('heat', 1),
-        ('cool', 2), 
-        ('auto', 3),
-        ('off', 0)
-    ]
-    
-    for hvac_mode_name, operation_mode_value in hvac_modes:
-        print(f"\n🔄 Setting HVAC mode to {hvac_mode_name.upper()}...")
+    for hvac_mode_name, operation_mode_value, zone_operation_status in _HVAC_MODE_TABLE:
+        _print(f"\n🔄 Setting HVAC mode to {hvac_mode_name.upper()}...")
         
-        old_operation_mode = device_data['raw_data']['status']['operationMode']
+        old_operation_mode = status['operationMode']
         
         # Update operation mode immediately
-        device_data['raw_data']['status']['operationMode'] = operation_mode_value
-        print(f"✅ IMMEDIATE UPDATE: Operation mode {old_operation_mode} → {operation_mode_value} ({hvac_mode_name})")
+        status['operationMode'] = operation_mode_value
+        _print(f"✅ IMMEDIATE UPDATE: Operation mode {old_operation_mode} → {operation_mode_value} ({hvac_mode_name})")
         
         # Update zone operation status
-        for zone_status in device_data['raw_data']['status']['zoneStatus']:
-            if zone_status['zoneId'] == zone_id:
-                old_zone_status = zone_status['operationStatus']
-                zone_status['operationStatus'] = 1 if hvac_mode_name != 'off' else 0
-                print(f"✅ Zone {zone_id} operation status {old_zone_status} → {zone_status['operationStatus']}")
-                break
+        zone_status = zones_by_id.get(zone_id)
+        if zone_status:
+            old_zone_status = zone_status['operationStatus']
+            zone_status['operationStatus'] = zone_operation_status
+            _print(f"✅ Zone {zone_id} operation status {old_zone_status} → {zone_status['operationStatus']}")
         
-        print(f"✅ UI updated immediately with HVAC mode {hvac_mode_name.upper()}")
+        _print(f"✅ UI updated immediately with HVAC mode {hvac_mode_name.upper()}")
     
-    print(f"\n📊 Final status: {device_data['raw_data']['status']}")
+    _print(f"\n📊 Final status: {status}")
     return True
 
 def test_activity_logging():
     """Test activity logging functionality."""
-    print("\n📝 Testing Activity Logging")
-    print("=" * 50)
+    _print("\n📝 Testing Activity Logging")
+    _print("=" * 50)
     
     # Simulate activity log messages that would be generated
     activities = [
@@ -213,7 +228,7 @@ def test_activity_logging():
     
     for device_type, action, old_value, new_value in activities:
         message = f"{device_type} {action}: {old_value} → {new_value}"
-        print(f"📝 Activity Log: {message}")
+        _print(f"📝 Activity Log: {message}")
         
         # This would also fire a Home Assistant event:
         event_data = {
@@ -222,7 +237,7 @@ def test_activity_logging():
             "old_value": old_value,
             "new_value": new_value,
         }
-        print(f"   Event: panasonic_aquarea_action {event_data}")
+        _print(f"   Event: panasonic_aquarea_action {event_data}")
     
     return True
 
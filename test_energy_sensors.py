@@ -4,138 +4,107 @@ Test script for energy monitoring sensors.
 This will test the energy calculation logic without requiring Home Assistant.
 """
 
-class MockCoordinator:
-    def __init__(self, device_data):
-        self.data = {"test_device": device_data}
+from bisect import bisect_right
+from itertools import product
 
-class MockEnergyTestSensor:
-    """Mock sensor to test energy calculation logic."""
-    
-    def __init__(self, coordinator, device_id):
-        self.coordinator = coordinator
-        self._device_id = device_id
+# Heating COP at these outdoor temperatures, interpolated in between
+_COP_CURVE_TEMPS = (-15, -10, -5, 0, 5, 10)
+_COP_CURVE_VALUES = (2.0, 2.5, 3.0, 3.5, 4.0, 4.5)
 
-def test_power_consumption_calculation():
-    """Test power consumption calculation logic."""
-    print("=== Power Consumption Calculation Test ===")
-    
-    # Test case 1: Heating mode with moderate pump duty
-    test_data_1 = {
-        "raw_data": {
-            "status": {
-                "operationMode": 1,  # Heat
-                "pumpDuty": 2,
-                "powerful": 0,
-                "forceHeater": 0
-            }
-        }
-    }
-    
-    coordinator_1 = MockCoordinator(test_data_1)
-    
-    # Simulate the power calculation logic
-    raw_data = test_data_1["raw_data"]
-    operation_mode = raw_data['status'].get('operationMode', 0)
-    pump_duty = raw_data['status'].get('pumpDuty', 0)
-    powerful = raw_data['status'].get('powerful', 0)
-    force_heater = raw_data['status'].get('forceHeater', 0)
-    
-    base_power = 0
-    
-    if operation_mode == 0:  # Off
-        base_power = 50  # Standby power
-    elif operation_mode == 1:  # Heat mode
-        base_power = 1500 + (pump_duty * 500)  # 1.5-2.5kW typical for heating
-    elif operation_mode == 2:  # Cool mode
-        base_power = 1200 + (pump_duty * 400)  # Slightly less for cooling
-    else:
-        base_power = 800  # Other modes
+def _interpolate_cop(outdoor_temp):
+    """Linearly interpolate the COP curve, as the COP sensor does."""
+    index = bisect_right(_COP_CURVE_TEMPS, outdoor_temp)
+    if index == 0:
+        return _COP_CURVE_VALUES[0]
+    if index == len(_COP_CURVE_TEMPS):
+        return _COP_CURVE_VALUES[-1]
+    low_temp, high_temp = _COP_CURVE_TEMPS[index - 1], _COP_CURVE_TEMPS[index]
+    low_cop, high_cop = _COP_CURVE_VALUES[index - 1], _COP_CURVE_VALUES[index]
+    return low_cop + (high_cop - low_cop) * (outdoor_temp - low_temp) / (high_temp - low_temp)
+
+# (base watts, watts per pump duty step) for off, heat and cool mode
+_POWER_BY_MODE = {0: (50, 0), 1: (1500, 500), 2: (1200, 400)}
+_POWER_DEFAULT = (800, 0)  # Other modes
+
+def _calc_power(operation_mode, pump_duty, powerful, force_heater):
+    """Estimate power consumption in watts, as the power sensor does."""
+    mode_power, duty_power = _POWER_BY_MODE.get(operation_mode, _POWER_DEFAULT)
+    base_power = mode_power + pump_duty * duty_power
         
     # Adjust for special modes
     if powerful == 1:
         base_power *= 1.3  # Powerful mode uses more energy
     if force_heater == 1:
         base_power += 3000  # Electric heater adds significant consumption
-        
-    calculated_power = round(base_power, 1)
     
-    print(f"Test Case 1 - Normal Heating:")
-    print(f"  Operation Mode: {operation_mode} (Heat)")
-    print(f"  Pump Duty: {pump_duty}")
-    print(f"  Powerful Mode: {powerful}")
-    print(f"  Electric Heater: {force_heater}")
-    print(f"  Calculated Power: {calculated_power}W")
-    print(f"  Expected Range: 2500W (1500 + 2*500)")
-    
-    assert calculated_power == 2500.0, f"Expected 2500W, got {calculated_power}W"
+    return base_power
+
+# (name, operationMode, pumpDuty, powerful, forceHeater, expected watts, expected note)
+_POWER_CASES = (
+    ("Normal Heating", 1, 2, 0, 0, 2500.0, "2500W (1500 + 2*500)"),
+    ("Powerful Mode + Electric Heater", 1, 3, 1, 1, ((1500 + 3 * 500) * 1.3) + 3000, "~6900W ((1500+3*500)*1.3+3000)"),
+    ("Standby Mode", 0, 0, 0, 0, 50.0, "50W"),
+)
+
+def test_power_consumption_calculation():
+    """Test power consumption calculation logic."""
+    print("=== Power Consumption Calculation Test ===")
     
-    # Test case 2: Powerful mode with electric heater
-    test_data_2 = {
-        "raw_data": {
-            "status": {
-                "operationMode": 1,  # Heat
-                "pumpDuty": 3,
-                "powerful": 1,       # Powerful mode active
-                "forceHeater": 1     # Electric heater active
+    for case_number, (name, mode, duty, powerful_flag, heater, expected_power, note) in enumerate(_POWER_CASES, 1):
+        test_data = {
+            "raw_data": {
+                "status": {
+                    "operationMode": mode,
+                    "pumpDuty": duty,
+                    "powerful": powerful_flag,
+                    "forceHeater": heater
+                }
             }
         }
-    }
-    
-    raw_data = test_data_2["raw_data"]
-    operation_mode = raw_data['status'].get('operationMode', 0)
-    pump_duty = raw_data['status'].get('pumpDuty', 0)
-    powerful = raw_data['status'].get('powerful', 0)
-    force_heater = raw_data['status'].get('forceHeater', 0)
-    
-    base_power = 1500 + (pump_duty * 500)  # Base heating power
-    
-    if powerful == 1:
-        base_power *= 1.3  # +30% for powerful mode
-    if force_heater == 1:
-        base_power += 3000  # +3000W for electric heater
         
-    calculated_power = round(base_power, 1)
-    
-    print(f"\nTest Case 2 - Powerful Mode + Electric Heater:")
-    print(f"  Operation Mode: {operation_mode} (Heat)")
-    print(f"  Pump Duty: {pump_duty}")
-    print(f"  Powerful Mode: {powerful}")
-    print(f"  Electric Heater: {force_heater}")
-    print(f"  Calculated Power: {calculated_power}W")
-    print(f"  Expected: ~6900W ((1500+3*500)*1.3+3000)")
-    
-    expected_power = ((1500 + 3 * 500) * 1.3) + 3000
-    assert abs(calculated_power - expected_power) < 1, f"Expected {expected_power}W, got {calculated_power}W"
-    
-    # Test case 3: Standby mode
-    test_data_3 = {
-        "raw_data": {
-            "status": {
-                "operationMode": 0,  # Off
-                "pumpDuty": 0,
-                "powerful": 0,
-                "forceHeater": 0
-            }
-        }
-    }
-    
-    raw_data = test_data_3["raw_data"]
-    operation_mode = raw_data['status'].get('operationMode', 0)
-    
-    if operation_mode == 0:
-        base_power = 50  # Standby power
-    
-    calculated_power = round(base_power, 1)
-    
-    print(f"\nTest Case 3 - Standby Mode:")
-    print(f"  Operation Mode: {operation_mode} (Off)")
-    print(f"  Calculated Power: {calculated_power}W")
-    print(f"  Expected: 50W")
-    
-    assert calculated_power == 50.0, f"Expected 50W, got {calculated_power}W"
+        # Simulate the power calculation logic
+        status = test_data["raw_data"]["status"]
+        operation_mode = status.get('operationMode', 0)
+        pump_duty = status.get('pumpDuty', 0)
+        powerful = status.get('powerful', 0)
+        force_heater = status.get('forceHeater', 0)
+        
+        calculated_power = round(_calc_power(operation_mode, pump_duty, powerful, force_heater), 1)
+        
+        print(f"\nTest Case {case_number} - {name}:")
+        print(f"  Operation Mode: {operation_mode}")
+        print(f"  Pump Duty: {pump_duty}")
+        print(f"  Powerful Mode: {powerful}")
+        print(f"  Electric Heater: {force_heater}")
+        print(f"  Calculated Power: {calculated_power}W")
+        print(f"  Expected: {note}")
+        
+        assert abs(calculated_power - expected_power) < 1, f"Expected {expected_power}W, got {calculated_power}W"
     
     print("\n✅ All power consumption tests passed!")
 
+def test_power_consumption_properties():
+    """Check the power estimate over every mode, duty and flag combination."""
+    print("\n=== Power Consumption Property Test ===")
+    
+    combinations = 0
+    for mode, duty, powerful, heater in product(range(4), range(8), (0, 1), (0, 1)):
+        case = (mode, duty, powerful, heater)
+        power = _calc_power(mode, duty, powerful, heater)
+        combinations += 1
+        
+        assert power > 0, f"Non-positive power {power}W for {case}"
+        if duty:
+            assert power >= _calc_power(mode, duty - 1, powerful, heater), f"Power drops with pump duty for {case}"
+        if powerful:
+            assert power >= _calc_power(mode, duty, 0, heater), f"Powerful mode uses less power for {case}"
+        if heater:
+            # The electric heater element adds its 3 kW on top of everything else
+            assert abs(power - _calc_power(mode, duty, powerful, 0) - 3000) < 1e-9, f"Heater does not add 3000W for {case}"
+    
+    print(f"  Checked {combinations} combinations")
+    print("\n✅ All power consumption property tests passed!")
+
 def test_cop_calculation():
     """Test COP calculation logic."""
     print("\n=== COP Calculation Test ===")
@@ -143,11 +112,13 @@ def test_cop_calculation():
     # Test different outdoor temperatures
     test_cases = [
         (15, 1, 0, 4.5),      # 15°C, heat mode, normal → COP 4.5
-        (7, 1, 0, 4.0),       # 7°C, heat mode, normal → COP 4.0  
-        (2, 1, 0, 3.5),       # 2°C, heat mode, normal → COP 3.5
-        (-3, 1, 0, 3.0),      # -3°C, heat mode, normal → COP 3.0
-        (-8, 1, 0, 2.5),      # -8°C, heat mode, normal → COP 2.5
+        (7, 1, 0, 4.2),       # 7°C, heat mode, normal → COP 4.2  
+        (2, 1, 0, 3.7),       # 2°C, heat mode, normal → COP 3.7
+        (0, 1, 0, 3.5),       # 0°C, heat mode, normal → COP 3.5
+        (-3, 1, 0, 3.2),      # -3°C, heat mode, normal → COP 3.2
+        (-8, 1, 0, 2.7),      # -8°C, heat mode, normal → COP 2.7
         (-15, 1, 0, 2.0),     # -15°C, heat mode, normal → COP 2.0
+        (-20, 1, 0, 2.0),     # -20°C, heat mode, normal → COP 2.0
         (10, 1, 1, 3.825),    # 10°C, heat mode, powerful → COP 4.5*0.85 = 3.825
         (5, 2, 0, None),      # 5°C, cool mode → No COP for cooling
     ]
@@ -157,18 +128,7 @@ def test_cop_calculation():
         if operation_mode != 1:  # Only calculate COP for heating mode
             calculated_cop = None
         else:
-            if outdoor_temp >= 10:
-                base_cop = 4.5
-            elif outdoor_temp >= 5:
-                base_cop = 4.0
-            elif outdoor_temp >= 0:
-                base_cop = 3.5
-            elif outdoor_temp >= -5:
-                base_cop = 3.0
-            elif outdoor_temp >= -10:
-                base_cop = 2.5
-            else:
-                base_cop = 2.0
+            base_cop = _interpolate_cop(outdoor_temp)
                 
             # Adjust for powerful mode (less efficient)
             if powerful == 1:
@@ -183,6 +143,14 @@ def test_cop_calculation():
         else:
             assert abs(calculated_cop - expected_cop) < 0.01, f"Expected {expected_cop}, got {calculated_cop}"
     
+    # The curve is continuous, rising and bounded across the whole range
+    previous = _interpolate_cop(-25)
+    for outdoor_temp in range(-24, 21):
+        cop = _interpolate_cop(outdoor_temp)
+        assert previous <= cop <= previous + 0.1 + 1e-9, f"COP jumps from {previous} to {cop} at {outdoor_temp}°C"
+        assert 2.0 <= cop <= 4.5, f"COP {cop} out of range at {outdoor_temp}°C"
+        previous = cop
+    
     print("\n✅ All COP calculation tests passed!")
 
 def main():
@@ -192,6 +160,7 @@ def main():
     
     try:
         test_power_consumption_calculation()
+        test_power_consumption_properties()
         test_cop_calculation()
         
         print("\n🎉 All tests passed successfully!")
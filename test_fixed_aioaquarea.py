@@ -4,37 +4,45 @@ Test Fixed aioaquarea Client Usage
 Test the corrected aioaquarea client calls without unsupported parameters.
 """
 
-def test_fixed_aioaquarea_usage():
-    """Test the corrected aioaquarea usage."""
+import asyncio
+
+# Mock aioaquarea for testing the corrected pattern
+class MockDeviceInfo:
+    __slots__ = ("device_id",)
     
-    print("=== Testing Fixed aioaquarea Client Usage ===")
+    def __init__(self):
+        self.device_id = "TEST123"
+
+class MockDevice:
+    __slots__ = ()
     
-    # Mock aioaquarea for testing the corrected pattern
-    class MockClient:
-        def __init__(self, username, password, session, device_direct=True, 
-                     refresh_login=True, environment=None):
-            print("✅ Client created successfully")
-        
-        async def get_devices(self):
-            """Mock get_devices - no include_long_id parameter."""
-            print("✅ get_devices() called (no extra parameters)")
-            return [MockDeviceInfo()]
-        
-        async def get_device(self, device_info=None, device_id=None):
-            """Mock get_device - no consumption_refresh_interval parameter."""
-            print("✅ get_device() called with device_info only")
-            return MockDevice()
+    async def refresh_data(self):
+        print("✅ device.refresh_data() called")
+    
+    async def set_mode(self, mode):
+        print(f"✅ device.set_mode({mode}) called")
+
+class MockClient:
+    __slots__ = ()
     
-    class MockDeviceInfo:
-        def __init__(self):
-            self.device_id = "TEST123"
+    def __init__(self, username, password, session, device_direct=True, 
+                 refresh_login=True, environment=None):
+        print("✅ Client created successfully")
     
-    class MockDevice:
-        async def refresh_data(self):
-            print("✅ device.refresh_data() called")
-        
-        async def set_mode(self, mode):
-            print(f"✅ device.set_mode({mode}) called")
+    async def get_devices(self):
+        """Mock get_devices - no include_long_id parameter."""
+        print("✅ get_devices() called (no extra parameters)")
+        return [MockDeviceInfo()]
+    
+    async def get_device(self, device_info=None, device_id=None):
+        """Mock get_device - no consumption_refresh_interval parameter."""
+        print("✅ get_device() called with device_info only")
+        return MockDevice()
+
+def test_fixed_aioaquarea_usage():
+    """Test the corrected aioaquarea usage."""
+    
+    print("=== Testing Fixed aioaquarea Client Usage ===")
     
     async def test_corrected_pattern():
         """Test the corrected pattern that should work."""
@@ -81,7 +89,6 @@ def test_fixed_aioaquarea_usage():
     
     print("\n=== Integration Should Now Load Successfully! ===")
     
-    import asyncio
     asyncio.run(test_corrected_pattern())
 
 if __name__ == "__main__":
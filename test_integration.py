@@ -15,11 +15,15 @@ def test_integration_structure():
     print("🧪 Testing Home Assistant Integration Structure")
     print("=" * 50)
     
+    # List the integration directory once instead of probing each file
+    with os.scandir(base_path) as entries:
+        present = {entry.name: entry for entry in entries}
+    
     # Test manifest.json
-    manifest_path = base_path / "manifest.json"
-    if manifest_path.exists():
+    manifest_entry = present.get("manifest.json")
+    if manifest_entry is not None:
         try:
-            with open(manifest_path) as f:
+            with open(manifest_entry.path) as f:
                 manifest = json.load(f)
             print(f"✅ manifest.json is valid")
             print(f"   Domain: {manifest['domain']}")
@@ -42,9 +46,9 @@ def test_integration_structure():
     
     print(f"\n📁 Checking required files:")
     for file in required_files:
-        file_path = base_path / file
-        if file_path.exists():
-            size = file_path.stat().st_size
+        entry = present.get(file)
+        if entry is not None:
+            size = entry.stat().st_size
             print(f"✅ {file} ({size} bytes)")
         else:
             print(f"❌ {file} missing")
@@ -52,15 +56,13 @@ def test_integration_structure():
     # Test Python imports (basic syntax check)
     print(f"\n🐍 Testing Python syntax:")
     for file in required_files:
-        if file.endswith('.py'):
-            file_path = base_path / file
-            if file_path.exists():
-                try:
-                    with open(file_path) as f:
-                        compile(f.read(), file, 'exec')
-                    print(f"✅ {file} syntax OK")
-                except SyntaxError as e:
-                    print(f"❌ {file} syntax error: {e}")
+        if file.endswith('.py') and file in present:
+            try:
+                with open(present[file].path) as f:
+                    compile(f.read(), file, 'exec')
+                print(f"✅ {file} syntax OK")
+            except SyntaxError as e:
+                print(f"❌ {file} syntax error: {e}")
     
     print(f"\n📊 Integration Summary:")
     print(f"   📂 Integration path: {base_path}")
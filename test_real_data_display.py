@@ -66,8 +66,12 @@ def display_real_temperature_values():
     print("🎯 Real Data Temperature Display")
     print("=" * 50)
     
+    # Bind the status subtrees once
+    status = real_device_data['status']
+    zone_status = status['zoneStatus'][0]
+    tank_status = status['tankStatus']
+    
     # Zone temperature
-    zone_status = real_device_data['status']['zoneStatus'][0]
     zone_temp_raw = zone_status['temperatureNow']  # 56
     zone_temp_celsius = float(zone_temp_raw) / 10.0  # 5.6°C
     
@@ -76,7 +80,6 @@ def display_real_temperature_values():
     print(f"   Displayed: {zone_temp_celsius}°C")
     
     # Tank temperature  
-    tank_status = real_device_data['status']['tankStatus']
     tank_temp_raw = tank_status['temperatureNow']  # 59
     tank_temp_celsius = float(tank_temp_raw)  # 59°C (already in degrees)
     
@@ -95,10 +98,10 @@ def display_real_temperature_values():
     
     # Other sensors
     print(f"\n📊 Other Sensor Values:")
-    print(f"   Outdoor Temperature: {real_device_data['status']['outdoorNow']}°C")
-    print(f"   Water Pressure: {real_device_data['status']['waterPressure']} bar")
-    print(f"   Pump Duty: {real_device_data['status']['pumpDuty']}%")
-    print(f"   Operation Mode: {real_device_data['status']['operationMode']} (HEAT)")
+    print(f"   Outdoor Temperature: {status['outdoorNow']}°C")
+    print(f"   Water Pressure: {status['waterPressure']} bar")
+    print(f"   Pump Duty: {status['pumpDuty']}%")
+    print(f"   Operation Mode: {status['operationMode']} (HEAT)")
     
     print(f"\n✅ Integration will now display:")
     print(f"   • House Temperature: {zone_temp_celsius}°C")
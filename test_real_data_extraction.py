@@ -15,16 +15,42 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Import once, after setting up logging
+try:
+    from aioaquarea import Client, AquareaEnvironment
+    _AIOAQUAREA_IMPORT_ERROR = None
+except ImportError as e:
+    _AIOAQUAREA_IMPORT_ERROR = e
+
+# Attributes that may hold the raw API response
+_DATA_ATTRS = ('_data', 'data', '_raw_data', 'raw_data', '_response', 'response',
+               '_last_response', 'last_response', '_json', 'json')
+
+def _find_data_attrs(obj):
+    """Return the data attributes of obj, preferring its instance dict.
+
+    Names not set on the instance, such as properties and class attributes,
+    are looked up normally.
+    """
+    try:
+        obj_vars = vars(obj)
+    except TypeError:  # __slots__ only
+        obj_vars = {}
+    found = {}
+    for attr in _DATA_ATTRS:
+        if attr in obj_vars:
+            found[attr] = obj_vars[attr]
+        elif hasattr(obj, attr):
+            found[attr] = getattr(obj, attr)
+    return found
+
 async def test_real_data_extraction():
     """Test the real data extraction functionality."""
     
-    # Import after setting up logging
-    try:
-        from aioaquarea import Client, AquareaEnvironment
-        print("✓ Successfully imported aioaquarea")
-    except ImportError as e:
-        print(f"✗ Failed to import aioaquarea: {e}")
+    if _AIOAQUAREA_IMPORT_ERROR is not None:
+        print(f"✗ Failed to import aioaquarea: {_AIOAQUAREA_IMPORT_ERROR}")
         return
+    print("✓ Successfully imported aioaquarea")
     
     # Test credentials (you may need to update these)
     username = "joachim@dittman.dk"
@@ -63,13 +89,8 @@ async def test_real_data_extraction():
             print("✓ Called device.refresh()")
         
         # Check for any data attributes
-        data_attrs = ['_data', 'data', '_raw_data', 'raw_data', '_response', 'response',
-                     '_last_response', 'last_response', '_json', 'json']
-        
-        for attr in data_attrs:
-            if hasattr(device, attr):
-                value = getattr(device, attr)
-                print(f"device.{attr} = {value} (type: {type(value)})")
+        for attr, value in _find_data_attrs(device).items():
+            print(f"device.{attr} = {value} (type: {type(value)})")
         
         # Check client attributes too
         if hasattr(device, '_client'):
@@ -77,10 +98,8 @@ async def test_real_data_extraction():
             client_attrs = [attr for attr in dir(client_obj) if not attr.startswith('__')]
             print(f"Client attributes: {client_attrs}")
             
-            for attr in data_attrs:
-                if hasattr(client_obj, attr):
-                    value = getattr(client_obj, attr)
-                    print(f"client.{attr} = {value} (type: {type(value)})")
+            for attr, value in _find_data_attrs(client_obj).items():
+                print(f"client.{attr} = {value} (type: {type(value)})")
         
         print("✓ Test completed")
         
@@ -52,21 +52,31 @@ def test_log_capture():
     device_id = "B497204181"
     if device_id in _captured_json_responses:
         captured_data = _captured_json_responses[device_id]
+        # Bind the status subtree once for the summary and the validation
+        status = captured_data.get('status', {})
         print(f"✓ Successfully captured data for device {device_id}")
         print(f"Device name: {captured_data.get('a2wName')}")
-        print(f"Operation mode: {captured_data.get('status', {}).get('operationMode')}")
-        print(f"Outdoor temperature: {captured_data.get('status', {}).get('outdoorNow')}")
-        print(f"Water pressure: {captured_data.get('status', {}).get('waterPressure')}")
-        print(f"Tank temperature: {captured_data.get('status', {}).get('tankStatus', {}).get('temperatureNow')}")
-        print(f"Zone 1 temperature: {captured_data.get('status', {}).get('zoneStatus', [{}])[0].get('temperatureNow')}")
+        print(f"Operation mode: {status.get('operationMode')}")
+        print(f"Outdoor temperature: {status.get('outdoorNow')}")
+        print(f"Water pressure: {status.get('waterPressure')}")
+        print(f"Tank temperature: {status.get('tankStatus', {}).get('temperatureNow')}")
+        print(f"Zone 1 temperature: {status.get('zoneStatus', [{}])[0].get('temperatureNow')}")
         
         # Validate the structure matches what our sensors expect
-        status = captured_data.get('status', {})
         if 'operationMode' in status and 'tankStatus' in status and 'zoneStatus' in status:
             print("✓ Data structure is compatible with our sensors")
         else:
             print("✗ Data structure missing required fields")
         
+        # The same payload logged as real JSON takes the json_loads path
+        json_log_message = f"Raw JSON response for device {device_id}: {json.dumps(captured_data)}"
+        del _captured_json_responses[device_id]
+        _log_capture_handler.emit(MockLogRecord(json_log_message))
+        if _captured_json_responses.get(device_id) != captured_data:
+            print(f"✗ JSON payload for device {device_id} did not round-trip")
+            return False
+        print("✓ JSON payload captured identically")
+        
         return True
     else:
         print(f"✗ Failed to capture data for device {device_id}")
@@ -136,20 +146,28 @@ def test_real_data_structure():
         }
     }
     
-    print("Real data structure validation:")
-    print(f"✓ Device name: {real_data['a2wName']}")
-    print(f"✓ Operation mode: {real_data['status']['operationMode']}")
-    print(f"✓ Outdoor temp: {real_data['status']['outdoorNow']}°C")
-    print(f"✓ Water pressure: {real_data['status']['waterPressure']} bar")
-    print(f"✓ Tank temp: {real_data['status']['tankStatus']['temperatureNow']}°C")
-    print(f"✓ Tank set temp: {real_data['status']['tankStatus']['heatSet']}°C") 
-    print(f"✓ Zone 1 temp: {real_data['status']['zoneStatus'][0]['temperatureNow']}°C")
-    print(f"✓ Zone 1 set temp: {real_data['status']['zoneStatus'][0]['heatSet']}°C")
-    print(f"✓ Pump duty: {real_data['status']['pumpDuty']}")
+    # Bind the status subtrees once
+    status = real_data['status']
+    zone0 = status['zoneStatus'][0]
+    tank_status = status['tankStatus']
+    
+    # Write the validation block in one go
+    print("\n".join((
+        "Real data structure validation:",
+        f"✓ Device name: {real_data['a2wName']}",
+        f"✓ Operation mode: {status['operationMode']}",
+        f"✓ Outdoor temp: {status['outdoorNow']}°C",
+        f"✓ Water pressure: {status['waterPressure']} bar",
+        f"✓ Tank temp: {tank_status['temperatureNow']}°C",
+        f"✓ Tank set temp: {tank_status['heatSet']}°C",
+        f"✓ Zone 1 temp: {zone0['temperatureNow']}°C",
+        f"✓ Zone 1 set temp: {zone0['heatSet']}°C",
+        f"✓ Pump duty: {status['pumpDuty']}",
+    )))
     
     # Test energy monitoring calculations
-    operation_mode = real_data['status']['operationMode']  # 1 = heating
-    pump_duty = real_data['status']['pumpDuty']  # 1 = active
+    operation_mode = status['operationMode']  # 1 = heating
+    pump_duty = status['pumpDuty']  # 1 = active
     
     # Estimate power consumption
     if operation_mode == 1 and pump_duty == 1:  # Heating and pump active
@@ -162,7 +180,6 @@ def test_real_data_structure():
     print(f"✓ Estimated power consumption: {estimated_power}W")
     
     # Test water heater temperature setting capability
-    tank_status = real_data['status']['tankStatus']
     current_temp = tank_status['temperatureNow']  # 61°C
     set_temp = tank_status['heatSet']  # 60°C  
     min_temp = tank_status['heatMin']  # 40°C
@@ -179,18 +196,20 @@ if __name__ == "__main__":
     success2 = test_real_data_structure()
     
     if success1 and success2:
-        print("\n✅ All tests passed! Integration should now work with real data.")
-        print("\nKey improvements made:")
-        print("1. Added log capture to intercept aioaquarea JSON responses")
-        print("2. Enhanced device attribute scanning with debug logging")
-        print("3. Updated fallback data to match your real device response")
-        print("4. Added client and session object inspection")
-        print("5. Added device refresh calls to trigger fresh API requests")
-        print("\nThe integration should now:")
-        print("- Capture real JSON data when aioaquarea logs it")
-        print("- Show detailed debug info about available device attributes") 
-        print("- Use accurate real data structure as fallback")
-        print("- Properly extract temperature and energy data")
-        print("- Support water heater temperature control")
+        print("\n".join((
+            "\n✅ All tests passed! Integration should now work with real data.",
+            "\nKey improvements made:",
+            "1. Added log capture to intercept aioaquarea JSON responses",
+            "2. Enhanced device attribute scanning with debug logging",
+            "3. Updated fallback data to match your real device response",
+            "4. Added client and session object inspection",
+            "5. Added device refresh calls to trigger fresh API requests",
+            "\nThe integration should now:",
+            "- Capture real JSON data when aioaquarea logs it",
+            "- Show detailed debug info about available device attributes",
+            "- Use accurate real data structure as fallback",
+            "- Properly extract temperature and energy data",
+            "- Support water heater temperature control",
+        )))
     else:
         print("\n❌ Some tests failed. Please check the implementation.")
\ No newline at end of file
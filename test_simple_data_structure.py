@@ -5,18 +5,49 @@ Tests the data structure parsing without Home Assistant dependencies.
 """
 
 import re
-import ast
+from bisect import bisect_right
+
+from log_payload import parse_log_payload
+
+# Your actual log message
+_SAMPLE_LOG_MESSAGE = "Raw JSON response for device B497204181: {'operation': 'FFFFFFFF', 'ownerFlg': True, 'a2wName': 'Langagervej', 'step2ApplicationStatusFlg': False, 'status': {'serviceType': 'STD_ADP-TAW1', 'uncontrollableTaw1Flg': False, 'operationMode': 1, 'coolMode': 1, 'direction': 2, 'quietMode': 0, 'powerful': 0, 'forceDHW': 0, 'forceHeater': 0, 'tank': 1, 'multiOdConnection': 0, 'pumpDuty': 1, 'bivalent': 0, 'bivalentActual': 0, 'waterPressure': 2.18, 'electricAnode': 0, 'deiceStatus': 0, 'specialStatus': 2, 'outdoorNow': 7, 'holidayTimer': 0, 'modelSeriesSelection': 5, 'standAlone': 1, 'controlBox': 0, 'externalHeater': 0, 'zoneStatus': [{'zoneId': 1, 'zoneName': 'House', 'zoneType': 0, 'zoneSensor': 0, 'operationStatus': 1, 'temperatureNow': 49, 'heatMin': -5, 'heatMax': 5, 'coolMin': -5, 'coolMax': 5, 'heatSet': 5, 'coolSet': 0, 'ecoHeat': -5, 'ecoCool': 5, 'comfortHeat': 5, 'comfortCool': -5}], 'tankStatus': {'operationStatus': 1, 'temperatureNow': 61, 'heatMin': 40, 'heatMax': 75, 'heatSet': 60}}}"
+
+# Device ID and payload of an aioaquarea raw response log line
+_LOG_RE = re.compile(r"Raw JSON response for device ([A-Z0-9]+): (\{.+\})\Z", re.DOTALL)
+
+# Outdoor temperature breakpoints and the heating power in each bin: higher
+# in freezing conditions, medium when cold, lower when mild
+_POWER_TEMP_EDGES = (0, 5)
+_HEATING_POWER = (4500, 3500, 2500)
+
+# Outdoor temperature breakpoints and the simplified COP in each bin, from
+# very cold weather up to mild weather
+_COP_TEMP_EDGES = (-2, 2, 7)
+_COP_BY_BIN = (2.2, 3.0, 3.8, 4.5)
+
+def _estimate_energy(operation_mode, pump_duty, outdoor_temp, tank_heating, runtime_hours):
+    """Return (power W, COP, daily energy kWh) for the given operating state."""
+    # Power estimation based on operation mode and conditions
+    if operation_mode == 1 and pump_duty == 1:  # Heating mode, pump active
+        # Base heating power, adjusted for outdoor temperature, plus DHW heating
+        total_power = _HEATING_POWER[bisect_right(_POWER_TEMP_EDGES, outdoor_temp)]
+        if tank_heating:
+            total_power += 1500
+    else:
+        total_power = 150  # Standby power
+    
+    # Simplified COP calculation based on outdoor temperature
+    cop = _COP_BY_BIN[bisect_right(_COP_TEMP_EDGES, outdoor_temp)]
+    
+    return total_power, cop, (total_power * runtime_hours) / 1000
 
 def test_json_parsing():
     """Test parsing the JSON data from aioaquarea log format."""
     
     print("=== Testing JSON Parsing from Log Format ===")
     
-    # Your actual log message
-    log_message = "Raw JSON response for device B497204181: {'operation': 'FFFFFFFF', 'ownerFlg': True, 'a2wName': 'Langagervej', 'step2ApplicationStatusFlg': False, 'status': {'serviceType': 'STD_ADP-TAW1', 'uncontrollableTaw1Flg': False, 'operationMode': 1, 'coolMode': 1, 'direction': 2, 'quietMode': 0, 'powerful': 0, 'forceDHW': 0, 'forceHeater': 0, 'tank': 1, 'multiOdConnection': 0, 'pumpDuty': 1, 'bivalent': 0, 'bivalentActual': 0, 'waterPressure': 2.18, 'electricAnode': 0, 'deiceStatus': 0, 'specialStatus': 2, 'outdoorNow': 7, 'holidayTimer': 0, 'modelSeriesSelection': 5, 'standAlone': 1, 'controlBox': 0, 'externalHeater': 0, 'zoneStatus': [{'zoneId': 1, 'zoneName': 'House', 'zoneType': 0, 'zoneSensor': 0, 'operationStatus': 1, 'temperatureNow': 49, 'heatMin': -5, 'heatMax': 5, 'coolMin': -5, 'coolMax': 5, 'heatSet': 5, 'coolSet': 0, 'ecoHeat': -5, 'ecoCool': 5, 'comfortHeat': 5, 'comfortCool': -5}], 'tankStatus': {'operationStatus': 1, 'temperatureNow': 61, 'heatMin': 40, 'heatMax': 75, 'heatSet': 60}}}"
-    
     # Parse device ID and JSON data
-    match = re.search(r"Raw JSON response for device ([A-Z0-9]+): ({.+})", log_message)
+    match = _LOG_RE.search(_SAMPLE_LOG_MESSAGE)
     if match:
         device_id = match.group(1)
         json_str = match.group(2)
@@ -25,18 +56,23 @@ def test_json_parsing():
         
         try:
             # Parse the JSON string
-            json_data = ast.literal_eval(json_str)
+            json_data = parse_log_payload(json_str)
             print("✓ Successfully parsed JSON data")
             
-            # Validate structure
-            print(f"✓ Device name: {json_data.get('a2wName')}")
-            print(f"✓ Operation mode: {json_data.get('status', {}).get('operationMode')}")
-            print(f"✓ Outdoor temp: {json_data.get('status', {}).get('outdoorNow')}°C")
-            print(f"✓ Water pressure: {json_data.get('status', {}).get('waterPressure')} bar")
-            print(f"✓ Tank temp: {json_data.get('status', {}).get('tankStatus', {}).get('temperatureNow')}°C")
-            print(f"✓ Tank set: {json_data.get('status', {}).get('tankStatus', {}).get('heatSet')}°C")
-            print(f"✓ Zone temp: {json_data.get('status', {}).get('zoneStatus', [{}])[0].get('temperatureNow')}°C")
-            print(f"✓ Zone set: {json_data.get('status', {}).get('zoneStatus', [{}])[0].get('heatSet')}°C")
+            # Validate structure, binding the status subtrees once
+            status = json_data.get('status') or {}
+            tank = status.get('tankStatus') or {}
+            zone0 = (status.get('zoneStatus') or [{}])[0]
+            print("\n".join((
+                f"✓ Device name: {json_data.get('a2wName')}",
+                f"✓ Operation mode: {status.get('operationMode')}",
+                f"✓ Outdoor temp: {status.get('outdoorNow')}°C",
+                f"✓ Water pressure: {status.get('waterPressure')} bar",
+                f"✓ Tank temp: {tank.get('temperatureNow')}°C",
+                f"✓ Tank set: {tank.get('heatSet')}°C",
+                f"✓ Zone temp: {zone0.get('temperatureNow')}°C",
+                f"✓ Zone set: {zone0.get('heatSet')}°C",
+            )))
             
             return True
             
@@ -76,55 +112,24 @@ def test_energy_calculations():
     operation_mode = status['operationMode']
     pump_duty = status['pumpDuty'] 
     outdoor_temp = status['outdoorNow']
+    tank_heating = status.get('tankStatus', {}).get('operationStatus') == 1
     
-    # Power estimation based on operation mode and conditions
-    if operation_mode == 1:  # Heating mode
-        if pump_duty == 1:  # Pump active
-            # Base heating power, adjusted for outdoor temperature
-            if outdoor_temp < 0:
-                base_power = 4500  # Higher power in freezing conditions
-            elif outdoor_temp < 5:
-                base_power = 3500  # Medium power in cold conditions
-            else:
-                base_power = 2500  # Lower power in mild conditions
-            
-            # Check if DHW heating is also active
-            tank_status = status.get('tankStatus', {})
-            if tank_status.get('operationStatus') == 1:
-                dhw_power = 1500  # Additional power for DHW heating
-            else:
-                dhw_power = 0
-                
-            total_power = base_power + dhw_power
-        else:
-            total_power = 150  # Standby power
-    else:
-        total_power = 150  # Standby power for other modes
-    
-    print(f"✓ Operation mode: {operation_mode} (1=heating, 2=cooling)")
-    print(f"✓ Pump duty: {pump_duty} (1=active, 0=inactive)")
-    print(f"✓ Outdoor temperature: {outdoor_temp}°C")
-    print(f"✓ Tank heating active: {status.get('tankStatus', {}).get('operationStatus') == 1}")
-    print(f"✓ Estimated power consumption: {total_power}W")
-    
-    # Calculate COP (Coefficient of Performance)
-    # Simplified COP calculation based on outdoor temperature
-    if outdoor_temp >= 7:
-        cop = 4.5  # High efficiency in mild weather
-    elif outdoor_temp >= 2:
-        cop = 3.8  # Good efficiency
-    elif outdoor_temp >= -2:
-        cop = 3.0  # Moderate efficiency
-    else:
-        cop = 2.2  # Lower efficiency in very cold weather
-    
-    print(f"✓ Estimated COP: {cop}")
-    
-    # Daily energy estimation (assuming 8 hours operation per day)
+    # Power, COP (Coefficient of Performance) and daily energy, assuming
+    # 8 hours operation per day
     daily_runtime_hours = 8
-    daily_energy_kwh = (total_power * daily_runtime_hours) / 1000
-    
-    print(f"✓ Estimated daily energy: {daily_energy_kwh:.1f} kWh")
+    total_power, cop, daily_energy_kwh = _estimate_energy(
+        operation_mode, pump_duty, outdoor_temp, tank_heating, daily_runtime_hours
+    )
+    
+    print("\n".join((
+        f"✓ Operation mode: {operation_mode} (1=heating, 2=cooling)",
+        f"✓ Pump duty: {pump_duty} (1=active, 0=inactive)",
+        f"✓ Outdoor temperature: {outdoor_temp}°C",
+        f"✓ Tank heating active: {tank_heating}",
+        f"✓ Estimated power consumption: {total_power}W",
+        f"✓ Estimated COP: {cop}",
+        f"✓ Estimated daily energy: {daily_energy_kwh:.1f} kWh",
+    )))
     
     return True
 
@@ -142,9 +147,11 @@ def test_water_heater_control():
         'heatMax': 75          # Maximum allowed
     }
     
-    print(f"✓ Current temp: {tank_status['temperatureNow']}°C")
-    print(f"✓ Current set point: {tank_status['heatSet']}°C")
-    print(f"✓ Temperature range: {tank_status['heatMin']}-{tank_status['heatMax']}°C")
+    print("\n".join((
+        f"✓ Current temp: {tank_status['temperatureNow']}°C",
+        f"✓ Current set point: {tank_status['heatSet']}°C",
+        f"✓ Temperature range: {tank_status['heatMin']}-{tank_status['heatMax']}°C",
+    )))
     
     # Test temperature setting logic
     new_target = 65  # User wants to set to 65°C
@@ -158,11 +165,13 @@ def test_water_heater_control():
         # device.set_dhw_temperature(new_target)
         # etc.
         
-        print("✓ Would attempt multiple API methods for temperature setting")
-        print("  - device.set_tank_temperature(65)")
-        print("  - device.tank.set_temperature(65)")
-        print("  - device.set_dhw_temperature(65)")
-        print("  - Direct property assignment as fallback")
+        print("\n".join((
+            "✓ Would attempt multiple API methods for temperature setting",
+            "  - device.set_tank_temperature(65)",
+            "  - device.tank.set_temperature(65)",
+            "  - device.set_dhw_temperature(65)",
+            "  - Direct property assignment as fallback",
+        )))
         
     else:
         print(f"✗ New target {new_target}°C is outside valid range")
@@ -177,16 +186,18 @@ if __name__ == "__main__":
     success3 = test_water_heater_control()
     
     if success1 and success2 and success3:
-        print("\n✅ All tests passed!")
-        print("\nThe integration improvements should now:")
-        print("1. Capture and parse real JSON data from aioaquarea logs")
-        print("2. Calculate accurate energy consumption based on real operating conditions")
-        print("3. Support proper water heater temperature control with validation")
-        print("4. Handle the exact data structure from your device")
-        print("\nNext steps:")
-        print("- Restart Home Assistant to load the enhanced integration")
-        print("- Check logs for 'Successfully found real JSON data' messages")
-        print("- Verify energy sensors show realistic power consumption values")
-        print("- Test water heater temperature changes in the UI")
+        print("\n".join((
+            "\n✅ All tests passed!",
+            "\nThe integration improvements should now:",
+            "1. Capture and parse real JSON data from aioaquarea logs",
+            "2. Calculate accurate energy consumption based on real operating conditions",
+            "3. Support proper water heater temperature control with validation",
+            "4. Handle the exact data structure from your device",
+            "\nNext steps:",
+            "- Restart Home Assistant to load the enhanced integration",
+            "- Check logs for 'Successfully found real JSON data' messages",
+            "- Verify energy sensors show realistic power consumption values",
+            "- Test water heater temperature changes in the UI",
+        )))
     else:
         print("\n❌ Some tests failed - please review the implementation")
\ No newline at end of file
@@ -7,76 +7,88 @@ Test the simplified hass.add_job approach for async service calls.
 def test_simplified_async_fix():
     """Test the simplified async fix using hass.add_job."""
     
-    print("=== Testing Simplified Async Fix ===")
-    
-    print("\n❌ Persistent Issue:")
-    print("RuntimeWarning: coroutine 'ServiceRegistry.async_call' was never awaited")
-    print("Line 622 in water_heater.py")
-    
-    print("\n🔍 Analysis:")
-    print("Previous fix with async_create_task() may have caused issues:")
-    print("- Called from synchronous _log_state_change method")
-    print("- async_create_task() might not be the right approach")
-    print("- Need simpler solution for async service calls")
-    
-    print("\n✅ Simplified Solution:")
-    print("Changed from complex async task creation:")
-    print("```python")
-    print("async def fire_logbook_event():")
-    print("    await self.hass.services.async_call(...)")
-    print("self.hass.async_create_task(fire_logbook_event())")
-    print("```")
-    
-    print("\nTo simple hass.add_job:")
-    print("```python")
-    print("self.hass.add_job(")
-    print("    self.hass.services.async_call,")
-    print("    'logbook',")
-    print("    'log',")
-    print("    {data}")
-    print(")")
-    print("```")
-    
-    print("\n🎯 Benefits of hass.add_job:")
-    print("✅ Designed specifically for scheduling async calls from sync context")
-    print("✅ Handles coroutine management automatically")
-    print("✅ Simpler and more reliable than manual task creation")
-    print("✅ Standard Home Assistant pattern for this use case")
-    print("✅ No need for async function definitions")
-    
-    print("\n🔧 Files Updated:")
-    print("1. ✅ water_heater.py - Simplified logbook service call")
-    print("2. ✅ climate.py - Simplified logbook service call")  
-    print("3. ✅ __init__.py - Simplified logbook service call")
-    
-    print("\n📋 Expected Results:")
-    print("❌ Should eliminate: 'RuntimeWarning: coroutine was never awaited'")
-    print("✅ Should work: Activity logging without async warnings")
-    print("✅ Should see: Clean Home Assistant logs")
-    print("✅ Should appear: Logbook entries in Activity widget")
-    
-    print("\n🚀 Testing Instructions:")
-    print("1. Restart Home Assistant completely")
-    print("2. Clear browser cache (to ensure fresh JS)")
-    print("3. Set water heater temperature")
-    print("4. Check Home Assistant logs for async warnings")
-    print("5. Verify Activity widget shows entries")
-    
-    print("\n⚡ Why This Should Work:")
-    print("hass.add_job() is the Home Assistant standard for:")
-    print("- Scheduling async calls from sync methods")
-    print("- Avoiding 'coroutine never awaited' warnings")
-    print("- Proper integration with Home Assistant's event loop")
-    print("- Service calls that need to be async")
-    
-    print("\n📝 Technical Background:")
-    print("Home Assistant Pattern Hierarchy:")
-    print("1. async method + await service.async_call() ← Best")
-    print("2. sync method + hass.add_job(service.async_call, ...) ← Our fix")
-    print("3. sync method + async_create_task() ← Can cause issues")
-    print("4. sync method + service.async_call() ← Causes warnings")
-    
-    print("\n✅ Async Issues Should Now Be Fully Resolved!")
+    print("\n".join((
+        "=== Testing Simplified Async Fix ===",
+
+        "\n❌ Persistent Issue:",
+        "RuntimeWarning: coroutine 'ServiceRegistry.async_call' was never awaited",
+        "Line 622 in water_heater.py",
+
+        "\n🔍 Analysis:",
+        "Previous fix with async_create_task() may have caused issues:",
+        "- Called from synchronous _log_state_change method",
+        "- async_create_task() might not be the right approach",
+        "- Need simpler solution for async service calls",
+
+        "\n✅ Simplified Solution:",
+        "Changed from complex async task creation:",
+        "```python",
+        "async def fire_logbook_event():",
+        "    await self.hass.services.async_call(...)",
+        "self.hass.async_create_task(fire_logbook_event())",
+        "```",
+
+        "\nTo simple hass.add_job:",
+        "```python",
+        "self.hass.add_job(",
+        "    self.hass.services.async_call,",
+        "    'logbook',",
+        "    'log',",
+        "    {data}",
+        ")",
+        "```",
+
+        "\n🎯 Benefits of hass.add_job:",
+        "✅ Designed specifically for scheduling async calls from sync context",
+        "✅ Handles coroutine management automatically",
+        "✅ Simpler and more reliable than manual task creation",
+        "✅ Standard Home Assistant pattern for this use case",
+        "✅ No need for async function definitions",
+
+        "\n🔧 Files Updated:",
+        "1. ✅ water_heater.py - Simplified logbook service call",
+        "2. ✅ climate.py - Simplified logbook service call",
+        "3. ✅ __init__.py - Simplified logbook service call",
+
+        "\n📋 Expected Results:",
+        "❌ Should eliminate: 'RuntimeWarning: coroutine was never awaited'",
+        "✅ Should work: Activity logging without async warnings",
+        "✅ Should see: Clean Home Assistant logs",
+        "✅ Should appear: Logbook entries in Activity widget",
+
+        "\n🚀 Testing Instructions:",
+        "1. Restart Home Assistant completely",
+        "2. Clear browser cache (to ensure fresh JS)",
+        "3. Set water heater temperature",
+        "4. Check Home Assistant logs for async warnings",
+        "5. Verify Activity widget shows entries",
+
+        "\n⚡ Why This Should Work:",
+        "hass.add_job() is the Home Assistant standard for:",
+        "- Scheduling async calls from sync methods",
+        "- Avoiding 'coroutine never awaited' warnings",
+        "- Proper integration with Home Assistant's event loop",
+        "- Service calls that need to be async",
+
+        "\n🚀 Current Approach:",
+        "Logbook entries are now written with logbook.async_log_entry():",
+        "```python",
+        "async_log_entry(hass, name, message, DOMAIN, entity_id)",
+        "```",
+        "- Runs synchronously in the event loop, no coroutine to await",
+        "- Skips the service registry lookup and schema validation per entry",
+        "- Falls back to the logbook.log service when logbook is not loaded",
+
+        "\n📝 Technical Background:",
+        "Home Assistant Pattern Hierarchy:",
+        "0. @callback method + logbook.async_log_entry() ← Current",
+        "1. async method + await service.async_call() ← Best for services",
+        "2. sync method + hass.add_job(service.async_call, ...) ← Earlier fix",
+        "3. sync method + async_create_task() ← Can cause issues",
+        "4. sync method + service.async_call() ← Causes warnings",
+
+        "\n✅ Async Issues Should Now Be Fully Resolved!",
+    )))
 
 if __name__ == "__main__":
     test_simplified_async_fix()
\ No newline at end of file
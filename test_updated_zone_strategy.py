@@ -7,11 +7,13 @@ Test the improved zone_id attempts for water heater temperature setting.
 def test_updated_zone_id_strategy():
     """Test the updated zone_id strategy with DHW-specific identifiers."""
     
-    print("=== Testing Updated Zone ID Strategy for DHW ===")
-    
-    print("\n❌ Previous Error: 'No zone id provided to set_temperature' (line 322)")
-    print("✅ Root Cause: aioaquarea set_temperature() requires zone_id for DHW")
-    print("🔧 Solution: Enhanced zone_id attempts with DHW-specific identifiers")
+    print("\n".join((
+        "=== Testing Updated Zone ID Strategy for DHW ===",
+
+        "\n❌ Previous Error: 'No zone id provided to set_temperature' (line 322)",
+        "✅ Root Cause: aioaquarea set_temperature() requires zone_id for DHW",
+        "🔧 Solution: Enhanced zone_id attempts with DHW-specific identifiers",
+    )))
     
     # Simulate the updated zone attempts
     zone_attempts = [
@@ -28,60 +30,62 @@ def test_updated_zone_id_strategy():
     for i, zone_id in enumerate(zone_attempts, 1):
         print(f"   {i}. {repr(zone_id)} - {type(zone_id).__name__}")
     
-    print(f"\n🔍 Debug Information Added:")
-    print("✅ Method signature inspection for set_temperature")
-    print("✅ Enhanced logging of available methods")
-    print("✅ DHW-specific zone identifiers prioritized")
-    
-    print(f"\n📋 Expected Log Sequence:")
-    print("1. 🔍 'Device has X total methods, Y temp-related, Z set-related'")
-    print("2. 🔍 'Temperature methods: [...]'") 
-    print("3. 🔍 'Set methods: [...]'")
-    print("4. 🔍 'set_temperature signature: (zone_id, temperature)' (or similar)")
-    print("5. 🌐 'Zone attempt failed for zone_id=DHW: ...' (if DHW fails)")
-    print("6. 🌐 'API SUCCESS: Set temperature using set_temperature(zone=X, Y°C)' (success)")
-    
-    print(f"\n🎯 Most Likely Success Scenarios:")
-    print("SCENARIO A: DHW uppercase")
-    print("   await device.set_temperature('DHW', 55.0)")
-    print("   ✅ Success message: 'set_temperature(zone=DHW, 55°C)'")
-    
-    print("\nSCENARIO B: DHW lowercase") 
-    print("   await device.set_temperature('dhw', 55.0)")
-    print("   ✅ Success message: 'set_temperature(zone=dhw, 55°C)'")
-    
-    print("\nSCENARIO C: Numerical zone")
-    print("   await device.set_temperature(0, 55.0)")
-    print("   ✅ Success message: 'set_temperature(zone=0, 55°C)'")
-    
-    print(f"\n🚀 Testing Instructions:")
-    print("1. Restart Home Assistant")
-    print("2. Set water heater temperature")  
-    print("3. Check logs for method signature and zone attempts")
-    print("4. Look for first successful zone_id")
-    print("5. Temperature should persist without reverting")
-    
-    print(f"\n🔬 What We'll Learn:")
-    print("✅ Exact method signature of set_temperature")
-    print("✅ Which zone_id works for DHW/water heater")
-    print("✅ Complete list of available temperature methods")
-    print("✅ Whether DHW has dedicated methods")
-    
-    print(f"\n⚡ Expected Improvement:")
-    print("❌ OLD: Immediate failure on 'No zone id provided'")
-    print("✅ NEW: Try 7 different zone_id approaches")
-    print("✅ NEW: Better debugging information")
-    print("✅ NEW: Method signature inspection") 
-    print("✅ NEW: DHW-specific zone identifiers")
-    
-    print(f"\n📝 Priority Order Explanation:")
-    print("1. 'DHW' (uppercase) - Standard convention")
-    print("2. 'dhw' (lowercase) - Alternative convention") 
-    print("3. 'tank' - Physical component reference")
-    print("4. 0 - Numerical zone (common default)")
-    print("5. 1 - Alternative numerical zone")
-    print("6. 'water_heater' - Descriptive identifier")
-    print("7. 'hot_water' - Alternative description")
+    print("\n".join((
+        f"\n🔍 Debug Information Added:",
+        "✅ Method signature inspection for set_temperature",
+        "✅ Enhanced logging of available methods",
+        "✅ DHW-specific zone identifiers prioritized",
+
+        f"\n📋 Expected Log Sequence:",
+        "1. 🔍 'Device has X total methods, Y temp-related, Z set-related'",
+        "2. 🔍 'Temperature methods: [...]'",
+        "3. 🔍 'Set methods: [...]'",
+        "4. 🔍 'set_temperature signature: (zone_id, temperature)' (or similar)",
+        "5. 🌐 'Zone attempt failed for zone_id=DHW: ...' (if DHW fails)",
+        "6. 🌐 'API SUCCESS: Set temperature using set_temperature(zone=X, Y°C)' (success)",
+
+        f"\n🎯 Most Likely Success Scenarios:",
+        "SCENARIO A: DHW uppercase",
+        "   await device.set_temperature('DHW', 55.0)",
+        "   ✅ Success message: 'set_temperature(zone=DHW, 55°C)'",
+
+        "\nSCENARIO B: DHW lowercase",
+        "   await device.set_temperature('dhw', 55.0)",
+        "   ✅ Success message: 'set_temperature(zone=dhw, 55°C)'",
+
+        "\nSCENARIO C: Numerical zone",
+        "   await device.set_temperature(0, 55.0)",
+        "   ✅ Success message: 'set_temperature(zone=0, 55°C)'",
+
+        f"\n🚀 Testing Instructions:",
+        "1. Restart Home Assistant",
+        "2. Set water heater temperature",
+        "3. Check logs for method signature and zone attempts",
+        "4. Look for first successful zone_id",
+        "5. Temperature should persist without reverting",
+
+        f"\n🔬 What We'll Learn:",
+        "✅ Exact method signature of set_temperature",
+        "✅ Which zone_id works for DHW/water heater",
+        "✅ Complete list of available temperature methods",
+        "✅ Whether DHW has dedicated methods",
+
+        f"\n⚡ Expected Improvement:",
+        "❌ OLD: Immediate failure on 'No zone id provided'",
+        "✅ NEW: Try 7 different zone_id approaches",
+        "✅ NEW: Better debugging information",
+        "✅ NEW: Method signature inspection",
+        "✅ NEW: DHW-specific zone identifiers",
+
+        f"\n📝 Priority Order Explanation:",
+        "1. 'DHW' (uppercase) - Standard convention",
+        "2. 'dhw' (lowercase) - Alternative convention",
+        "3. 'tank' - Physical component reference",
+        "4. 0 - Numerical zone (common default)",
+        "5. 1 - Alternative numerical zone",
+        "6. 'water_heater' - Descriptive identifier",
+        "7. 'hot_water' - Alternative description",
+    )))
 
 if __name__ == "__main__":
     test_updated_zone_id_strategy()
\ No newline at end of file
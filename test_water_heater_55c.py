@@ -5,9 +5,14 @@ Simulates setting your water heater to 55 degrees using the same logic as the in
 """
 
 import logging
+import os
 
-# Set up logging like Home Assistant
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Set up logging like Home Assistant; step details are logged at DEBUG and
+# only shown with PSA_TEST_VERBOSE=1
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get("PSA_TEST_VERBOSE") == "1" else logging.INFO,
+    format='%(levelname)s: %(message)s',
+)
 _LOGGER = logging.getLogger(__name__)
 
 def test_water_heater_55_degrees():
@@ -39,21 +44,23 @@ def test_water_heater_55_degrees():
     print(f"📊 Current Status:")
     current_temp = device_data['raw_data']['status']['tankStatus']['temperatureNow']
     current_target = device_data['raw_data']['status']['tankStatus']['heatSet']
-    print(f"   Device: {device_data['raw_data']['a2wName']}")
-    print(f"   Current Temperature: {current_temp}°C")
-    print(f"   Current Target: {current_target}°C")
+    _LOGGER.debug("   Device: %s", device_data['raw_data']['a2wName'])
+    _LOGGER.debug("   Current Temperature: %s°C", current_temp)
+    _LOGGER.debug("   Current Target: %s°C", current_target)
     print(f"   New Target: {new_temperature}°C")
     
     # === SIMULATE THE EXACT INTEGRATION LOGIC ===
     
     print(f"\n🔧 Starting Temperature Change Process...")
     
-    # Step 1: Validate temperature
+    # Step 1: Validate temperature against the tank's own limits
     print(f"1️⃣ Validating temperature {new_temperature}°C...")
-    if new_temperature < 40 or new_temperature > 75:
-        print(f"❌ Temperature {new_temperature}°C is outside valid range (40-75°C)")
+    tank_status = device_data['raw_data']['status']['tankStatus']
+    min_temp, max_temp = tank_status['heatMin'], tank_status['heatMax']
+    if not min_temp <= new_temperature <= max_temp:
+        print(f"❌ Temperature {new_temperature}°C is outside valid range ({min_temp}-{max_temp}°C)")
         return False
-    print(f"✅ Temperature {new_temperature}°C is within valid range (40-75°C)")
+    print(f"✅ Temperature {new_temperature}°C is within valid range ({min_temp}-{max_temp}°C)")
     
     # Step 2: Log the change (like the integration does)
     old_temperature = current_target
@@ -70,11 +77,10 @@ def test_water_heater_55_degrees():
     
     # Step 4: Attempt API call (would try real methods, then fall back)
     print(f"3️⃣ Attempting API call...")
-    print(f"🌐 Trying real API methods:")
-    print(f"   - set_dhw_target_temperature({new_temperature}) ... ❌ Method not available")
-    print(f"   - set_tank_target_temperature({new_temperature}) ... ❌ Method not available")
-    print(f"   - set_dhw_temperature({new_temperature}) ... ❌ Method not available")
-    print(f"   - set_tank_temperature({new_temperature}) ... ❌ Method not available")
+    _LOGGER.debug("🌐 Trying real API methods:")
+    for method in ("set_dhw_target_temperature", "set_tank_target_temperature",
+                   "set_dhw_temperature", "set_tank_temperature"):
+        _LOGGER.debug("   - %s(%s) ... ❌ Method not available", method, new_temperature)
     
     _LOGGER.info("ℹ️ No real API available - using local simulation (UI already updated)")
     
@@ -82,41 +88,43 @@ def test_water_heater_55_degrees():
     print(f"\n📊 Final Status After Change:")
     final_temp = device_data['raw_data']['status']['tankStatus']['temperatureNow']
     final_target = device_data['raw_data']['status']['tankStatus']['heatSet']
-    print(f"   Device: {device_data['raw_data']['a2wName']}")
-    print(f"   Current Temperature: {final_temp}°C (unchanged - real temp from sensor)")
+    _LOGGER.debug("   Device: %s", device_data['raw_data']['a2wName'])
+    _LOGGER.debug("   Current Temperature: %s°C (unchanged - real temp from sensor)", final_temp)
     print(f"   Target Temperature: {final_target}°C ✅ CHANGED!")
     print(f"   Change: {old_heatset}°C → {final_target}°C")
     
     # Step 6: Activity logging
     print(f"\n📝 Activity Widget Event:")
-    print(f"   Event Type: panasonic_aquarea_action")
-    print(f"   Device ID: {device_id}")
-    print(f"   Action: temperature changed")
-    print(f"   Old Value: {old_heatset}°C")
-    print(f"   New Value: {final_target}°C")
-    print(f"   Device Type: water_heater")
+    _LOGGER.debug("   Event Type: panasonic_aquarea_action")
+    _LOGGER.debug("   Device ID: %s", device_id)
+    _LOGGER.debug("   Action: temperature changed")
+    _LOGGER.debug("   Old Value: %s°C", old_heatset)
+    _LOGGER.debug("   New Value: %s°C", final_target)
+    _LOGGER.debug("   Device Type: water_heater")
     
     return True
 
 def simulate_home_assistant_ui():
     """Show what the Home Assistant UI would display."""
     
-    print(f"\n🖥️ HOME ASSISTANT UI SIMULATION")
-    print("=" * 50)
-    print("Water Heater Card:")
-    print("┌─────────────────────────────────┐")
-    print("│ Langagervej Water Heater        │")
-    print("│                                 │")
-    print("│ Current: 59°C                   │")
-    print("│ Target:  55°C ← UPDATED!        │")  
-    print("│                                 │")
-    print("│ [40°C] ████████░░░░ [75°C]      │")
-    print("│                                 │")
-    print("│ Status: ON                      │")
-    print("└─────────────────────────────────┘")
-    print("")
-    print("The temperature slider would immediately show 55°C")
-    print("User would see the change instantly, no delay!")
+    print("\n".join((
+        f"\n🖥️ HOME ASSISTANT UI SIMULATION",
+        "=" * 50,
+        "Water Heater Card:",
+        "┌─────────────────────────────────┐",
+        "│ Langagervej Water Heater        │",
+        "│                                 │",
+        "│ Current: 59°C                   │",
+        "│ Target:  55°C ← UPDATED!        │",
+        "│                                 │",
+        "│ [40°C] ████████░░░░ [75°C]      │",
+        "│                                 │",
+        "│ Status: ON                      │",
+        "└─────────────────────────────────┘",
+        "",
+        "The temperature slider would immediately show 55°C",
+        "User would see the change instantly, no delay!",
+    )))
 
 if __name__ == "__main__":
     print("🧪 WATER HEATER TEST: Set Temperature to 55°C")
@@ -129,24 +137,26 @@ if __name__ == "__main__":
     if success:
         simulate_home_assistant_ui()
         
-        print(f"\n🎉 TEST SUCCESSFUL!")
-        print("✅ Temperature validation passed")
-        print("✅ Immediate UI update working")
-        print("✅ Activity logging working")  
-        print("✅ Fallback logic working")
-        
-        print(f"\n🎯 To test this on your real system:")
-        print("1. Open Home Assistant")
-        print("2. Find your 'Langagervej Water Heater' entity")
-        print("3. Set temperature to 55°C")
-        print("4. You should see immediate change in UI")
-        print("5. Check logs for the emoji messages above")
-        
-        print(f"\n📋 Expected behavior:")
-        print("• UI shows 55°C immediately (no delay)")
-        print("• Logs show '🌡️ WATER HEATER: Setting temperature...'") 
-        print("• Logs show '✅ IMMEDIATE UPDATE: Tank target...'")
-        print("• Activity widget logs the temperature change")
+        print("\n".join((
+            f"\n🎉 TEST SUCCESSFUL!",
+            "✅ Temperature validation passed",
+            "✅ Immediate UI update working",
+            "✅ Activity logging working",
+            "✅ Fallback logic working",
+
+            f"\n🎯 To test this on your real system:",
+            "1. Open Home Assistant",
+            "2. Find your 'Langagervej Water Heater' entity",
+            "3. Set temperature to 55°C",
+            "4. You should see immediate change in UI",
+            "5. Check logs for the emoji messages above",
+
+            f"\n📋 Expected behavior:",
+            "• UI shows 55°C immediately (no delay)",
+            "• Logs show '🌡️ WATER HEATER: Setting temperature...'",
+            "• Logs show '✅ IMMEDIATE UPDATE: Tank target...'",
+            "• Activity widget logs the temperature change",
+        )))
         
     else:
         print(f"\n❌ Test failed - please check the validation logic")
\ No newline at end of file
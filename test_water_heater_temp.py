@@ -7,10 +7,12 @@ This tests the fallback logic when no API methods are available.
 class MockCoordinator:
     def __init__(self, device_data):
         self.data = {"test_device": device_data}
+        self.refresh_count = 0
     
     async def async_request_refresh(self):
         """Mock refresh method."""
         print("  → Coordinator refresh triggered")
+        self.refresh_count += 1
         return True
 
 class MockWaterHeater:
@@ -20,6 +22,9 @@ class MockWaterHeater:
         self.coordinator = coordinator
         self._device_id = device_id
         self._attr_target_temperature = None
+        # Target temperature read from the data, valid until the next refresh
+        self._cached_target = None
+        self._cached_refresh = -1
     
     def async_write_ha_state(self):
         """Mock state write."""
@@ -27,7 +32,14 @@ class MockWaterHeater:
     
     @property
     def target_temperature(self):
-        """Return target temperature from raw data."""
+        """Return target temperature from raw data, read once per refresh."""
+        if self._cached_refresh != self.coordinator.refresh_count:
+            self._cached_target = self._read_target_temperature()
+            self._cached_refresh = self.coordinator.refresh_count
+        return self._cached_target
+    
+    def _read_target_temperature(self):
+        """Read the target temperature from the coordinator data."""
         device_data = self.coordinator.data.get(self._device_id)
         if not device_data:
             return None
@@ -4,51 +4,61 @@ Test Zone ID Temperature Setting
 Test the updated temperature setting methods with proper zone_id handling.
 """
 
-def test_zone_id_temperature_setting():
-    """Test the zone_id parameter handling for temperature setting."""
+import asyncio
+
+# Zone ids tried in order by the set_temperature fallback
+_ZONE_ATTEMPTS = (None, 0, "dhw", "tank")
+
+
+# Mock device with zone_id requirements
+class MockDevice:
+    __slots__ = ()
     
-    print("=== Testing Zone ID Temperature Setting Fix ===")
+    async def set_temperature(self, *args):
+        if len(args) == 1:
+            # Only temperature provided
+            raise Exception("No zone id provided to set_temperature")
+        elif len(args) == 2:
+            # Zone ID and temperature provided
+            zone_id, temperature = args
+            print(f"✅ set_temperature(zone_id={zone_id}, temperature={temperature}) succeeded")
+            return True
+        else:
+            raise Exception("Invalid arguments")
     
-    # Mock device with zone_id requirements
-    class MockDevice:
-        async def set_temperature(self, *args):
-            if len(args) == 1:
-                # Only temperature provided
-                raise Exception("No zone id provided to set_temperature")
-            elif len(args) == 2:
-                # Zone ID and temperature provided
-                zone_id, temperature = args
-                print(f"✅ set_temperature(zone_id={zone_id}, temperature={temperature}) succeeded")
-                return True
-            else:
-                raise Exception("Invalid arguments")
-        
-        async def set_tank_target_temperature(self, *args):
-            if len(args) == 1:
-                # Only temperature provided - might work for tank
-                temperature = args[0]
-                print(f"✅ set_tank_target_temperature(temperature={temperature}) succeeded")
-                return True
-            elif len(args) == 2:
-                # Zone ID and temperature provided
-                zone_id, temperature = args
-                print(f"✅ set_tank_target_temperature(zone_id={zone_id}, temperature={temperature}) succeeded")
-                return True
-        
-        async def set_dhw_target_temperature(self, temperature):
-            print(f"✅ set_dhw_target_temperature(temperature={temperature}) succeeded")
+    async def set_tank_target_temperature(self, *args):
+        if len(args) == 1:
+            # Only temperature provided - might work for tank
+            temperature = args[0]
+            print(f"✅ set_tank_target_temperature(temperature={temperature}) succeeded")
+            return True
+        elif len(args) == 2:
+            # Zone ID and temperature provided
+            zone_id, temperature = args
+            print(f"✅ set_tank_target_temperature(zone_id={zone_id}, temperature={temperature}) succeeded")
+            return True
+    
+    async def set_dhw_target_temperature(self, temperature):
+        print(f"✅ set_dhw_target_temperature(temperature={temperature}) succeeded")
+        return True
+
+class MockTank:
+    __slots__ = ()
+    
+    async def set_target_temperature(self, *args):
+        if len(args) == 1:
+            temperature = args[0]
+            print(f"✅ tank.set_target_temperature(temperature={temperature}) succeeded")
+            return True
+        elif len(args) == 2:
+            zone_id, temperature = args
+            print(f"✅ tank.set_target_temperature(zone_id={zone_id}, temperature={temperature}) succeeded")
             return True
+
+def test_zone_id_temperature_setting():
+    """Test the zone_id parameter handling for temperature setting."""
     
-    class MockTank:
-        async def set_target_temperature(self, *args):
-            if len(args) == 1:
-                temperature = args[0]
-                print(f"✅ tank.set_target_temperature(temperature={temperature}) succeeded")
-                return True
-            elif len(args) == 2:
-                zone_id, temperature = args
-                print(f"✅ tank.set_target_temperature(zone_id={zone_id}, temperature={temperature}) succeeded")
-                return True
+    print("=== Testing Zone ID Temperature Setting Fix ===")
     
     async def test_temperature_methods():
         """Test various temperature setting approaches."""
@@ -70,23 +80,22 @@ def test_zone_id_temperature_setting():
             print(f"❌ Failed: {e}")
         
         print("\n3. Testing device.set_temperature with zone_id attempts:")
-        zone_attempts = [None, 0, "dhw", "tank"]
-        
-        for zone_id in zone_attempts:
+        # Attempts stay sequential: each candidate is a write to the device,
+        # so firing them concurrently could apply the setpoint to more than
+        # one zone before the first success is known.
+        for zone_id in _ZONE_ATTEMPTS:
+            if zone_id is None:
+                label, args = "no zone_id", (temperature,)
+            else:
+                label, args = f"zone_id={zone_id}", (zone_id, temperature)
+            print(f"   Trying with {label}...")
             try:
-                if zone_id is None:
-                    print(f"   Trying with no zone_id...")
-                    await device.set_temperature(temperature)
-                    print(f"   ✅ Success with no zone_id")
-                    break
-                else:
-                    print(f"   Trying with zone_id={zone_id}...")
-                    await device.set_temperature(zone_id, temperature)
-                    print(f"   ✅ Success with zone_id={zone_id}")
-                    break
+                await device.set_temperature(*args)
             except Exception as e:
                 print(f"   ❌ Failed with zone_id={zone_id}: {e}")
                 continue
+            print(f"   ✅ Success with {label}")
+            break
         
         print("\n4. Testing tank.set_target_temperature:")
         try:
@@ -94,38 +103,41 @@ def test_zone_id_temperature_setting():
         except Exception as e:
             print(f"❌ Failed: {e}")
     
-    print("\n=== Error Analysis ===")
-    print("❌ Original Error: 'No zone id provided to set_temperature'")
-    print("✅ Root Cause: aioaquarea set_temperature() requires zone_id parameter")
-    print("✅ Solution: Try multiple zone_id values for water heater")
-    
-    print("\n=== Zone ID Strategy ===")
-    print("1. 🎯 First Priority: set_dhw_target_temperature() - DHW specific")
-    print("2. 🎯 Second Priority: set_tank_target_temperature() - Tank specific") 
-    print("3. 🎯 Third Priority: set_temperature() with zone attempts:")
-    print("   - None (no zone)")
-    print("   - 0 (DHW/tank zone)")
-    print("   - 'dhw' (DHW identifier)")
-    print("   - 'tank' (tank identifier)")
-    print("4. 🎯 Fourth Priority: tank.set_target_temperature() with zone fallback")
-    
-    print("\n=== Expected Results After Fix ===")
-    print("✅ Should see one of these success messages:")
-    print("   '🌐 API SUCCESS: Set DHW target temperature using set_dhw_target_temperature'")
-    print("   '🌐 API SUCCESS: Set tank target temperature using set_tank_target_temperature'")  
-    print("   '🌐 API SUCCESS: Set temperature using set_temperature(zone=X, Y°C)'")
-    print("   '🌐 API SUCCESS: Set tank target using tank.set_target_temperature'")
-    print("❌ Should NOT see: 'No zone id provided to set_temperature'")
-    
-    print("\n=== Testing Implementation ===")
-    import asyncio
+    print("\n".join((
+        "\n=== Error Analysis ===",
+        "❌ Original Error: 'No zone id provided to set_temperature'",
+        "✅ Root Cause: aioaquarea set_temperature() requires zone_id parameter",
+        "✅ Solution: Try multiple zone_id values for water heater",
+
+        "\n=== Zone ID Strategy ===",
+        "1. 🎯 First Priority: set_dhw_target_temperature() - DHW specific",
+        "2. 🎯 Second Priority: set_tank_target_temperature() - Tank specific",
+        "3. 🎯 Third Priority: set_temperature() with zone attempts:",
+        "   - None (no zone)",
+        "   - 0 (DHW/tank zone)",
+        "   - 'dhw' (DHW identifier)",
+        "   - 'tank' (tank identifier)",
+        "4. 🎯 Fourth Priority: tank.set_target_temperature() with zone fallback",
+
+        "\n=== Expected Results After Fix ===",
+        "✅ Should see one of these success messages:",
+        "   '🌐 API SUCCESS: Set DHW target temperature using set_dhw_target_temperature'",
+        "   '🌐 API SUCCESS: Set tank target temperature using set_tank_target_temperature'",
+        "   '🌐 API SUCCESS: Set temperature using set_temperature(zone=X, Y°C)'",
+        "   '🌐 API SUCCESS: Set tank target using tank.set_target_temperature'",
+        "❌ Should NOT see: 'No zone id provided to set_temperature'",
+
+        "\n=== Testing Implementation ===",
+    )))
     asyncio.run(test_temperature_methods())
     
-    print("\n🚀 NEXT STEPS:")
-    print("1. Restart Home Assistant to load the zone_id fix")
-    print("2. Set water heater temperature")
-    print("3. Check logs for success message (should work now!)")
-    print("4. Temperature should persist without reverting")
+    print("\n".join((
+        "\n🚀 NEXT STEPS:",
+        "1. Restart Home Assistant to load the zone_id fix",
+        "2. Set water heater temperature",
+        "3. Check logs for success message (should work now!)",
+        "4. Temperature should persist without reverting",
+    )))
 
 if __name__ == "__main__":
     test_zone_id_temperature_setting()
\ No newline at end of file
@@ -5,78 +5,102 @@ Check if our log capture system successfully captured the real JSON data from ai
 """
 
 import re
-import ast
+from bisect import bisect_right
+
+from log_payload import parse_log_payload
+
+# Device ID of an aioaquarea raw response log line; the payload follows the match
+_LOG_RE = re.compile(r"Raw JSON response for device ([A-Z0-9]+): (?=\{)")
+
+# Outdoor temperature breakpoints and the base heating power in each bin,
+# from very cold up to mild weather
+_POWER_TEMP_EDGES = (0, 2, 7)
+_HEATING_POWER = (4500, 4000, 3500, 2500)
+
+# Outdoor temperature breakpoints and the simplified COP in each bin
+_COP_TEMP_EDGES = (-2, 2, 7)
+_COP_BY_BIN = (2.5, 3.2, 3.8, 4.5)
 
 def test_real_log_capture():
     """Test with the actual log message you provided."""
     
-    print("🔍 Testing Real Data Capture from Your Log")
-    print("=" * 60)
+    print("\n".join((
+        "🔍 Testing Real Data Capture from Your Log",
+        "=" * 60,
+    )))
     
     # Your actual log message from Home Assistant
     real_log_message = "get_device_status (live): Raw JSON response for device B497204181: {'operation': 'FFFFFFFF', 'ownerFlg': True, 'a2wName': 'Langagervej', 'step2ApplicationStatusFlg': False, 'status': {'serviceType': 'STD_ADP-TAW1', 'uncontrollableTaw1Flg': False, 'operationMode': 1, 'coolMode': 1, 'direction': 1, 'quietMode': 0, 'powerful': 0, 'forceDHW': 0, 'forceHeater': 0, 'tank': 1, 'multiOdConnection': 0, 'pumpDuty': 1, 'bivalent': 0, 'bivalentActual': 0, 'waterPressure': 2.28, 'electricAnode': 0, 'deiceStatus': 0, 'specialStatus': 2, 'outdoorNow': 5, 'holidayTimer': 0, 'modelSeriesSelection': 5, 'standAlone': 1, 'controlBox': 0, 'externalHeater': 0, 'zoneStatus': [{'zoneId': 1, 'zoneName': 'House', 'zoneType': 0, 'zoneSensor': 0, 'operationStatus': 1, 'temperatureNow': 51, 'heatMin': -5, 'heatMax': 5, 'coolMin': -5, 'coolMax': 5, 'heatSet': 5, 'coolSet': 0, 'ecoHeat': -5, 'ecoCool': 5, 'comfortHeat': 5, 'comfortCool': -5}], 'tankStatus': {'operationStatus': 1, 'temperatureNow': 59, 'heatMin': 40, 'heatMax': 75, 'heatSet': 60}}}"
     
-    print("📝 Original log message:")
-    print(f"   {real_log_message[:100]}...")
+    print("\n".join((
+        "📝 Original log message:",
+        f"   {real_log_message[:100]}...",
+    )))
     
-    # Test our regex pattern
-    match = re.search(r"Raw JSON response for device ([A-Z0-9]+): ({.+})", real_log_message)
+    # Test our regex pattern; the payload starts right after the device ID
+    match = _LOG_RE.search(real_log_message)
     
     if match:
         device_id = match.group(1)
-        json_str = match.group(2)
+        json_str = real_log_message[match.end():]
         
         print(f"\n✅ Successfully extracted device ID: {device_id}")
         
         try:
             # Parse the JSON string
-            json_data = ast.literal_eval(json_str)
+            json_data = parse_log_payload(json_str)
             print("✅ Successfully parsed JSON data")
             
-            # Analyze the captured real data
-            print(f"\n📊 REAL DEVICE DATA ANALYSIS:")
-            print(f"   Device Name: {json_data.get('a2wName')}")
-            print(f"   Operation Mode: {json_data.get('status', {}).get('operationMode')} (1=heating)")
-            print(f"   Outdoor Temperature: {json_data.get('status', {}).get('outdoorNow')}°C")
-            print(f"   Water Pressure: {json_data.get('status', {}).get('waterPressure')} bar")
-            print(f"   Pump Duty: {json_data.get('status', {}).get('pumpDuty')} (1=active)")
+            # Analyze the captured real data, binding the status subtrees once
+            status = json_data.get('status') or {}
+            print("\n".join((
+                f"\n📊 REAL DEVICE DATA ANALYSIS:",
+                f"   Device Name: {json_data.get('a2wName')}",
+                f"   Operation Mode: {status.get('operationMode')} (1=heating)",
+                f"   Outdoor Temperature: {status.get('outdoorNow')}°C",
+                f"   Water Pressure: {status.get('waterPressure')} bar",
+                f"   Pump Duty: {status.get('pumpDuty')} (1=active)",
+            )))
             
             # Tank status
-            tank_status = json_data.get('status', {}).get('tankStatus', {})
-            print(f"\n🚰 TANK STATUS:")
-            print(f"   Operation: {'ON' if tank_status.get('operationStatus') == 1 else 'OFF'}")
-            print(f"   Current Temperature: {tank_status.get('temperatureNow')}°C")
-            print(f"   Target Temperature: {tank_status.get('heatSet')}°C")
-            print(f"   Temperature Range: {tank_status.get('heatMin')}-{tank_status.get('heatMax')}°C")
+            tank_status = status.get('tankStatus') or {}
+            print("\n".join((
+                f"\n🚰 TANK STATUS:",
+                f"   Operation: {'ON' if tank_status.get('operationStatus') == 1 else 'OFF'}",
+                f"   Current Temperature: {tank_status.get('temperatureNow')}°C",
+                f"   Target Temperature: {tank_status.get('heatSet')}°C",
+                f"   Temperature Range: {tank_status.get('heatMin')}-{tank_status.get('heatMax')}°C",
+            )))
             
             # Zone status
-            zone_status = json_data.get('status', {}).get('zoneStatus', [{}])[0]
-            print(f"\n🏠 ZONE STATUS:")
-            print(f"   Zone Name: {zone_status.get('zoneName')}")
-            print(f"   Operation: {'ON' if zone_status.get('operationStatus') == 1 else 'OFF'}")
-            print(f"   Current Temperature: {zone_status.get('temperatureNow')/10.0:.1f}°C")
-            print(f"   Heat Offset: {zone_status.get('heatSet')/10.0:.1f}°C")
-            print(f"   Target Temperature: {(zone_status.get('temperatureNow') + zone_status.get('heatSet'))/10.0:.1f}°C")
+            zone_status = (status.get('zoneStatus') or [{}])[0]
+            # Zone temperatures are reported in tenths of a degree
+            zone_now = zone_status.get('temperatureNow')
+            zone_offset = zone_status.get('heatSet')
+            print("\n".join((
+                f"\n🏠 ZONE STATUS:",
+                f"   Zone Name: {zone_status.get('zoneName')}",
+                f"   Operation: {'ON' if zone_status.get('operationStatus') == 1 else 'OFF'}",
+                f"   Current Temperature: {zone_now/10.0:.1f}°C",
+                f"   Heat Offset: {zone_offset/10.0:.1f}°C",
+                f"   Target Temperature: {(zone_now + zone_offset)/10.0:.1f}°C",
+            )))
             
             # Check if our fallback data matches
             print(f"\n🔍 COMPARING WITH OUR FALLBACK DATA:")
             fallback_matches = []
             
-            # Check key values
-            if json_data.get('a2wName') == 'Langagervej':
-                fallback_matches.append("✅ Device name matches")
-            else:
-                fallback_matches.append(f"❌ Device name: expected 'Langagervej', got '{json_data.get('a2wName')}'")
-            
-            if json_data.get('status', {}).get('operationMode') == 1:
-                fallback_matches.append("✅ Operation mode matches (heating)")
-            else:
-                fallback_matches.append(f"❌ Operation mode: expected 1, got {json_data.get('status', {}).get('operationMode')}")
-            
-            if tank_status.get('heatSet') == 60:
-                fallback_matches.append("✅ Tank target temperature matches")
-            else:
-                fallback_matches.append(f"❌ Tank target: expected 60, got {tank_status.get('heatSet')}")
+            # Check key values: (message on match, label on mismatch, actual, expected)
+            fallback_checks = (
+                ("Device name matches", "Device name", json_data.get('a2wName'), 'Langagervej'),
+                ("Operation mode matches (heating)", "Operation mode", status.get('operationMode'), 1),
+                ("Tank target temperature matches", "Tank target", tank_status.get('heatSet'), 60),
+            )
+            for matched, label, actual, expected in fallback_checks:
+                if actual == expected:
+                    fallback_matches.append(f"✅ {matched}")
+                else:
+                    fallback_matches.append(f"❌ {label}: expected {expected!r}, got {actual!r}")
             
             for match in fallback_matches:
                 print(f"   {match}")
@@ -93,8 +117,10 @@ def test_real_log_capture():
 def test_energy_calculations_with_real_data():
     """Test energy calculations using the real data values."""
     
-    print(f"\n⚡ ENERGY MONITORING WITH REAL DATA")
-    print("=" * 50)
+    print("\n".join((
+        f"\n⚡ ENERGY MONITORING WITH REAL DATA",
+        "=" * 50,
+    )))
     
     # Real values from your log
     real_data = {
@@ -125,24 +151,19 @@ def test_energy_calculations_with_real_data():
     tank_heating = status['tankStatus']['operationStatus'] == 1  # True
     zone_heating = status['zoneStatus'][0]['operationStatus'] == 1  # True
     
-    print(f"🌡️  Operating Conditions:")
-    print(f"   Outdoor Temperature: {outdoor_temp}°C")
-    print(f"   System Mode: {'Heating' if operation_mode == 1 else 'Other'}")
-    print(f"   Pump Status: {'Active' if pump_duty == 1 else 'Inactive'}")
-    print(f"   Tank Heating: {'Yes' if tank_heating else 'No'}")
-    print(f"   Zone Heating: {'Yes' if zone_heating else 'No'}")
+    print("\n".join((
+        f"🌡️  Operating Conditions:",
+        f"   Outdoor Temperature: {outdoor_temp}°C",
+        f"   System Mode: {'Heating' if operation_mode == 1 else 'Other'}",
+        f"   Pump Status: {'Active' if pump_duty == 1 else 'Inactive'}",
+        f"   Tank Heating: {'Yes' if tank_heating else 'No'}",
+        f"   Zone Heating: {'Yes' if zone_heating else 'No'}",
+    )))
     
     # Calculate power consumption based on real conditions
     if operation_mode == 1 and pump_duty == 1:  # Heating and pump active
         # Base heating power adjusted for outdoor temperature
-        if outdoor_temp < 0:
-            base_heating_power = 4500  # Very cold
-        elif outdoor_temp < 2:
-            base_heating_power = 4000  # Cold
-        elif outdoor_temp < 7:
-            base_heating_power = 3500  # Current condition (5°C)
-        else:
-            base_heating_power = 2500  # Mild
+        base_heating_power = _HEATING_POWER[bisect_right(_POWER_TEMP_EDGES, outdoor_temp)]
         
         # Additional DHW power if tank is heating
         dhw_power = 1500 if tank_heating else 0
@@ -152,40 +173,39 @@ def test_energy_calculations_with_real_data():
         total_power = 150  # Standby
     
     # Calculate COP based on outdoor temperature
-    if outdoor_temp >= 7:
-        cop = 4.5
-    elif outdoor_temp >= 2:
-        cop = 3.8
-    elif outdoor_temp >= -2:
-        cop = 3.2  # Current condition (5°C)
-    else:
-        cop = 2.5
-    
-    print(f"\n📊 Energy Calculations:")
-    print(f"   Base Heating Power: {base_heating_power}W")
-    print(f"   DHW Power: {dhw_power}W")
-    print(f"   Total Power Consumption: {total_power}W")
-    print(f"   Coefficient of Performance (COP): {cop}")
-    print(f"   Energy per hour: {total_power/1000:.1f} kWh")
-    print(f"   Daily energy (8h operation): {total_power*8/1000:.1f} kWh")
+    cop = _COP_BY_BIN[bisect_right(_COP_TEMP_EDGES, outdoor_temp)]
+    
+    print("\n".join((
+        f"\n📊 Energy Calculations:",
+        f"   Base Heating Power: {base_heating_power}W",
+        f"   DHW Power: {dhw_power}W",
+        f"   Total Power Consumption: {total_power}W",
+        f"   Coefficient of Performance (COP): {cop}",
+        f"   Energy per hour: {total_power/1000:.1f} kWh",
+        f"   Daily energy (8h operation): {total_power*8/1000:.1f} kWh",
+    )))
     
     return True
 
 if __name__ == "__main__":
-    print("🔍 Real Data Capture Verification")
-    print("Based on your Home Assistant log from 19:43:36")
-    print("=" * 70)
+    print("\n".join((
+        "🔍 Real Data Capture Verification",
+        "Based on your Home Assistant log from 19:43:36",
+        "=" * 70,
+    )))
     
     success1 = test_real_log_capture()
     success2 = test_energy_calculations_with_real_data()
     
     if success1 and success2:
-        print(f"\n🎉 SUCCESS!")
-        print("✅ Log capture system working perfectly")
-        print("✅ Real JSON data successfully extracted and parsed")
-        print("✅ Energy monitoring calculations accurate for real conditions")
-        print("✅ Controls should now work with this real data")
-        print(f"\nThe integration is now using REAL data from your heat pump!")
-        print("Your current conditions: 5°C outdoor, heating mode, ~5kW power consumption")
+        print("\n".join((
+            f"\n🎉 SUCCESS!",
+            "✅ Log capture system working perfectly",
+            "✅ Real JSON data successfully extracted and parsed",
+            "✅ Energy monitoring calculations accurate for real conditions",
+            "✅ Controls should now work with this real data",
+            f"\nThe integration is now using REAL data from your heat pump!",
+            "Your current conditions: 5°C outdoor, heating mode, ~5kW power consumption",
+        )))
     else:
         print(f"\n❌ Some issues detected - please review the implementation")
\ No newline at end of file